@@ -0,0 +1,698 @@
+"""Evaluation of classification bins and histograms of (very large) datasets."""
+
+import logging
+import copy
+from collections import OrderedDict
+from hashlib import blake2b
+
+import numpy as np
+from matplotlib.colors import ListedColormap, NoNorm
+
+from .helpers import register_modules
+
+_log = logging.getLogger(__name__)
+
+# schemes whose bins are evaluated from the (exact) min/max of the data
+_MINMAX_SCHEMES = ("EqualInterval",)
+
+# the max. sample size for schemes that are very slow for large datasets
+# (e.g. quadratic complexity or iterative optimization)
+_SAMPLE_SIZE_LIMITS = dict(
+    FisherJenks=10_000,
+    MaxP=1_000,
+    NaturalBreaks=100_000,
+    JenksCaspall=100_000,
+    JenksCaspallForced=100_000,
+)
+
+# the number of values that are processed at once when streaming the data
+_CHUNK_SIZE = 10_000_000
+
+# the number of histogram-bins used for the "histogram" sketch
+_SKETCH_NBINS = 2**16
+
+# the number of values used to evaluate the checksum of a dataset
+_FINGERPRINT_SIZE = 4096
+
+# a process-wide cache of evaluated classification bins
+# (fingerprint, scheme, kwargs, vmin, vmax, sample_size, sample_method): (bins, info)
+_cache = OrderedDict()
+_cache_size = 32
+
+
+def _get_valid(vals):
+    # get all values that are not masked or nan (as a 1D array)
+    vals = np.ma.compressed(vals)
+    return vals[~np.isnan(vals)]
+
+
+def _iter_chunks(z, chunk_size=_CHUNK_SIZE):
+    # iterate over the valid values of a 1D array in chunks
+    for i in range(0, z.size, chunk_size):
+        vals = _get_valid(z[i : i + chunk_size])
+        if vals.size > 0:
+            yield vals
+
+
+def _get_minmax(z, finite=False):
+    # get the min/max of the valid values (without copying the whole dataset)
+    # (if finite is True, infinite values are ignored as well)
+    vmin, vmax = np.inf, -np.inf
+    for vals in _iter_chunks(z):
+        if finite:
+            vals = vals[np.isfinite(vals)]
+            if vals.size == 0:
+                continue
+        vmin, vmax = min(vmin, vals.min()), max(vmax, vals.max())
+
+    if vmin > vmax:
+        return np.array([])
+    return np.array([vmin, vmax])
+
+
+def _get_random_sample(z, size, seed=0):
+    # a random sample of the values (without replacement)
+    rng = np.random.default_rng(seed)
+    idx = np.sort(rng.choice(z.size, size, replace=False))
+    return _get_valid(z[idx])
+
+
+def _get_stratified_sample(z, size, seed=0):
+    # a random value from each of "size" equally sized blocks of the (flattened)
+    # dataset (e.g. the sample covers all parts of the dataset)
+    rng = np.random.default_rng(seed)
+    edges = np.linspace(0, z.size, size + 1).astype(int)
+    idx = edges[:-1] + (rng.random(size) * np.diff(edges)).astype(int)
+    return _get_valid(z[idx])
+
+
+def _get_histogram_sketch(z, size, nbins=_SKETCH_NBINS):
+    # a streaming histogram-based sketch of the distribution of the values
+    # represented by "size" values evaluated from the inverse cumulative
+    # distribution function
+    minmax = _get_minmax(z)
+    if minmax.size == 0 or minmax[0] == minmax[1]:
+        return minmax[:1]
+
+    vmin, vmax = minmax
+
+    hist = np.zeros(nbins, dtype=np.int64)
+    for vals in _iter_chunks(z):
+        hist += np.histogram(vals, bins=nbins, range=(vmin, vmax))[0]
+
+    edges = np.linspace(vmin, vmax, nbins + 1)
+    cdf = np.cumsum(hist)
+
+    # interpolate the values linearly within the histogram-bins
+    q = (np.arange(size) + 0.5) / size * cdf[-1]
+    i = np.searchsorted(cdf, q, side="right")
+    start = cdf[i] - hist[i]
+    vals = edges[i] + (q - start) / hist[i] * (edges[i + 1] - edges[i])
+
+    # make sure the extremes are represented exactly
+    vals[0], vals[-1] = vmin, vmax
+    return vals
+
+
+_SAMPLE_METHODS = dict(
+    random=_get_random_sample,
+    stratified=_get_stratified_sample,
+    histogram=_get_histogram_sketch,
+)
+
+
+def get_classification_values(z_data, scheme, sample_size=None, sample_method="random"):
+    """
+    Get the values used to evaluate the bins of a classification.
+
+    Parameters
+    ----------
+    z_data : array-like or masked-array
+        The data-values. (masked values and nan-values are ignored)
+    scheme : str
+        The name of the classification scheme.
+    sample_size : int or None, optional
+        The max. number of values to use.
+        If None, all values are used (e.g. the exact classification).
+        The default is None.
+    sample_method : str, optional
+        The method used to evaluate the values if the dataset is larger than
+        the sample size.
+
+        - "random": a random sample of the data
+        - "stratified": a random value from equally sized blocks of the data
+        - "histogram": values derived from a streaming histogram of the data
+
+        The default is "random".
+
+    Returns
+    -------
+    values : np.ndarray
+        The values to classify.
+    info : dict
+        A dict with information on the values (e.g. the used method, the number of
+        values, the total number of values and an indicator if the classification
+        is exact).
+
+    """
+    z = np.ravel(z_data)
+    total = z.size
+
+    if scheme in _MINMAX_SCHEMES:
+        # only the exact min/max values are required
+        vals = _get_minmax(z)
+        return vals, dict(method="minmax", size=vals.size, total=total, exact=True)
+
+    if sample_size is not None:
+        sample_size = min(sample_size, _SAMPLE_SIZE_LIMITS.get(scheme, sample_size))
+
+    if sample_size is None or sample_method is None or total <= sample_size:
+        # use "np.ma.compressed" to make sure values excluded via
+        # masked-arrays are not used to evaluate classification levels
+        vals = _get_valid(z)
+        return vals, dict(method=None, size=vals.size, total=total, exact=True)
+
+    if sample_method not in _SAMPLE_METHODS:
+        raise ValueError(
+            f"EOmaps: '{sample_method}' is not a valid sample method... use one of "
+            + ", ".join(_SAMPLE_METHODS)
+        )
+
+    vals = _SAMPLE_METHODS[sample_method](z, sample_size)
+    return vals, dict(method=sample_method, size=vals.size, total=total, exact=False)
+
+
+def classify(z_data, scheme, sample_size=None, sample_method="random", **kwargs):
+    """
+    Evaluate the bins of a mapclassify classification scheme.
+
+    Parameters
+    ----------
+    z_data : array-like or masked-array
+        The data-values.
+    scheme : str
+        The name of the mapclassify classification scheme.
+    sample_size : int or None, optional
+        The max. number of values to use. The default is None.
+    sample_method : str, optional
+        The method used to evaluate the values if the dataset is larger than
+        the sample size. The default is "random".
+    kwargs :
+        Additional kwargs passed to the mapclassify classifier.
+
+    Returns
+    -------
+    bins : np.ndarray
+        The classification bins.
+    info : dict
+        Information on the values used to evaluate the bins.
+        (see `get_classification_values` for details)
+
+    """
+    (mapclassify,) = register_modules("mapclassify")
+
+    vals, info = get_classification_values(
+        z_data, scheme, sample_size=sample_size, sample_method=sample_method
+    )
+
+    if not info["exact"]:
+        _log.info(
+            f"EOmaps: Classification ({scheme}) evaluated from {info['size']} "
+            f"of {info['total']} values ({info['method']} sample)."
+        )
+
+    mapc = getattr(mapclassify, scheme)(vals, **kwargs)
+    return mapc.bins, info
+
+
+def _get_histogram_chunk(vals, bins, range, clip):
+    # get the histogram and the finite min/max of a chunk of values
+    # (nan-values and values outside the range are ignored by np.histogram)
+    counts, edges = np.histogram(vals, bins=bins, range=range)
+
+    if vals.size == 0:
+        return counts, edges, None
+
+    vmin, vmax = np.fmin.reduce(vals), np.fmax.reduce(vals)
+    if not (np.isfinite(vmin) and np.isfinite(vmax)):
+        vals = vals[np.isfinite(vals)]
+        if vals.size == 0:
+            return counts, edges, None
+        vmin, vmax = vals.min(), vals.max()
+
+    if clip:
+        if vmin < edges[0]:
+            counts[0] += np.count_nonzero(vals < edges[0])
+        if vmax > edges[-1]:
+            counts[-1] += np.count_nonzero(vals > edges[-1])
+
+    return counts, edges, (vmin, vmax)
+
+
+def get_histogram(
+    z_data,
+    bins,
+    range=None,
+    clip=False,
+    sample_size=None,
+    sample_method="random",
+    chunk_size=_CHUNK_SIZE,
+):
+    """
+    Get the histogram of a dataset (evaluated in chunks to avoid copies).
+
+    Parameters
+    ----------
+    z_data : array-like or masked-array
+        The data-values. (masked values and non-finite values are ignored)
+    bins : int or array-like
+        The number of bins or the bin-edges (see `np.histogram`).
+    range : tuple or None, optional
+        The (min, max) range of the bins. Values outside the range are ignored
+        (or clipped if `clip=True`). If None or if min/max is None, the range of
+        the data is used. The default is None.
+    clip : bool, optional
+        If True, values outside the range are counted in the first/last bin.
+        The default is False.
+    sample_size : int or None, optional
+        The max. number of values to use. If None, all values are used.
+        (the min/max of the data is always evaluated from all values)
+        The default is None.
+    sample_method : str, optional
+        The method used to sample the data. (see `get_classification_values`)
+        The default is "random".
+    chunk_size : int, optional
+        The number of values that are processed at once.
+        The default is 10000000.
+
+    Returns
+    -------
+    counts : np.ndarray
+        The number of values in each bin.
+    edges : np.ndarray
+        The bin-edges.
+    minmax : np.ndarray
+        The min/max of all (finite) values of the dataset (or an empty array
+        if there are no valid values).
+
+    """
+    z = np.ravel(z_data)
+
+    if range is None:
+        range = (None, None)
+
+    minmax = None
+    if np.ndim(bins) == 0 and (range[0] is None or range[1] is None):
+        # the range of the data is required to evaluate the bins
+        minmax = get_minmax(z)
+        if minmax.size > 0:
+            range = (
+                minmax[0] if range[0] is None else range[0],
+                minmax[1] if range[1] is None else range[1],
+            )
+        else:
+            range = (
+                0 if range[0] is None else range[0],
+                1 if range[1] is None else range[1],
+            )
+
+    if np.ndim(bins) != 0:
+        bins, range = np.asanyarray(bins, dtype=float), None
+
+    if sample_size is not None and z.size > sample_size:
+        if minmax is None:
+            minmax = get_minmax(z)
+        z = _SAMPLE_METHODS[sample_method](z, sample_size)
+
+    counts, edges, vmin, vmax = None, None, np.inf, -np.inf
+    for i in np.arange(0, max(z.size, 1), chunk_size):
+        vals = z[i : i + chunk_size]
+        if np.ma.isMaskedArray(vals):
+            vals = vals.compressed()
+
+        c, edges, chunk_minmax = _get_histogram_chunk(vals, bins, range, clip)
+        counts = c if counts is None else counts + c
+        if chunk_minmax is not None:
+            vmin, vmax = min(vmin, chunk_minmax[0]), max(vmax, chunk_minmax[1])
+
+    if minmax is None:
+        minmax = np.array([vmin, vmax]) if vmin <= vmax else np.array([])
+
+    return counts, edges, minmax
+
+
+def get_minmax(z_data):
+    """
+    Get the min/max of the finite values of a dataset (evaluated in chunks).
+
+    Parameters
+    ----------
+    z_data : array-like or masked-array
+        The data-values. (masked values and non-finite values are ignored)
+
+    Returns
+    -------
+    minmax : np.ndarray
+        The min/max values (or an empty array if there are no valid values).
+
+    """
+    return _get_minmax(np.ravel(z_data), finite=True)
+
+
+def get_class_histogram(indices, bins, chunk_size=_CHUNK_SIZE):
+    """
+    Get the histogram of class-indices (with values outside the bins clipped).
+
+    The result is identical to `get_histogram(z_data, bins, clip=True)` for
+    the data-values that correspond to the class-indices.
+
+    Parameters
+    ----------
+    indices : array-like or masked-array
+        The class-indices. (see `get_class_indices`)
+    bins : array-like
+        The classification bins.
+    chunk_size : int, optional
+        The number of values that are processed at once.
+        The default is 10000000.
+
+    Returns
+    -------
+    counts : np.ndarray
+        The number of values in each bin.
+    edges : np.ndarray
+        The bin-edges.
+
+    """
+    edges = np.asanyarray(bins, dtype=float)
+
+    indices = np.ravel(indices)
+
+    counts = np.zeros(edges.size + 1, dtype=np.int64)
+    for i in range(0, indices.size, chunk_size):
+        vals = np.ma.compressed(indices[i : i + chunk_size])
+        counts += np.bincount(vals, minlength=edges.size + 1)
+
+    # values below the first bin and above the last bin are clipped
+    # (note that the last bin is closed as for np.histogram)
+    counts[1] += counts[0]
+    counts[-2] += counts[-1]
+    return counts[1:-1], edges
+
+
+def _get_sum(z):
+    # get the sum and the number of the finite values of a 1D array
+    # (without copying the whole dataset)
+    total, count = 0.0, 0
+    for i in range(0, z.size, _CHUNK_SIZE):
+        chunk = z[i : i + _CHUNK_SIZE]
+        vals, mask = np.ma.getdata(chunk), np.ma.getmask(chunk)
+
+        valid = np.isfinite(vals)
+        if mask is not np.ma.nomask:
+            valid &= ~mask
+
+        total += np.sum(vals, where=valid, dtype=float)
+        count += np.count_nonzero(valid)
+
+    return total, count
+
+
+def get_fingerprint(z_data, n=_FINGERPRINT_SIZE):
+    """
+    Get a cheap fingerprint of a dataset.
+
+    The fingerprint consists of the shape, the dtype, the sum and the number
+    of all finite values (evaluated in chunks) and a checksum of n values (and
+    the mask) sampled at regular intervals from the data.
+
+    Note
+    ----
+    Changes of the data that keep the sum of all values and the sampled values
+    unchanged (e.g. swapping values at positions that are not sampled) are not
+    detected!
+
+    Parameters
+    ----------
+    z_data : array-like or masked-array
+        The data-values.
+    n : int, optional
+        The number of values used to evaluate the checksum.
+        The default is 4096.
+
+    Returns
+    -------
+    fingerprint : tuple
+        The fingerprint of the dataset.
+
+    """
+    shape = np.shape(z_data)
+    size = int(np.prod(shape))
+
+    # evaluate 2D indexes to avoid flattening (and copying) the data
+    idx = np.unravel_index(np.linspace(0, size - 1, min(n, size)).astype(int), shape)
+
+    h = blake2b(digest_size=16)
+    h.update(np.ascontiguousarray(np.ma.getdata(z_data)[idx]).tobytes())
+    mask = np.ma.getmask(z_data)
+    if mask is not np.ma.nomask:
+        h.update(np.ascontiguousarray(mask[idx]).tobytes())
+
+    return (
+        shape,
+        str(np.asanyarray(z_data).dtype),
+        _get_sum(np.ravel(z_data)),
+        h.hexdigest(),
+    )
+
+
+def _to_hashable(val):
+    # convert (nested) lists and arrays to tuples
+    if isinstance(val, (list, tuple, np.ndarray)):
+        return tuple(_to_hashable(i) for i in val)
+    return val
+
+
+def clear_cache():
+    """Clear the process-wide cache of classification bins."""
+    _cache.clear()
+
+
+def get_bins(
+    z_data,
+    scheme,
+    vmin,
+    vmax,
+    sample_size=None,
+    sample_method="random",
+    **kwargs,
+):
+    """
+    Get the bins of a classification (clipped to vmin/vmax).
+
+    Results are cached based on a fingerprint of the data, the scheme and its
+    arguments, vmin/vmax and the sample specifications.
+
+    Note
+    ----
+    The fingerprint of the data (see `get_fingerprint`) is evaluated from the
+    sum of all values and a checksum of a sample of the values. Changes of the
+    data that keep both unchanged (e.g. values that are swapped in-place)
+    return the cached bins of the original data!
+    Use `clear_cache()` to make sure the bins are re-evaluated.
+
+    Parameters
+    ----------
+    z_data : array-like or masked-array
+        The data-values.
+    scheme : str
+        The name of the mapclassify classification scheme.
+    vmin, vmax : float
+        The min/max values used to clip the bins.
+    sample_size : int or None, optional
+        The max. number of values to use. The default is None.
+    sample_method : str, optional
+        The method used to evaluate the values if the dataset is larger than
+        the sample size. The default is "random".
+    kwargs :
+        Additional kwargs passed to the mapclassify classifier.
+
+    Returns
+    -------
+    bins : array-like
+        The classification bins.
+    info : dict or None
+        Information on the values used to evaluate the bins.
+        (see `get_classification_values` for details)
+    hit : bool
+        Indicator if the bins were taken from the cache.
+
+    """
+    if scheme == "UserDefined":
+        bins, info = kwargs["bins"], None
+        fingerprint = None
+    else:
+        fingerprint = get_fingerprint(z_data)
+
+    key = (
+        fingerprint,
+        scheme,
+        tuple(sorted((k, _to_hashable(v)) for k, v in kwargs.items())),
+        vmin,
+        vmax,
+        sample_size,
+        sample_method,
+    )
+
+    try:
+        cached = _cache.get(key, None)
+    except TypeError:
+        # unhashable kwargs
+        key, cached = None, None
+
+    if cached is not None:
+        _cache.move_to_end(key)
+        bins, info = cached
+        return copy.copy(bins), info, True
+
+    if scheme != "UserDefined":
+        bins, info = classify(
+            z_data,
+            scheme,
+            sample_size=sample_size,
+            sample_method=sample_method,
+            **kwargs,
+        )
+
+    bins = np.unique(np.clip(bins, vmin, vmax))
+
+    if vmin < min(bins):
+        bins = [vmin, *bins]
+
+    if vmax > max(bins):
+        bins[np.argmax(bins)] = vmax
+
+    if key is not None:
+        _cache[key] = (copy.copy(bins), info)
+        while len(_cache) > _cache_size:
+            _cache.popitem(last=False)
+
+    return bins, info, False
+
+
+def _get_index_dtype(bins):
+    # the smallest unsigned integer dtype that can represent all class-indices
+    # (values below the first bin get the index 0, values above the last bin
+    # get the index len(bins))
+    return np.uint8 if len(bins) < 256 else np.uint16
+
+
+def get_class_indices(z_data, bins, chunk_size=_CHUNK_SIZE):
+    """
+    Encode data-values as (compact) class-indices.
+
+    The index of a value is identical to `np.digitize(value, bins)`.
+    Masked values and non-finite values are masked (a masked-array is only
+    returned if the data contains invalid values).
+
+    Parameters
+    ----------
+    z_data : array-like or masked-array
+        The data-values.
+    bins : array-like
+        The (monotonically increasing) classification bins.
+    chunk_size : int, optional
+        The (approx.) number of values that are processed at once.
+        The default is 10000000.
+
+    Returns
+    -------
+    indices : np.ndarray or np.ma.masked_array
+        The class-indices (with dtype uint8 or uint16).
+
+    """
+    bins = np.asanyarray(bins, dtype=float)
+    z = np.asanyarray(z_data)
+    data = np.ma.getdata(z)
+
+    indices = np.empty(z.shape, dtype=_get_index_dtype(bins))
+    if indices.ndim == 0:
+        indices[()] = np.searchsorted(bins, data, side="right")
+    else:
+        # process the data in chunks along the first axis
+        # (to avoid allocating a full int64 index array)
+        step = max(1, chunk_size // max(1, data[:1].size))
+        for i in range(0, data.shape[0], step):
+            indices[i : i + step] = np.searchsorted(
+                bins, data[i : i + step], side="right"
+            )
+
+    mask = np.ma.getmaskarray(z)
+    if np.issubdtype(data.dtype, np.floating):
+        # (non-finite values are masked as for matplotlib's colormapping)
+        mask = mask | ~np.isfinite(data)
+
+    if not mask.any():
+        return indices
+    return np.ma.masked_array(indices, mask, copy=False)
+
+
+def as_class_indices(a, bins):
+    """
+    Cast (aggregated or interpolated) class-indices to the compact dtype.
+
+    Parameters
+    ----------
+    a : array-like or masked-array
+        The class-indices.
+    bins : array-like
+        The classification bins.
+
+    Returns
+    -------
+    indices : np.ndarray or np.ma.masked_array
+        The class-indices (rounded to the nearest class).
+
+    """
+    dtype = _get_index_dtype(bins)
+    if np.asanyarray(a).dtype == dtype:
+        return a
+
+    a = np.ma.masked_invalid(a, copy=False)
+    indices = np.rint(a.filled(0)).astype(dtype)
+
+    mask = np.ma.getmaskarray(a)
+    if not mask.any():
+        return indices
+    return np.ma.masked_array(indices, mask, copy=False)
+
+
+def get_class_cmap(cmap, norm, bins):
+    """
+    Get a colormap that maps class-indices to the colors of the classes.
+
+    Parameters
+    ----------
+    cmap : matplotlib.colors.Colormap
+        The colormap used to color the classified data.
+    norm : matplotlib.colors.BoundaryNorm
+        The normalization of the classified data.
+    bins : array-like
+        The classification bins.
+
+    Returns
+    -------
+    cmap : matplotlib.colors.ListedColormap
+        A colormap with one color per class-index.
+    norm : matplotlib.colors.NoNorm
+        The normalization to use with the class-indices.
+
+    """
+    bins = np.asanyarray(bins, dtype=float)
+    # a representative value for each class-index
+    # (the lower boundary of the class, or a value below the first bin)
+    vals = np.concatenate(([np.nextafter(bins[0], -np.inf)], bins))
+
+    class_cmap = ListedColormap(cmap(norm(vals)), name=f"{cmap.name}_classes")
+    class_cmap.set_bad(cmap.get_bad())
+    return class_cmap, NoNorm()
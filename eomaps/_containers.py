@@ -222,6 +222,27 @@ class ClassifySpecs(object):
 
     SCHEMES : accessor Namespace for the available classification-schemes
 
+    Attributes
+    ----------
+    _sample_size : int or None
+        The max. number of values used to evaluate the classification bins.
+        (set via `m.set_classify_specs(..., sample_size=...)`)
+        The default is None
+    _sample_method : str
+        The method used to sample the data.
+        (set via `m.set_classify_specs(..., sample_method=...)`)
+        The default is "random"
+    _class_indices : bool
+        If True, classified datasets are drawn from a compact array of
+        class-indices (uint8 or uint16) instead of normalizing the data-values
+        on each draw. (only used for shapes that do not interpolate or average
+        the data, e.g. "ellipses", "rectangles", "geod_circles", "scatter_points",
+        "voronoi_diagram" and "raster")
+        Aggregated rasters only use class-indices if the aggregator preserves the
+        classes of the data ("first", "last", "min", "max" or "mode").
+        The data-values remain available for picking.
+        The default is False
+
     """
 
     def __init__(self, m):
@@ -231,6 +252,11 @@ class ClassifySpecs(object):
         self._m = m
         self.scheme = None
 
+        self._sample_size = None
+        self._sample_method = "random"
+        self._sample_info = None
+        self._class_indices = False
+
     def __repr__(self):
         txt = f"# scheme: {self.scheme}\n" + "\n".join(
             f"# {key}: {indent(fill(self[key].__repr__(), 60),  ' '*(len(key) + 4)).strip()}"
@@ -306,12 +332,17 @@ class ClassifySpecs(object):
             s = None
         return s
 
-    def _set_scheme_and_args(self, scheme, **kwargs):
+    def _set_scheme_and_args(
+        self, scheme, sample_size=None, sample_method="random", **kwargs
+    ):
         reset = False
         if len(self._keys) > 0:
             reset = True
             self._keys = set()
 
+        self._sample_size = sample_size
+        self._sample_method = sample_method
+
         self._scheme = scheme
         _ = self._get_default_args()
         for key, val in self._defaults.items():
@@ -328,6 +359,20 @@ class ClassifySpecs(object):
         if reset:
             _log.info(f"EOmaps: classification has been reset to '{scheme}{args}'")
 
+    @property
+    def sample_info(self):
+        """
+        Information on the values used to evaluate the last classification.
+
+        A dict with the following keys (or None if no classification was evaluated):
+
+        - method : the sample method (None if all values were used)
+        - size : the number of values used to evaluate the bins
+        - total : the total number of values
+        - exact : indicator if the classification is exact
+        """
+        return self._sample_info
+
     @property
     def SCHEMES(self):
         """
@@ -0,0 +1,216 @@
+"""Process-wide cache of metadata of coordinate reference systems."""
+
+from collections import OrderedDict
+
+from pyproj import CRS, Transformer
+
+
+class CRSRegistry:
+    """
+    A process-wide cache for metadata of coordinate reference systems.
+
+    Looking up CRS metadata (e.g. the area of use, the geodetic crs or transformers
+    between coordinate systems) requires queries to the PROJ database.
+    To avoid repeating those queries on each re-draw, the results are cached
+    once per process. (each cache keeps the most recently used values)
+
+    CRS objects are identified by their definition-string (e.g. `CRS.srs`) to avoid
+    (expensive) hashing and equality-checks of CRS objects.
+
+    Examples
+    --------
+    >>> from eomaps._crs_registry import crs_registry
+    >>> t = crs_registry.get_transformer(4326, 3857)
+    >>> bounds = crs_registry.get_clip_bounds(3857)
+
+    """
+
+    # the max. number of values stored in each cache
+    _cache_size = 32
+
+    def __init__(self):
+        self._crs = OrderedDict()
+        self._geodetic = OrderedDict()
+        self._plate_carree = OrderedDict()
+        self._geod = OrderedDict()
+        self._clip_bounds = OrderedDict()
+        self._transformers = OrderedDict()
+
+    def _get_cached(self, cache, key, func):
+        # get a cached value (or evaluate and cache it)
+        # (least recently used values are dropped if the cache is full)
+        try:
+            cache.move_to_end(key)
+            return cache[key]
+        except KeyError:
+            pass
+
+        val = cache[key] = func()
+        while len(cache) > self._cache_size:
+            cache.popitem(last=False)
+        return val
+
+    @staticmethod
+    def _get_key(crs):
+        # get a (cheap) hashable key that identifies a crs
+        if isinstance(crs, CRS):
+            return crs.srs
+
+        try:
+            hash(crs)
+            return crs
+        except TypeError:
+            # unhashable crs definitions (e.g. dicts)
+            return CRS.from_user_input(crs).srs
+
+    def clear(self):
+        """Clear all cached values."""
+        self._crs.clear()
+        self._geodetic.clear()
+        self._plate_carree.clear()
+        self._geod.clear()
+        self._clip_bounds.clear()
+        self._transformers.clear()
+
+    def get_crs(self, crs):
+        """
+        Get the pyproj CRS instance of a given crs definition.
+
+        Parameters
+        ----------
+        crs : any
+            Any crs definition accepted by `pyproj.CRS.from_user_input`.
+
+        Returns
+        -------
+        crs : pyproj.CRS
+            The CRS instance (CRS instances are returned as-is).
+
+        """
+        if isinstance(crs, CRS):
+            return crs
+
+        return self._get_cached(
+            self._crs, self._get_key(crs), lambda: CRS.from_user_input(crs)
+        )
+
+    def get_geodetic_crs(self, crs):
+        """
+        Get the geodetic (e.g. lon/lat) crs of a given crs.
+
+        For cartopy CRS objects, `crs.as_geodetic()` is returned, otherwise
+        `crs.geodetic_crs` is used.
+
+        Parameters
+        ----------
+        crs : any
+            Any crs definition accepted by `pyproj.CRS.from_user_input`.
+
+        Returns
+        -------
+        crs : pyproj.CRS
+            The geodetic crs.
+
+        """
+
+        def func():
+            crs_ = self.get_crs(crs)
+            if hasattr(crs_, "as_geodetic"):
+                return crs_.as_geodetic()
+            return crs_.geodetic_crs
+
+        return self._get_cached(self._geodetic, self._get_key(crs), func)
+
+    def get_plate_carree(self, crs):
+        """
+        Get a cartopy PlateCarree projection that uses the globe of a given crs.
+
+        Parameters
+        ----------
+        crs : cartopy.crs.CRS
+            The cartopy crs.
+
+        Returns
+        -------
+        crs : cartopy.crs.PlateCarree
+            The PlateCarree projection.
+
+        """
+        from cartopy import crs as ccrs
+
+        return self._get_cached(
+            self._plate_carree,
+            self._get_key(crs),
+            lambda: ccrs.PlateCarree(globe=crs.globe),
+        )
+
+    def get_geod(self, crs):
+        """
+        Get the `pyproj.Geod` of the ellipsoid of a given crs.
+
+        Parameters
+        ----------
+        crs : any
+            Any crs definition accepted by `pyproj.CRS.from_user_input`.
+
+        Returns
+        -------
+        geod : pyproj.Geod or None
+            The Geod instance (or None if the crs has no ellipsoid).
+
+        """
+        return self._get_cached(
+            self._geod, self._get_key(crs), lambda: self.get_crs(crs).get_geod()
+        )
+
+    def get_clip_bounds(self, crs):
+        """
+        Get the bounds of the area of use of a crs (in units of the crs).
+
+        Parameters
+        ----------
+        crs : any
+            Any crs definition accepted by `pyproj.CRS.from_user_input`.
+
+        Returns
+        -------
+        bounds : tuple or None
+            The bounds (xmin, ymin, xmax, ymax) or None if the crs does not
+            define an area of use.
+
+        """
+
+        def func():
+            crs_ = self.get_crs(crs)
+            if crs_.area_of_use is None:
+                return None
+            transformer = self.get_transformer(crs_.geodetic_crs, crs_)
+            return transformer.transform_bounds(*crs_.area_of_use.bounds)
+
+        return self._get_cached(self._clip_bounds, self._get_key(crs), func)
+
+    def get_transformer(self, crs_from, crs_to):
+        """
+        Get a (cached) transformer between two coordinate systems.
+
+        Parameters
+        ----------
+        crs_from, crs_to : any
+            Any crs definition accepted by `pyproj.CRS.from_user_input`.
+
+        Returns
+        -------
+        transformer : pyproj.Transformer
+            The transformer (always_xy=True).
+
+        """
+        return self._get_cached(
+            self._transformers,
+            (self._get_key(crs_from), self._get_key(crs_to)),
+            lambda: Transformer.from_crs(
+                self.get_crs(crs_from), self.get_crs(crs_to), always_xy=True
+            ),
+        )
+
+
+crs_registry = CRSRegistry()
@@ -1,18 +1,38 @@
 import logging
+from collections import OrderedDict
 
 import numpy as np
 from pyproj import CRS, Transformer
+from matplotlib.image import AxesImage
+
+from ._classification import get_class_indices, as_class_indices, get_class_cmap
 
 _log = logging.getLogger(__name__)
 
 
 class DataManager:
+    # shapes that can draw classified datasets from class-indices
+    # (e.g. shapes that do not interpolate or average the data-values)
+    _class_index_shapes = (
+        "ellipses",
+        "rectangles",
+        "geod_circles",
+        "scatter_points",
+        "voronoi_diagram",
+        "raster",
+    )
+    # aggregation methods that preserve the class of the aggregated values
+    # (e.g. the mean of class-indices is not the class of the mean)
+    _class_index_aggregators = ("first", "last", "min", "max", "mode")
+
     def __init__(self, m):
         self.m = m
         self.last_extent = None
         self._all_data = dict()
 
         self._current_data = dict()
+        # the selection-masks (and slices) of the current data
+        self._current_selection = None
 
         self._on_next_fetch = []
         self._masked_points_artist = None
@@ -22,6 +42,17 @@ class DataManager:
 
         self._extent_margin_factor = 0.1
 
+        # compact class-indices of classified datasets (and the associated
+        # colormap and normalization)
+        self._z_class = None
+        self._class_cmap = None
+        self._class_norm = None
+
+        # cached histograms of the data (used by colorbars)
+        self._hist_cache = dict()
+        # cached contours of the data (used by the "contour" shape)
+        self._contour_cache = OrderedDict()
+
     def set_margin_factors(self, radius_margin_factor, extent_margin_factor):
         """
         Set the margin factors that are applied to the plot extent
@@ -107,6 +138,9 @@ class DataManager:
             self._remove_existing_coll()
 
         self._all_data = self._prepare_data(assume_sorted=assume_sorted)
+        self._z_class = None
+        self._hist_cache.clear()
+        self._contour_cache.clear()
         self._indicate_masked_points = indicate_masked_points
         self.layer = layer
 
@@ -142,6 +176,55 @@ class DataManager:
             # ("shade" shapes take care about updating the data themselves!)
             self.attach_callbacks(dynamic=dynamic)
 
+    def set_class_indices(self):
+        """
+        Encode the data-values of a classified dataset as class-indices.
+
+        If `m.classify_specs._class_indices` is True, the data is drawn from
+        a compact uint8 (or uint16) array of class-indices (with an associated
+        ListedColormap) instead of normalizing the data-values on each draw.
+
+        The data-values remain available (e.g. for picking) via `.z_data`.
+
+        Shapes that aggregate the data prior to plotting (e.g. "raster") only
+        use class-indices if the aggregation preserves the classes of the
+        values (e.g. "first", "last", "min", "max" or "mode").
+        """
+        self._z_class, self._class_cmap, self._class_norm = None, None, None
+
+        if (
+            not self.m.classify_specs._class_indices
+            or not getattr(self.m, "_classified", False)
+            or self.m.shape.name not in self._class_index_shapes
+            or self.z_data is None
+        ):
+            return
+
+        maxsize = getattr(self.m.shape, "_maxsize", None)
+        aggregator = getattr(self.m.shape, "_aggregator", "first")
+        if (
+            maxsize is not None
+            and np.size(self.z_data) >= maxsize
+            and aggregator not in self._class_index_aggregators
+        ):
+            _log.info(
+                "EOmaps: Class-indices are not used since the aggregator "
+                f"'{aggregator}' does not preserve the classes of the data. "
+                f"Use one of {self._class_index_aggregators}."
+            )
+            return
+
+        self._z_class = get_class_indices(self.z_data, self.m._bins)
+        self._class_cmap, self._class_norm = get_class_cmap(
+            self.m._cbcmap, self.m._norm, self.m._bins
+        )
+
+    def _get_cmap_and_norm(self):
+        # get the colormap and normalization used to draw the current data
+        if self._z_class is not None:
+            return self._class_cmap, self._class_norm
+        return getattr(self.m, "_cbcmap", "Reds"), getattr(self.m, "_norm", None)
+
     def attach_callbacks(self, dynamic):
         if dynamic is True:
             if self.on_fetch_bg not in self.m.BM._before_update_actions:
@@ -191,7 +274,7 @@ class DataManager:
         # since QuadMesh requires sorted coordinates!
         # (currently only implemented for 1D coordinates and 2D data)
         if assume_sorted is False:
-            if used_shape.name in ["raster", "shade_raster"]:
+            if used_shape.name in ["raster", "warped_raster", "shade_raster"]:
                 if (
                     len(xorig.shape) == 1
                     and len(yorig.shape) == 1
@@ -218,7 +301,7 @@ class DataManager:
             else:
                 _log.info(
                     "EOmaps: using 'assume_sorted=False' is only relevant for "
-                    + "the shapes ['raster', 'shade_raster']! "
+                    + "the shapes ['raster', 'warped_raster', 'shade_raster']! "
                     + "...continuing without sorting."
                 )
 
@@ -380,11 +463,12 @@ class DataManager:
         kwargs.setdefault("lw", 0.25)
         kwargs.setdefault("c", self._current_data["z_data"].ravel()[~mask])
 
+        cmap, norm = self._get_cmap_and_norm()
         self._masked_points_artist = self.m.ax.scatter(
             self._current_data["x0"].ravel()[~mask],
             self._current_data["y0"].ravel()[~mask],
-            cmap=getattr(self.m, "_cbcmap", "Reds"),
-            norm=getattr(self.m, "_norm", None),
+            cmap=cmap,
+            norm=norm,
             **kwargs,
         )
 
@@ -402,9 +486,6 @@ class DataManager:
         if not self.m._data_plotted:
             return
 
-        if self.m.shape.name == "contour":
-            return False
-
         # don't re-draw while the layout-editor is active!
         if self.m.parent._layout_editor.modifier_pressed:
             return False
@@ -431,6 +512,10 @@ class DataManager:
         if self.extent_changed:
             return True
 
+        # re-draw if the shape requires it (e.g. if the size of the axes changed)
+        if getattr(self.m.shape, "_redraw_required", lambda: False)():
+            return True
+
         return False
 
     def _remove_existing_coll(self):
@@ -460,14 +545,19 @@ class DataManager:
             layer = self.layer
         try:
             if check_redraw and not self.redraw_required(layer):
+                self.m.BM.profiler.cache("data", True)
                 return
 
+            self.m.BM.profiler.cache("data", False)
+
             # check if the data_manager has no data assigned
             if self.x0 is None and self.m.coll is not None:
                 self._remove_existing_coll()
                 return False
 
-            props = self.get_props()
+            with self.m.BM.profiler.stage("data_select"):
+                props = self.get_props()
+
             if props is None or props["x0"] is None or props["y0"] is None:
                 # fail-fast in case the data is completely outside the extent
                 return
@@ -487,8 +577,14 @@ class DataManager:
             # remove previous collection from the map
             self._remove_existing_coll()
             # draw the new collection
-            coll = self.m._get_coll(props, **self.m._coll_kwargs)
-            coll.set_clim(self.m._vmin, self.m._vmax)
+            with self.m.BM.profiler.stage("data_collection"):
+                coll = self.m._get_coll(props, **self.m._coll_kwargs)
+            # (keep the normalization of aggregated values that do not represent
+            # data-values, e.g. "count" for "aggregate_points")
+            # NOTE: the limits are also set for class-indices since colorbars use
+            # the limits of the collection (they are ignored by NoNorm)
+            if not getattr(self.m.shape, "_renorm", False):
+                coll.set_clim(self.m._vmin, self.m._vmax)
 
             coll.set_label("Dataset " f"({self.m.shape.name}  |  {self.z_data.shape})")
 
@@ -497,7 +593,10 @@ class DataManager:
                 # case the data-limits are infinite (e.g. for projected
                 # datasets containing points outside the used projection)
                 # the extent is set by calling "._set_lims()" in `m.plot_map()`
-                self.m.ax.add_collection(coll, autolim=False)
+                if isinstance(coll, AxesImage):
+                    self.m.ax.add_image(coll)
+                else:
+                    self.m.ax.add_collection(coll, autolim=False)
 
             if self.m._coll_dynamic:
                 self.m.BM.add_artist(coll, self.layer)
@@ -506,6 +605,12 @@ class DataManager:
 
             self.m._coll = coll
 
+            # update colorbars of aggregated values that do not represent
+            # data-values (they change if the data is re-aggregated)
+            if getattr(self.m.shape, "_renorm", False):
+                for cb in self.m._colorbars:
+                    cb._redraw_colorbar()
+
             # if required, add masked points indicators
             if self._indicate_masked_points is not False:
                 if isinstance(self._indicate_masked_points, dict):
@@ -661,7 +766,12 @@ class DataManager:
                 else:
                     ret = val
 
-            if self.m.shape.name not in ["raster", "shade_raster", "contour"]:
+            if self.m.shape.name not in [
+                "raster",
+                "warped_raster",
+                "shade_raster",
+                "contour",
+            ]:
                 ret = ret.ravel()
 
         return ret
@@ -856,7 +966,7 @@ class DataManager:
             raise TypeError(
                 f"EOmaps: The method {method} is not a valid aggregation-method!\n"
                 "Use one of:\n"
-                "['first', 'last', 'min', 'max', 'mean', 'std', 'median', "
+                "['first', 'last', 'min', 'max', 'mean', 'std', 'median', 'mode', "
                 "'fast_mean', 'fast_sum', 'spline']"
             )
 
@@ -895,19 +1005,64 @@ class DataManager:
         else:
             slices, blocksize = None, None
 
+        self._current_selection = (qs, slices)
         self._current_data = dict(
             xorig=self._select_vals(self.xorig, qs, slices),
             yorig=self._select_vals(self.yorig, qs, slices),
             x0=self._select_vals(self.x0, qs, slices),
             y0=self._select_vals(self.y0, qs, slices),
-            z_data=self._select_vals(self.z_data, qs, slices),
+            z_data=self._select_vals(
+                self.z_data if self._z_class is None else self._z_class, qs, slices
+            ),
             # ids=self._select_ids(),
         )
         self.last_extent = self.current_extent
 
         self._zoom(blocksize)
+
+        if self._z_class is not None:
+            # make sure aggregated class-indices are valid class-indices
+            self._current_data["z_data"] = as_class_indices(
+                self._current_data["z_data"], self.m._bins
+            )
         return self._current_data
 
+    def _get_current_indices(self):
+        """
+        Get the indices of the currently selected datapoints.
+
+        Returns
+        -------
+        ind : np.ndarray or None
+            The indices of the selected datapoints with respect to the flattened
+            (full) dataset or None if no data is selected.
+
+        """
+        if self._current_selection is None or self.x0 is None:
+            return None
+
+        # evaluate the indices of the selection directly (same as `_select_vals`)
+        # to avoid creating an index-array for the full dataset
+        (q, qx, qy), slices = self._current_selection
+        shape = np.shape(self.x0)
+
+        if all(i is None for i in (q, qx, qy)):
+            return None
+        elif all(i is True for i in (q, qx, qy)):
+            return np.arange(np.size(self.x0))
+        elif len(shape) == 2 and qx is not None and qy is not None:
+            x0, x1, y0, y1 = slices
+            rows = np.arange(*slice(y0, y1).indices(shape[0]))
+            cols = np.arange(*slice(x0, x1).indices(shape[1]))
+            return np.ravel(rows[:, np.newaxis] * shape[1] + cols)
+        elif q is not None:
+            q = np.squeeze(q)
+            if q.dtype == bool:
+                return np.flatnonzero(q)
+            return np.ravel(q)
+        else:
+            return np.arange(np.size(self.x0))
+
     def _get_datasize(self, z_data, x0, y0, **kwargs):
         # if a dataset is provided, use it to identify the data-size
         if z_data is not None:
@@ -1089,4 +1244,8 @@ class DataManager:
 
         self._all_data.clear()
         self._current_data.clear()
+        self._z_class = None
+        self._hist_cache.clear()
+        self._contour_cache.clear()
+        self._current_selection = None
         self.last_extent = None
@@ -0,0 +1,107 @@
+"""Lookup-table based colormapping of integer-encoded datasets."""
+
+import numpy as np
+
+
+def supports_lut(a):
+    """
+    Check if an array can be colored with a lookup-table.
+
+    Lookup-tables are supported for integer arrays with a max. itemsize of 2 bytes
+    (e.g. int8, uint8, int16 and uint16).
+
+    Parameters
+    ----------
+    a : array-like
+        The data-values.
+
+    Returns
+    -------
+    supported : bool
+        True if a lookup-table can be used, False otherwise.
+
+    """
+    dtype = np.asanyarray(a).dtype
+    return dtype.kind in "iu" and dtype.itemsize <= 2
+
+
+def _get_unsigned_dtype(dtype):
+    # the unsigned integer dtype with the same itemsize
+    return np.dtype(f"u{np.dtype(dtype).itemsize}")
+
+
+def get_lut(cmap, norm, dtype, fill_value=None):
+    """
+    Evaluate the RGBA colors of all values of an integer domain.
+
+    The colors are ordered with respect to the unsigned representation of the
+    values (e.g. the int16 value -1 is at the position 65535) and the last entry
+    of the lookup-table is the "bad" color of the colormap.
+
+    Parameters
+    ----------
+    cmap : matplotlib.colors.Colormap
+        The colormap.
+    norm : matplotlib.colors.Normalize
+        The normalization.
+    dtype : numpy.dtype
+        The integer dtype of the data (int8, uint8, int16 or uint16).
+    fill_value : int, optional
+        A value that is mapped to the "bad" color of the colormap.
+        The default is None.
+
+    Returns
+    -------
+    lut : np.ndarray
+        The lookup-table with shape (2**(8 * itemsize) + 1, 4) and dtype uint8.
+
+    """
+    dtype = np.dtype(dtype)
+    udtype = _get_unsigned_dtype(dtype)
+
+    vals = np.arange(2 ** (8 * dtype.itemsize), dtype=udtype).view(dtype)
+
+    lut = np.empty((vals.size + 1, 4), dtype=np.uint8)
+    lut[:-1] = cmap(norm(vals), bytes=True)
+    lut[-1] = cmap(np.nan, bytes=True)
+
+    # (ignore fill-values that are not part of the integer domain)
+    info = np.iinfo(dtype)
+    if (
+        fill_value is not None
+        and np.ndim(fill_value) == 0
+        and float(fill_value).is_integer()
+        and info.min <= fill_value <= info.max
+    ):
+        lut[np.array(fill_value, dtype=dtype).view(udtype)] = lut[-1]
+
+    return lut
+
+
+def apply_lut(lut, a):
+    """
+    Get the RGBA colors of an integer array from a lookup-table.
+
+    Parameters
+    ----------
+    lut : np.ndarray
+        The lookup-table (see `get_lut`).
+    a : array-like or masked-array
+        The integer data-values. (masked values get the "bad" color)
+
+    Returns
+    -------
+    rgba : np.ndarray
+        The RGBA colors with shape (*a.shape, 4) and dtype uint8.
+
+    """
+    a = np.asanyarray(a)
+    data = np.ma.getdata(a)
+
+    rgba = np.take(lut, data.view(_get_unsigned_dtype(data.dtype)), axis=0)
+
+    mask = np.ma.getmask(a)
+    if mask is not np.ma.nomask:
+        rgba[mask] = lut[-1]
+
+    return rgba
@@ -0,0 +1,275 @@
+"""Opt-in performance instrumentation of the draw-cycle."""
+
+import logging
+from time import perf_counter
+from contextlib import contextmanager
+
+_log = logging.getLogger(__name__)
+
+
+class Profiler:
+    """
+    Record the time spent in the individual stages of the draw-cycle.
+
+    The profiler is disabled by default. Once started, it records:
+
+    - the execution-time of the stages of the draw-cycle
+      (e.g. "on_draw", "update", "fetch_bg", "draw_animated", "data_select" ...)
+    - the time required to draw individual background artists
+    - cache hits/misses (e.g. of cached background-layers)
+
+    Use :py:meth:`Profiler.report` to get a summary of the recorded values and
+    :py:meth:`Profiler.add_callback` to get notified on each recorded value
+    (e.g. to ship frame-time metrics).
+
+    Examples
+    --------
+    >>> m = Maps()
+    >>> m.add_feature.preset.coastline()
+    >>> m.BM.profiler.start()
+    >>> ... # interact with the map
+    >>> m.BM.profiler.stop()
+    >>> print(m.BM.profiler.report())
+
+    """
+
+    def __init__(self):
+        self._enabled = False
+
+        # name: [count, total, max]
+        self._stages = dict()
+        self._artists = dict()
+        # name: [hits, misses]
+        self._cache = dict()
+
+        self._callbacks = list()
+
+    @property
+    def enabled(self):
+        """Indicator if the profiler is currently recording."""
+        return self._enabled
+
+    def start(self):
+        """Start recording timings."""
+        self._enabled = True
+
+    def stop(self):
+        """Stop recording timings (recorded values are kept)."""
+        self._enabled = False
+
+    def clear(self):
+        """Clear all recorded values."""
+        self._stages.clear()
+        self._artists.clear()
+        self._cache.clear()
+
+    def add_callback(self, func):
+        """
+        Add a callback that is executed whenever a value is recorded.
+
+        The callback is called with the following arguments:
+
+        - kind : str
+            The kind of the record ("stage", "artist" or "cache")
+        - name : str
+            The name of the stage, the label of the artist or the name of the cache.
+        - value : float or bool
+            The duration in seconds (for "stage" and "artist" records) or a
+            boolean indicating a cache-hit (True) or a cache-miss (False).
+
+        Parameters
+        ----------
+        func : callable
+            The callback function.
+
+        Examples
+        --------
+        >>> def cb(kind, name, value):
+        >>>     if kind == "stage" and name == "on_draw":
+        >>>         print(f"frame-time: {value * 1000:.1f} ms")
+        >>> m.BM.profiler.add_callback(cb)
+
+        """
+        self._callbacks.append(func)
+
+    def remove_callback(self, func):
+        """
+        Remove a previously added callback.
+
+        Parameters
+        ----------
+        func : callable
+            The callback function to remove.
+
+        """
+        if func in self._callbacks:
+            self._callbacks.remove(func)
+
+    def _notify(self, kind, name, value):
+        for cb in self._callbacks:
+            try:
+                cb(kind, name, value)
+            except Exception:
+                _log.error(
+                    "EOmaps: There was an error in the profiler-callback "
+                    f"{getattr(cb, '__name__', cb)}",
+                    exc_info=_log.getEffectiveLevel() <= logging.DEBUG,
+                )
+
+    @staticmethod
+    def _record_time(d, name, t):
+        vals = d.get(name, None)
+        if vals is None:
+            d[name] = [1, t, t]
+        else:
+            vals[0] += 1
+            vals[1] += t
+            if t > vals[2]:
+                vals[2] = t
+
+    @staticmethod
+    def _get_artist_label(art):
+        label = getattr(art, "get_label", lambda: "")()
+        if not label or label.startswith("_"):
+            return type(art).__name__
+        return f"{type(art).__name__}: {label}"
+
+    @contextmanager
+    def stage(self, name):
+        """Contextmanager to record the execution-time of a stage."""
+        if not self._enabled:
+            yield
+            return
+
+        t0 = perf_counter()
+        try:
+            yield
+        finally:
+            t = perf_counter() - t0
+            self._record_time(self._stages, name, t)
+            self._notify("stage", name, t)
+
+    @contextmanager
+    def artist(self, art):
+        """Contextmanager to record the time required to draw an artist."""
+        if not self._enabled:
+            yield
+            return
+
+        t0 = perf_counter()
+        try:
+            yield
+        finally:
+            t = perf_counter() - t0
+            name = self._get_artist_label(art)
+            self._record_time(self._artists, name, t)
+            self._notify("artist", name, t)
+
+    def cache(self, name, hit):
+        """
+        Record a cache hit (or miss).
+
+        Parameters
+        ----------
+        name : str
+            The name of the cache.
+        hit : bool
+            True for a cache-hit, False for a cache-miss.
+
+        """
+        if not self._enabled:
+            return
+
+        vals = self._cache.setdefault(name, [0, 0])
+        vals[0 if hit else 1] += 1
+        self._notify("cache", name, hit)
+
+    def _get_records(self):
+        records = []
+        for kind, d in (("stage", self._stages), ("artist", self._artists)):
+            for name, (count, total, tmax) in d.items():
+                records.append(
+                    dict(
+                        kind=kind,
+                        name=name,
+                        count=count,
+                        total_ms=total * 1000,
+                        mean_ms=total / count * 1000,
+                        max_ms=tmax * 1000,
+                        hits=None,
+                        misses=None,
+                    )
+                )
+
+        for name, (hits, misses) in self._cache.items():
+            records.append(
+                dict(
+                    kind="cache",
+                    name=name,
+                    count=hits + misses,
+                    total_ms=None,
+                    mean_ms=None,
+                    max_ms=None,
+                    hits=hits,
+                    misses=misses,
+                )
+            )
+
+        return records
+
+    def report(self, as_dataframe=False):
+        """
+        Get a summary of all recorded values.
+
+        Parameters
+        ----------
+        as_dataframe : bool, optional
+            If True, a pandas.DataFrame is returned. Otherwise a string
+            representation of the summary table is returned.
+            The default is False.
+
+        Returns
+        -------
+        report : str or pandas.DataFrame
+            The summary of the recorded values (times are in milliseconds).
+
+        """
+        records = self._get_records()
+
+        if as_dataframe:
+            from .helpers import register_modules
+
+            (pd,) = register_modules("pandas")
+            return pd.DataFrame.from_records(
+                records,
+                columns=[
+                    "kind",
+                    "name",
+                    "count",
+                    "total_ms",
+                    "mean_ms",
+                    "max_ms",
+                    "hits",
+                    "misses",
+                ],
+            )
+
+        def fmt(val):
+            if val is None:
+                return "-"
+            elif isinstance(val, float):
+                return f"{val:.2f}"
+            return str(val)
+
+        header = ["kind", "name", "count", "total [ms]", "mean [ms]", "max [ms]"]
+        header += ["hits", "misses"]
+        rows = [[fmt(val) for val in r.values()] for r in records]
+
+        widths = [max(len(i) for i in col) for col in zip(header, *rows)]
+
+        lines = ["  ".join(h.ljust(w) for h, w in zip(header, widths))]
+        lines.append("  ".join("-" * w for w in widths))
+        for r in rows:
+            lines.append("  ".join(v.ljust(w) for v, w in zip(r, widths)))
+
+        return "\n".join(lines)
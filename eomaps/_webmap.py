@@ -4,7 +4,7 @@ import requests
 from functools import lru_cache, partial
 from warnings import warn, filterwarnings, catch_warnings
 from types import SimpleNamespace
-from contextlib import contextmanager
+from contextlib import contextmanager, nullcontext
 from urllib3.exceptions import InsecureRequestWarning
 from io import BytesIO
 from pprint import PrettyPrinter
@@ -1354,6 +1354,13 @@ class SlippyImageArtistNew(AxesImage):
     def on_xlim(self, *args, **kwargs):
         self.stale = True
 
+    def _get_profiler_stage(self, name):
+        # get the profiler-stage of the associated Maps-object (if available)
+        m = getattr(self.figure, "_EOmaps_parent", None)
+        if m is None:
+            return nullcontext()
+        return m.BM.profiler.stage(name)
+
     def get_window_extent(self, renderer=None):
         return self.axes.get_window_extent(renderer=renderer)
 
@@ -1381,11 +1388,12 @@ class SlippyImageArtistNew(AxesImage):
                 or len(self.cache) == 0
             ):
                 # only re-fetch tiles if the extent has changed
-                located_images = self.raster_source.fetch_raster(
-                    ax.projection,
-                    extent=[x1, x2, y1, y2],
-                    target_resolution=(window_extent.width, window_extent.height),
-                )
+                with self._get_profiler_stage("webmap_fetch"):
+                    located_images = self.raster_source.fetch_raster(
+                        ax.projection,
+                        extent=[x1, x2, y1, y2],
+                        target_resolution=(window_extent.width, window_extent.height),
+                    )
                 self.cache = located_images
                 self._prev_extent = (x1, x2, y1, y2)
                 self._prev_size = (ax.bbox.width, ax.bbox.height)
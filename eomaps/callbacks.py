@@ -615,9 +615,12 @@ class _ClickCallbacks(object):
         if shape is None:
             if self.m.shape is not None:
                 m_shape = self.m.shape.name
+                if m_shape == "auto_lod":
+                    m_shape = self.m.shape._shape.name
+
                 if m_shape in possible_shapes:
                     shape = m_shape
-                elif m_shape in ["raster", "shade_raster"]:
+                elif m_shape in ["raster", "warped_raster", "shade_raster"]:
                     shape = "rectangles"
                 else:
                     shape = "ellipses"
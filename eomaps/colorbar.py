@@ -14,11 +14,31 @@ import matplotlib.transforms as mtransforms
 import matplotlib as mpl
 import matplotlib.pyplot as plt
 from matplotlib.colors import LinearSegmentedColormap
+from matplotlib.collections import PolyCollection
 
-from .helpers import pairwise, _TransformedBoundsLocator, register_modules
+from .helpers import _TransformedBoundsLocator, register_modules
+from ._classification import get_histogram, get_class_histogram, get_minmax
 
 _log = logging.getLogger(__name__)
 
+# kwargs of plt.hist that are ignored when drawing the histogram of colorbars
+# (the histogram is drawn as a single PolyCollection colored by the colormap)
+_IGNORED_HIST_KWARGS = (
+    "bins",
+    "range",
+    "weights",
+    "bottom",
+    "histtype",
+    "align",
+    "orientation",
+    "rwidth",
+    "color",
+    "fc",
+    "facecolor",
+    "facecolors",
+    "stacked",
+)
+
 
 def get_named_bins_formatter(bins, names, show_values=False):
     """
@@ -82,6 +102,7 @@ class ColorBar:
         hist_kwargs=None,
         label=None,
         ylabel=None,
+        hist_sample_size=None,
         **kwargs,
     ):
         """
@@ -211,8 +232,14 @@ class ColorBar:
 
             The default is "clip"
         hist_kwargs : dict
-            A dictionary with keyword-arguments passed to the creation of the histogram
-            (e.g. passed to `plt.hist()` )
+            A dictionary with keyword-arguments passed to the creation of the histogram.
+
+            - "density", "cumulative" and "log" are evaluated as for `plt.hist()`
+              (e.g. "log=True" is the same as using `log=True`)
+            - other kwargs of `plt.hist()` (e.g. "histtype", "rwidth", "bottom" ...)
+              are not supported and ignored (with a warning)
+            - all other kwargs are passed to the `PolyCollection` used to draw the
+              histogram bars (e.g. "alpha", "ec", "lw", "zorder" ...)
         label : str, optional
             The label used for the colorbar.
             Use `ColorBar.set_labels()` to set the labels (and styling) for the
@@ -220,6 +247,12 @@ class ColorBar:
             The default is None.
         ylabel : str, optional
             The label used for the y-axis of the colorbar. The default is None
+        hist_sample_size : int or None, optional
+            The max. number of values used to evaluate the histogram.
+            For larger datasets, the histogram is evaluated from a random sample of
+            the data. (The histogram of a dataset is evaluated only once and
+            re-used on subsequent re-draws of the colorbar.)
+            If None, all values are used. The default is None
         kwargs :
             All additional kwargs are passed to the creation of the colorbar
             (e.g. `plt.colorbar()`)
@@ -277,7 +310,21 @@ class ColorBar:
         else:
             self._hist_kwargs = copy.deepcopy(hist_kwargs)
 
+        # use a logarithmic histogram-axis if "log" is set (as for plt.hist)
+        if self._hist_kwargs.pop("log", False):
+            log = True
+
+        ignored = [key for key in _IGNORED_HIST_KWARGS if key in self._hist_kwargs]
+        if len(ignored) > 0:
+            _log.warning(
+                f"EOmaps: The hist_kwargs {ignored} are not supported for "
+                "colorbar histograms and will be ignored!"
+            )
+            for key in ignored:
+                self._hist_kwargs.pop(key)
+
         self._histogram_plotted = False  # indicator if histogram has been plotted
+        self._hist_coll = None  # the collection used to draw the histogram
 
         self._dynamic_shade_indicator = dynamic_shade_indicator
         self._hist_label_kwargs = None
@@ -287,6 +334,7 @@ class ColorBar:
         self._tick_formatter = tick_formatter
         self._log = log
         self._out_of_range_vals = out_of_range_vals
+        self._hist_sample_size = hist_sample_size
 
         # kwargs["label"] = label
 
@@ -296,7 +344,12 @@ class ColorBar:
         self._vmin = self._coll.norm.vmin
         self._vmax = self._coll.norm.vmax
 
-        self._classified = self._m.classify_specs._classified
+        # indicator if the collection shows aggregated values that do not
+        # represent data-values (e.g. "count" aggregations of "aggregate_points")
+        self._renorm = getattr(self._m.shape, "_renorm", False)
+
+        # (classifications are not used to color aggregated values)
+        self._classified = self._m.classify_specs._classified and not self._renorm
 
         if self._hist_bins == "bins" and not self._classified:
             raise AssertionError(
@@ -312,6 +365,9 @@ class ColorBar:
 
         self._set_data()
         self._setup_axes()
+        if self._renorm:
+            # aggregated values change if the map is resized to add the colorbar
+            self._set_data()
         self.set_labels(label)
         if ylabel is not None:
             self.ax_cb_plot.set_ylabel(ylabel)
@@ -725,18 +781,6 @@ class ColorBar:
         self.ax_cb_plot.spines["bottom"].set_visible(False)
         self.ax_cb_plot.spines["left"].set_visible(False)
 
-        # set axis scale
-        if horizontal:
-            if self._log is True:
-                self.ax_cb_plot.set_yscale("log")
-            else:
-                self.ax_cb_plot.set_yscale("linear")
-        else:
-            if self._log is True:
-                self.ax_cb_plot.set_xscale("log")
-            else:
-                self.ax_cb_plot.set_xscale("linear")
-
         # add all axes as artists
         for a in self._axes:
             a.set_navigate(False)
@@ -755,7 +799,7 @@ class ColorBar:
     def _axes(self):
         return (self._ax, self.ax_cb, self.ax_cb_plot)
 
-    def _set_extend(self, z_data):
+    def _set_extend(self, minmax):
         if self._inherit_position and self._parent_cb is not None:
             self._extend = self._parent_cb._extend
             # warn if provided extend behavior differs from the inherited behavior
@@ -772,9 +816,9 @@ class ColorBar:
             self._extend = self._init_extend
         else:
             extend = "neither"
-            if (z_data > self._vmax).any():
+            if minmax.size > 0 and minmax[1] > self._vmax:
                 extend = "max"
-            if (z_data < self._vmin).any():
+            if minmax.size > 0 and minmax[0] < self._vmin:
                 if extend == "max":
                     extend = "both"
                 else:
@@ -871,6 +915,17 @@ class ColorBar:
                     persistent=True,
                     m=self._m,
                 )
+        elif self._renorm:
+            # use the aggregated values and the normalization of the collection
+            # (the collection is re-created if the data is re-aggregated)
+            self._coll = self._m.coll
+            self._vmin = self._coll.norm.vmin
+            self._vmax = self._coll.norm.vmax
+
+            z_data = np.ma.compressed(self._coll.get_array())
+            bins = None
+            cmap = self._coll.get_cmap()
+            norm = self._coll.norm
         else:
 
             z_data = self._m._data_manager.z_data
@@ -878,26 +933,14 @@ class ColorBar:
             cmap = self._m.classify_specs._cbcmap
             norm = self._m.classify_specs._norm
 
-        if isinstance(z_data, np.ma.masked_array):
-            z_data = z_data.compressed()
-        else:
-            z_data = z_data.ravel()
-
-        # make sure we only consider valid values in the histogram
-        z_data = z_data[np.isfinite(z_data)]
-
-        self._set_extend(z_data)
-
-        if self._out_of_range_vals == "mask":
-            z_data = z_data[(z_data >= self._vmin) & (z_data <= self._vmax)]
-
-        # make sure the norm clips with respect to vmin/vmax
-        # (only clip if either vmin or vmax is not None)
-        if self._out_of_range_vals == "clip":
-            if self._vmin or self._vmax:
-                z_data = z_data.clip(self._vmin, self._vmax)
+        # the histogram of the full dataset is cached with the data
+        # (the histogram of dynamic colorbars and aggregated values depends on
+        # the visible data)
+        self._hist = self._get_histogram(
+            z_data, bins, cache=not (dynamic_shade or self._renorm)
+        )
+        self._set_extend(self._hist[2])
 
-        self._z_data = z_data
         self._bins = bins
         self._cmap = cmap
         # TODO check if copy is really necessary
@@ -911,6 +954,76 @@ class ColorBar:
                 self._norm.boundaries, self._vmin, self._vmax
             )
 
+    def _get_histogram(self, z_data, bins, cache=True):
+        # get the histogram (counts, edges, minmax) of the data
+        if self._classified and self._hist_bins == "bins":
+            hist_bins = bins
+        else:
+            hist_bins = self._hist_bins
+
+        # (only clip if either vmin or vmax is not None)
+        clip = self._out_of_range_vals == "clip" and bool(self._vmin or self._vmax)
+
+        dm = self._m._data_manager
+        if cache:
+            key = (
+                hist_bins if np.ndim(hist_bins) == 0 else tuple(hist_bins),
+                self._vmin,
+                self._vmax,
+                clip,
+                self._hist_sample_size,
+            )
+
+            hist = dm._hist_cache.get(key, None)
+            if hist is not None:
+                self._m.BM.profiler.cache("colorbar_hist", True)
+                return hist
+
+            self._m.BM.profiler.cache("colorbar_hist", False)
+
+        if (
+            cache
+            and clip
+            and dm._z_class is not None
+            and hist_bins is bins
+            and self._hist_sample_size is None
+        ):
+            # use the class-indices of the data (if available) to count the values
+            hist = (*get_class_histogram(dm._z_class, bins), get_minmax(z_data))
+        else:
+            hist = get_histogram(
+                z_data,
+                hist_bins,
+                range=(self._vmin, self._vmax),
+                clip=clip,
+                sample_size=self._hist_sample_size,
+            )
+
+        if cache:
+            dm._hist_cache[key] = hist
+
+        return hist
+
+    def _get_hist_heights(self, density=False, cumulative=False):
+        # get the heights of the histogram bars (as for plt.hist)
+        counts, edges, _ = self._hist
+        heights = counts.astype(float)
+
+        if density:
+            total = heights.sum()
+            if total > 0:
+                heights /= total * np.diff(edges)
+
+        if cumulative:
+            if density:
+                heights *= np.diff(edges)
+            if cumulative < 0:
+                heights = heights[::-1].cumsum()[::-1]
+            else:
+                heights = heights.cumsum()
+
+        return heights, edges
+
     def _plot_colorbar(self):
         # plot the colorbar
         horizontal = self._orientation == "horizontal"
@@ -928,6 +1041,18 @@ class ColorBar:
 
         self.cb.outline.set_visible(False)
 
+        self._set_colorbar_ticks()
+
+        # set the axis_locator to set relative axis positions
+        # TODO check why colorbar axis size changes after plot!
+        # (e.g. this needs to be called AFTER plotting the colorbar to make sure
+        # the extension-arrows are properly aligned)
+        self.set_hist_size()
+
+    def _set_colorbar_ticks(self):
+        # set the ticks, the tick-formatter and the limits of the colorbar
+        horizontal = self._orientation == "horizontal"
+
         # ensure that ticklabels are correct if a classification is used
         if self._classified and "ticks" not in self._kwargs:
             self.cb.set_ticks(np.unique(np.clip(self._bins, self._vmin, self._vmax)))
@@ -969,12 +1094,6 @@ class ColorBar:
                 + "lower limits for the colorbar... limits will be ignored!"
             )
 
-        # set the axis_locator to set relative axis positions
-        # TODO check why colorbar axis size changes after plot!
-        # (e.g. this needs to be called AFTER plotting the colorbar to make sure
-        # the extension-arrows are properly aligned)
-        self.set_hist_size()
-
     def _plot_histogram(self):
         if self._hist_size <= 0.0001:
             return
@@ -982,17 +1101,24 @@ class ColorBar:
         horizontal = self._orientation == "horizontal"
         n_cmap = plt.cm.ScalarMappable(cmap=self._cmap, norm=self._norm)
 
-        # plot the histogram
-        h = self.ax_cb_plot.hist(
-            self._z_data,
-            orientation="vertical" if horizontal else "horizontal",
-            bins=self._bins
-            if (self._classified and self._hist_bins == "bins")
-            else self._hist_bins,
-            color="k",
-            align="mid",
-            range=(self._vmin, self._vmax) if (self._vmin and self._vmax) else None,
-            **self._hist_kwargs,
+        # set axis scale
+        # (must be set on each re-draw since clearing the axis resets the scale)
+        if horizontal:
+            if self._log is True:
+                self.ax_cb_plot.set_yscale("log")
+            else:
+                self.ax_cb_plot.set_yscale("linear")
+        else:
+            if self._log is True:
+                self.ax_cb_plot.set_xscale("log")
+            else:
+                self.ax_cb_plot.set_xscale("linear")
+
+        # plot the histogram (from the pre-computed counts)
+        hist_kwargs = dict(self._hist_kwargs)
+        heights, edges = self._get_hist_heights(
+            density=hist_kwargs.pop("density", False),
+            cumulative=hist_kwargs.pop("cumulative", False),
         )
 
         if self._show_outline:
@@ -1002,9 +1128,9 @@ class ColorBar:
                 outline_props = self._show_outline
 
             if horizontal:
-                self.ax_cb_plot.step(h[1], [h[0][0], *h[0]], **outline_props)
+                self.ax_cb_plot.step(edges, [heights[0], *heights], **outline_props)
             else:
-                self.ax_cb_plot.step([h[0][0], *h[0]], h[1], **outline_props)
+                self.ax_cb_plot.step([heights[0], *heights], edges, **outline_props)
 
         if self._bins is None:
             # identify position of color-splits in the colorbar
@@ -1017,50 +1143,49 @@ class ColorBar:
         else:
             splitpos = np.asanyarray(self._bins)
 
-        # color the histogram patches
-        for patch in list(self.ax_cb_plot.patches):
-            # the list is important!! since otherwise we change ax.patches
-            # as we iterate over it... which is not a good idea...
-            if horizontal:
-                minval = np.atleast_1d(patch.get_x())[0]
-                width = patch.get_width()
-                height = patch.get_height()
-                maxval = minval + width
-            else:
-                minval = np.atleast_1d(patch.get_y())[0]
-                width = patch.get_width()
-                height = patch.get_height()
-                maxval = minval + height
-            # ----------- take care of histogram-bins that have split colors
-            # identify bins that extend beyond a color-change
-            splitbins = [
-                minval,
-                *splitpos[(splitpos > minval) & (maxval > splitpos)],
-                maxval,
-            ]
+        # split histogram-bins that extend beyond a color-change
+        b = np.union1d(edges, splitpos[(splitpos > edges[0]) & (splitpos < edges[-1])])
+        b0, b1 = b[:-1], b[1:]
+        h = heights[np.searchsorted(edges, b0, side="right") - 1]
+
+        # (don't draw empty bars)
+        q = h != 0
+        b0, b1, h = b0[q], b1[q], h[q]
+        zeros = np.zeros_like(h)
+
+        verts = np.stack(
+            (
+                np.column_stack((b0, zeros)),
+                np.column_stack((b0, h)),
+                np.column_stack((b1, h)),
+                np.column_stack((b1, zeros)),
+            ),
+            axis=1,
+        )
+        if not horizontal:
+            verts = verts[..., ::-1]
 
-            if len(splitbins) > 2:
-                patch.remove()
-                # add in-between patches
-                for b0, b1 in pairwise(splitbins):
-                    if horizontal:
-                        pi = mpl.patches.Rectangle(
-                            (b0, 0),
-                            (b1 - b0),
-                            height,
-                            facecolor=self._cmap(self._norm((b0 + b1) / 2)),
-                        )
-                    else:
-                        pi = mpl.patches.Rectangle(
-                            (0, b0),
-                            width,
-                            (b1 - b0),
-                            facecolor=self._cmap(self._norm((b0 + b1) / 2)),
-                        )
+        coll = PolyCollection(
+            verts,
+            facecolors=self._cmap(self._norm((b0 + b1) / 2)),
+            **hist_kwargs,
+        )
+        # (make sure the bars start at 0 without margins, as for plt.hist)
+        if horizontal:
+            coll.sticky_edges.y.append(0)
+        else:
+            coll.sticky_edges.x.append(0)
 
-                    self.ax_cb_plot.add_patch(pi)
-            else:
-                patch.set_facecolor(self._cmap(self._norm((minval + maxval) / 2)))
+        # update the data-limits with the (untransformed) bar-corners
+        # (autolim=True would evaluate the limits in log-space on log-axes)
+        if self._log is True:
+            corners = verts[:, 1:3]
+        else:
+            corners = verts
+        self.ax_cb_plot.add_collection(coll, autolim=False)
+        self.ax_cb_plot.update_datalim(corners.reshape(-1, 2))
+        self.ax_cb_plot.autoscale_view()
+        self._hist_coll = coll
 
         # setup appearance of histogram
         if horizontal:
@@ -1122,6 +1247,13 @@ class ColorBar:
         self.ax_cb_plot.clear()
         self._plot_histogram()
 
+        if self._renorm:
+            # the limits of aggregated values change with the aggregation
+            self.cb.update_normal(
+                plt.cm.ScalarMappable(cmap=self._cmap, norm=self._norm)
+            )
+            self._set_colorbar_ticks()
+
         # if self._hist_label_kwargs:
         #     self._set_labels(**self._hist_label_kwargs)
 
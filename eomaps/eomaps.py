@@ -5,6 +5,7 @@ import logging
 _log = logging.getLogger(__name__)
 
 from functools import lru_cache, wraps
+from collections import OrderedDict
 from itertools import repeat, chain
 import copy
 from types import SimpleNamespace
@@ -16,7 +17,7 @@ from contextlib import contextmanager, ExitStack
 
 import numpy as np
 
-from pyproj import CRS, Transformer
+from pyproj import CRS
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
@@ -69,6 +70,8 @@ from .draw import ShapeDrawer
 from .annotation_editor import AnnotationEditor
 
 from ._data_manager import DataManager
+from ._crs_registry import crs_registry
+from ._classification import get_bins, as_class_indices
 
 from ._version import __version__
 
@@ -415,6 +418,8 @@ class Maps(metaclass=_MapsMeta):
 
         self._colorbars = []
         self._coll = None  # slot for the collection created by m.plot_map()
+        # cache for the 2D grid used to shade 1D data (xorig, yorig, grid)
+        self._shade_grid_cache = None
 
         self._layer = layer
 
@@ -1458,6 +1463,10 @@ class Maps(metaclass=_MapsMeta):
             - StdMean (multiples)
             - UserDefined (bins)
 
+        For very large datasets, the bins can be evaluated from a sample of the data
+        by providing `sample_size` and `sample_method`.
+        (see `m.set_classify_specs()` for details)
+
         Examples
         --------
         >>> m.set_classify.Quantiles(k=5)
@@ -1466,6 +1475,8 @@ class Maps(metaclass=_MapsMeta):
 
         >>> m.set_classify.UserDefined(bins=[5, 10, 25, 50])
 
+        >>> m.set_classify.Quantiles(k=5, sample_size=1_000_000)
+
         """
         (mapclassify,) = register_modules("mapclassify")
 
@@ -1480,7 +1491,9 @@ class Maps(metaclass=_MapsMeta):
 
         return s
 
-    def set_classify_specs(self, scheme=None, **kwargs):
+    def set_classify_specs(
+        self, scheme=None, sample_size=None, sample_method="random", **kwargs
+    ):
         """
         Set classification specifications for the data.
 
@@ -1522,13 +1535,31 @@ class Maps(metaclass=_MapsMeta):
                 - StdMean (multiples)
                 - UserDefined (bins)
 
+        sample_size : int or None, optional
+            The max. number of values used to evaluate the classification bins.
+            For larger datasets, the bins are evaluated from a sample of the data.
+            (very slow schemes use a smaller sample size, e.g. 10k values for
+            "FisherJenks", 1k values for "MaxP" and 100k values for
+            "NaturalBreaks" and "JenksCaspall")
+            If None, all values are used (e.g. exact classification).
+            The default is None.
+        sample_method : str, optional
+            The method used to sample the data (if `sample_size` is not None).
+
+            - "random": a random sample of the data
+            - "stratified": a random value from equally sized blocks of the data
+            - "histogram": values derived from a streaming histogram of the data
+
+            The default is "random".
         kwargs :
             kwargs passed to the call to the respective mapclassify classifier
             (dependent on the selected scheme... see above)
 
         """
         register_modules("mapclassify")
-        self.classify_specs._set_scheme_and_args(scheme, **kwargs)
+        self.classify_specs._set_scheme_and_args(
+            scheme, sample_size=sample_size, sample_method=sample_method, **kwargs
+        )
 
     def set_extent_to_location(self, location, annotate=False, user_agent=None):
         """
@@ -1683,7 +1714,6 @@ class Maps(metaclass=_MapsMeta):
             0.5, 1.01, title, transform=self.ax.transAxes, layer=self.layer, **kwargs
         )
 
-    @lru_cache()
     def get_crs(self, crs="plot"):
         """
         Get the pyproj CRS instance of a given crs specification.
@@ -1709,8 +1739,8 @@ class Maps(metaclass=_MapsMeta):
             elif crs == "out" or crs == "plot":
                 crs = self.crs_plot
 
-        crs = CRS.from_user_input(crs)
-        return crs
+        # use the process-wide CRS registry to avoid repeated PROJ database queries
+        return crs_registry.get_crs(crs)
 
     @wraps(LayoutEditor.get_layout)
     def get_layout(self, *args, **kwargs):
@@ -2986,7 +3016,7 @@ class Maps(metaclass=_MapsMeta):
 
             The default is True
         assume_sorted : bool, optional
-            ONLY relevant for the shapes "raster" and "shade_raster"
+            ONLY relevant for the shapes "raster", "warped_raster" and "shade_raster"
             (and only if coordinates are provided as 1D arrays and data is a 2D array)
 
             Sort values with respect to the coordinates prior to plotting
@@ -3118,6 +3148,13 @@ class Maps(metaclass=_MapsMeta):
         self._bins = bins
         self._classified = classified
 
+        # ---------------------- encode the classified data
+
+        if not shade_q:
+            # (optionally) draw classified data from compact class-indices
+            # (see `m.classify_specs._class_indices` for details)
+            self._data_manager.set_class_indices()
+
         # ---------------------- plot the data
 
         if shade_q:
@@ -3512,7 +3549,7 @@ class Maps(metaclass=_MapsMeta):
 
                 # clear all cached background layers before saving to make sure they
                 # are re-drawn with the correct dpi-settings
-                self.BM._refetch_bg = True
+                self.BM._force_refetch_bg = True
 
                 # set the shading-axis-size to reflect the used dpi setting
                 self._update_shade_axis_size(dpi=dpi)
@@ -3628,8 +3665,8 @@ class Maps(metaclass=_MapsMeta):
         switch between the layers (e.g. once the backgrounds are cached, switching
         layers will be fast).
 
-        Note: After zooming or re-sizing the map, the cache is cleared and
-        you need to call this function again.
+        Note: After zooming or re-sizing the map, the cache of all affected layers
+        is cleared and you need to call this function again.
 
         Parameters
         ----------
@@ -3727,6 +3764,9 @@ class Maps(metaclass=_MapsMeta):
             copy_cls.set_classify_specs(
                 scheme=self.classify_specs.scheme, **self.classify_specs
             )
+            copy_cls.classify_specs._sample_size = self.classify_specs._sample_size
+            copy_cls.classify_specs._sample_method = self.classify_specs._sample_method
+            copy_cls.classify_specs._class_indices = self.classify_specs._class_indices
 
         return copy_cls
 
@@ -3789,7 +3829,7 @@ class Maps(metaclass=_MapsMeta):
         if len(args) == 0:
             # in case no argument is provided, force a complete re-draw of
             # all layers (and datasets) of the map
-            self.BM._refetch_bg = True
+            self.BM._force_refetch_bg = True
             self._data_manager.last_extent = None
         else:
             # only re-fetch the required layers
@@ -3906,6 +3946,7 @@ class Maps(metaclass=_MapsMeta):
             # clear data-specs and all cached properties of the data
             try:
                 self._coll = None
+                self._shade_grid_cache = None
                 self._data_manager.cleanup()
 
                 if hasattr(self, "tree"):
@@ -4490,27 +4531,22 @@ class Maps(metaclass=_MapsMeta):
 
         # evaluate classification
         if classify_specs is not None and classify_specs.scheme is not None:
-            (mapclassify,) = register_modules("mapclassify")
-
             classified = True
-            if self.classify_specs.scheme == "UserDefined":
-                bins = self.classify_specs.bins
-            else:
-                # use "np.ma.compressed" to make sure values excluded via
-                # masked-arrays are not used to evaluate classification levels
-                # (normal arrays are passed through!)
-                mapc = getattr(mapclassify, classify_specs.scheme)(
-                    np.ma.compressed(z_data[~np.isnan(z_data)]), **classify_specs
-                )
-                bins = mapc.bins
-
-            bins = np.unique(np.clip(bins, vmin, vmax))
 
-            if vmin < min(bins):
-                bins = [vmin, *bins]
-
-            if vmax > max(bins):
-                bins[np.argmax(bins)] = vmax
+            # if a sample-size is set, the bins are evaluated from a sample
+            # (see `m.set_classify_specs()` for details)
+            # bins are cached based on a fingerprint of the data and the
+            # classification specs to avoid re-evaluating identical classifications
+            bins, classify_specs._sample_info, hit = get_bins(
+                z_data,
+                classify_specs.scheme,
+                vmin,
+                vmax,
+                sample_size=classify_specs._sample_size,
+                sample_method=classify_specs._sample_method,
+                **classify_specs,
+            )
+            self.BM.profiler.cache("classification", hit)
 
             cbcmap = cmap
             norm = mpl.colors.BoundaryNorm(bins, cmap.N)
@@ -4570,7 +4606,8 @@ class Maps(metaclass=_MapsMeta):
                             f"({size} datapoints) but the 'datashader' library "
                             "could not be imported! The plot might take long "
                             "to finish! ... defaulting to 'ellipses' "
-                            "as plot-shape."
+                            "as plot-shape. (Use `m.set_shape.aggregate_points()` "
+                            "for a fast per-pixel aggregation of the data.)"
                         )
                         self.set_shape.ellipses()
                 else:
@@ -4822,9 +4859,9 @@ class Maps(metaclass=_MapsMeta):
         if explicit_fc and self.shape.name not in ["contour"]:
             args = dict(array=None, cmap=None, norm=None, **kwargs)
         else:
-            args = dict(
-                array=props["z_data"], cmap=self._cbcmap, norm=self._norm, **kwargs
-            )
+            # (use the colormap of the class-indices for compact classified datasets)
+            cmap, norm = self._data_manager._get_cmap_and_norm()
+            args = dict(array=props["z_data"], cmap=cmap, norm=norm, **kwargs)
 
         if (
             self.shape.name in ["contour"]
@@ -4833,7 +4870,7 @@ class Maps(metaclass=_MapsMeta):
         ):
             # if 2D data is provided for a contour plot, keep the data 2d!
             coll = self.shape.get_coll(props["xorig"], props["yorig"], "in", **args)
-        elif self.shape.name in ["raster"]:
+        elif self.shape.name in ["raster", "warped_raster"]:
             # if input-data is 1D, try to convert data to 2D (required for raster)
             # TODO make an explicit data-conversion function for 2D-only shapes
             if len(self._xshape) == 2 and len(self._yshape) == 2:
@@ -4866,6 +4903,12 @@ class Maps(metaclass=_MapsMeta):
                         if args["array"] is not None:
                             args["array"] = df.values.T
 
+                            if self._data_manager._z_class is not None:
+                                # (unstacking converts class-indices to float)
+                                args["array"] = as_class_indices(
+                                    args["array"], self._bins
+                                )
+
                         coll = self.shape.get_coll(xg, yg, "out", **args)
         else:
             # convert to 1D for further processing
@@ -4936,11 +4979,15 @@ class Maps(metaclass=_MapsMeta):
 
         # get rid of unnecessary dimensions in the numpy arrays
         zdata = zdata.squeeze()
+        if np.ma.isMaskedArray(zdata):
+            # datashader does not support masked arrays (use nan for masked values)
+            zdata = zdata.astype(np.result_type(zdata.dtype, np.float16)).filled(np.nan)
         x0 = self._data_manager.x0.squeeze()
         y0 = self._data_manager.y0.squeeze()
 
         # the shape is always set after _prepare data!
-        if self.shape.name == "shade_points" and self._data_manager.x0_1D is None:
+        if self.shape.name == "shade_points" and (zdata.shape == x0.shape == y0.shape):
+            # wrap the arrays without copying them (ravel only copies if required)
             df = pd.DataFrame(
                 dict(
                     x=x0.ravel(),
@@ -5007,38 +5054,22 @@ class Maps(metaclass=_MapsMeta):
             else:
                 # first convert 1D inputs to 2D, then reproject the grid and use
                 # a curvilinear QuadMesh to display the data
+                ix, iy, xg, yg = self._get_shade_grid()
 
-                # use pandas to convert to 2D
-                df = (
-                    pd.DataFrame(
-                        dict(
-                            x=x0.ravel(),
-                            y=y0.ravel(),
-                            val=zdata.ravel(),
-                        ),
-                        copy=False,
-                    )
-                    .set_index(["x", "y"])
-                    .to_xarray()
+                # (missing grid-cells are filled with nan)
+                val = np.full(
+                    xg.shape,
+                    np.nan,
+                    dtype=np.result_type(zdata.dtype, np.float16),
                 )
-                xg, yg = np.meshgrid(df.x, df.y)
-
-                # transform the grid from input-coordinates to the plot-coordinates
-                crs1 = CRS.from_user_input(self.data_specs.crs)
-                crs2 = CRS.from_user_input(self._crs_plot)
-                if crs1 != crs2:
-                    transformer = self._get_transformer(
-                        crs1,
-                        crs2,
-                    )
-                    xg, yg = transformer.transform(xg, yg)
+                val[iy, ix] = zdata.ravel()
 
                 # use a curvilinear QuadMesh
                 if self.shape.name == "shade_raster":
                     self.shape.glyph = ds.glyphs.QuadMeshCurvilinear("x", "y", "val")
 
                 df = xar.Dataset(
-                    data_vars=dict(val=(["xx", "yy"], df.val.values.T)),
+                    data_vars=dict(val=(["xx", "yy"], val)),
                     coords=dict(x=(["xx", "yy"], xg), y=(["xx", "yy"], yg)),
                 )
 
@@ -5081,6 +5112,10 @@ class Maps(metaclass=_MapsMeta):
             **kwargs,
         )
 
+        # avoid re-aggregating the data if the extent did not change
+        # (e.g. on layer-changes or if the background is re-fetched)
+        coll.aggregate = self._get_cached_shade_aggregate(coll)
+
         coll.set_label("Dataset " f"({self.shape.name}  |  {zdata.shape})")
 
         self._coll = coll
@@ -5093,6 +5128,92 @@ class Maps(metaclass=_MapsMeta):
         if dynamic is True:
             self.BM.update(clear=False)
 
+    def _get_shade_grid(self):
+        """
+        Get the 2D grid required to shade 1D data as a raster.
+
+        The grid is cached for the currently assigned coordinates.
+
+        Returns
+        -------
+        ix, iy : array-like
+            The column- and row-indices of the datapoints in the grid.
+        xg, yg : array-like
+            The 2D coordinates of the grid (in the plot-crs).
+
+        """
+        xorig = self._data_manager.xorig
+        yorig = self._data_manager.yorig
+
+        cache = self._shade_grid_cache
+        if cache is not None and cache[0] is xorig and cache[1] is yorig:
+            self.BM.profiler.cache("shade_grid", True)
+            return cache[2]
+
+        self.BM.profiler.cache("shade_grid", False)
+
+        # identify the (sorted) unique coordinates and the grid-index of each point
+        ux, ix = np.unique(xorig.ravel(), return_inverse=True)
+        uy, iy = np.unique(yorig.ravel(), return_inverse=True)
+        xg, yg = np.meshgrid(ux, uy)
+
+        # transform the grid from input-coordinates to the plot-coordinates
+        crs1 = CRS.from_user_input(self.data_specs.crs)
+        crs2 = CRS.from_user_input(self._crs_plot)
+        if crs1 != crs2:
+            transformer = self._get_transformer(
+                crs1,
+                crs2,
+            )
+            xg, yg = transformer.transform(xg, yg)
+
+        grid = (ix, iy, xg, yg)
+        self._shade_grid_cache = (xorig, yorig, grid)
+        return grid
+
+    def _get_cached_shade_aggregate(self, coll):
+        """
+        Wrap the aggregation of a datashader artist with a cache.
+
+        Aggregates are cached based on the visible extent and the size of the axes.
+
+        Parameters
+        ----------
+        coll : datashader.mpl_ext.DSArtist
+            The artist created by `datashader.mpl_ext.dsshow`.
+
+        Returns
+        -------
+        aggregate : callable
+            The cached aggregation function.
+
+        """
+        aggregate = coll.aggregate
+        # (aggregates have the size of the axes so only keep a few of them)
+        cache = OrderedDict()
+        cache_size = 5
+
+        @wraps(aggregate)
+        def cached_aggregate(x_range, y_range):
+            dims = coll.axes.patch.get_window_extent().bounds
+            key = (*x_range, *y_range, int(dims[2] + 0.5), int(dims[3] + 0.5))
+
+            binned = cache.get(key, None)
+            if binned is not None:
+                self.BM.profiler.cache("shade", True)
+                cache.move_to_end(key)
+                return binned
+
+            self.BM.profiler.cache("shade", False)
+            binned = aggregate(x_range, y_range)
+            cache[key] = binned
+            while len(cache) > cache_size:
+                cache.popitem(last=False)
+
+            return binned
+
+        return cached_aggregate
+
     def _encode_values(self, val):
         """
         Encode values with respect to the provided  "scale_factor" and "add_offset".
@@ -5454,22 +5575,21 @@ class Maps(metaclass=_MapsMeta):
         return cartopy_proj
 
     @staticmethod
-    @lru_cache()
     def _get_transformer(crs_from, crs_to):
-        # create a pyproj Transformer object and cache it for later use
-        return Transformer.from_crs(crs_from, crs_to, always_xy=True)
+        # get a pyproj Transformer object (cached in the CRS registry)
+        return crs_registry.get_transformer(crs_from, crs_to)
 
     @property
     def _transf_plot_to_lonlat(self):
         return self._get_transformer(
             self.crs_plot,
-            self.get_crs(self.crs_plot.as_geodetic()),
+            crs_registry.get_geodetic_crs(self.crs_plot),
         )
 
     @property
     def _transf_lonlat_to_plot(self):
         return self._get_transformer(
-            self.get_crs(self.crs_plot.as_geodetic()),
+            crs_registry.get_geodetic_crs(self.crs_plot),
             self.crs_plot,
         )
 
@@ -8,6 +8,8 @@ import numpy as np
 
 from matplotlib.collections import LineCollection
 
+from ._crs_registry import crs_registry
+
 _log = logging.getLogger(__name__)
 
 
@@ -243,7 +245,7 @@ class GridLines:
         else:
             nlon = nlat = self.auto_n
 
-        extent = self.m.get_extent(self.m.CRS.PlateCarree(globe=self.m.crs_plot.globe))
+        extent = self.m.get_extent(crs_registry.get_plate_carree(self.m.crs_plot))
 
         x0, _, y0, _ = np.max((self.bounds, extent), axis=0)
         _, x1, _, y1 = np.min((self.bounds, extent), axis=0)
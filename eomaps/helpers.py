@@ -1,7 +1,8 @@
 """a collection of useful helper-functions."""
 
 import logging
-from itertools import tee
+import os
+from itertools import tee, count
 import re
 import sys
 from itertools import chain
@@ -12,12 +13,15 @@ from functools import wraps, lru_cache
 from pathlib import Path
 import json
 import warnings
-from weakref import WeakSet
+import tempfile
+from collections import Counter
+import zlib
+from weakref import WeakSet, WeakKeyDictionary, finalize
 
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.lines import Line2D
-from matplotlib.colors import LinearSegmentedColormap, ListedColormap
+from matplotlib.colors import LinearSegmentedColormap, ListedColormap, to_rgba
 from matplotlib.transforms import Bbox, TransformedBbox
 from matplotlib.axis import XAxis, YAxis
 from matplotlib.spines import Spine
@@ -25,7 +29,9 @@ from matplotlib.spines import Spine
 _log = logging.getLogger(__name__)
 
 
-from matplotlib.backend_bases import KeyEvent
+from matplotlib.backend_bases import KeyEvent, TimerBase
+
+from ._profiler import Profiler
 
 
 def _key_release_event(canvas, key, guiEvent=None):
@@ -436,6 +442,14 @@ class SearchTree:
         if d is None:
             d = self.d
         i = None
+
+        # use the (cached) triangulation of the shape to identify the picked point
+        # (e.g. for delaunay-triangulations)
+        if k == 1 and hasattr(self._m.shape, "_pick_index"):
+            i = self._m.shape._pick_index(x, d)
+            if i is not None:
+                return i
+
         # take care of 1D coordinates and 2D data
         if self._m._data_manager.x0_1D is not None:
             if k > 1 and pick_relative_to_closest is True:
@@ -1528,6 +1542,127 @@ class LayoutEditor:
         self.m.redraw()
 
 
+class _TrackedChildren(list):
+    """
+    A list of axes-children that counts how often it has been modified.
+
+    (matplotlib only adds/removes children via ``append`` and ``remove``)
+    """
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.version = 0
+        # cached unmanaged artists (see BlitManager._get_unmanaged_artists)
+        self.unmanaged = None
+
+    def append(self, a):
+        self.version += 1
+        super().append(a)
+
+    def remove(self, a):
+        self.version += 1
+        super().remove(a)
+
+    @classmethod
+    def track(cls, ax):
+        # replace the children-list of the axes with a tracked list
+        old = ax._children
+        new = cls(old)
+        # make sure existing children are removed from the new list
+        for a in new:
+            if getattr(a, "_remove_method", None) == old.remove:
+                a._remove_method = new.remove
+        ax._children = new
+        return new
+
+
+class _BackgroundStore:
+    """
+    Second-tier storage for background-layers evicted from the BlitManager cache.
+
+    Backgrounds are stored as raw RGBA buffers that are either losslessly
+    compressed in memory (storage="compress") or spilled to memory-mapped
+    scratch-files (storage="memmap").
+    """
+
+    def __init__(self, storage="compress", directory=None, level=1):
+        if storage not in ("compress", "memmap"):
+            raise ValueError(
+                f"EOmaps: '{storage}' is not a valid background-storage. "
+                "Use one of ('compress', 'memmap')."
+            )
+
+        self.storage = storage
+        self.directory = directory
+        self.level = level
+
+        # layer: (shape, state, payload)
+        self._data = dict()
+        # make sure scratch-files are removed if the store is garbage-collected
+        self._finalizer = finalize(self, self._remove_files, self._data)
+
+    def __contains__(self, layer):
+        return layer in self._data
+
+    def __iter__(self):
+        return iter(list(self._data))
+
+    def __len__(self):
+        return len(self._data)
+
+    @staticmethod
+    def _remove_files(data):
+        for shape, state, payload in data.values():
+            if isinstance(payload, str):
+                try:
+                    os.remove(payload)
+                except OSError:
+                    pass
+        data.clear()
+
+    def put(self, layer, rgba, state):
+        """Store the RGBA-buffer (and the state) of a layer."""
+        self.pop(layer)
+
+        if self.storage == "compress":
+            payload = zlib.compress(rgba.tobytes(), self.level)
+        else:
+            fd, payload = tempfile.mkstemp(
+                prefix="eomaps_bg_", suffix=".rgba", dir=self.directory
+            )
+            os.close(fd)
+            mm = np.memmap(payload, dtype=np.uint8, mode="w+", shape=rgba.shape)
+            mm[:] = rgba
+            mm.flush()
+            del mm
+
+        self._data[layer] = (rgba.shape, state, payload)
+
+    def get(self, layer):
+        """Get (and remove) the RGBA-buffer and the state of a stored layer."""
+        shape, state, payload = self._data.pop(layer)
+
+        if self.storage == "compress":
+            rgba = np.frombuffer(zlib.decompress(payload), dtype=np.uint8)
+            rgba = rgba.reshape(shape)
+        else:
+            mm = np.memmap(payload, dtype=np.uint8, mode="r", shape=shape)
+            rgba = np.array(mm)
+            del mm
+            os.remove(payload)
+
+        return rgba, state
+
+    def pop(self, layer):
+        """Remove a layer from the store."""
+        if layer in self._data:
+            self._remove_files({layer: self._data.pop(layer)})
+
+    def clear(self):
+        """Remove all layers from the store."""
+        self._remove_files(self._data)
+
+
 # taken from https://matplotlib.org/stable/tutorials/advanced/blitting.html#class-based-example
 class BlitManager:
     """Manager used to schedule draw events, cache backgrounds, etc."""
@@ -1573,8 +1708,34 @@ class BlitManager:
         self._hidden_artists = set()
 
         self._refetch_bg = True
+        self._force_refetch_bg = False
         self._layers_to_refetch = set()
 
+        # the state (extent, size, dpi and artist-versions) for which the cached
+        # background layers were rendered (used to check if a re-fetch is required)
+        self._bg_layer_states = dict()
+        # a version-counter that is increased whenever a stale artist is re-drawn
+        self._artist_versions = WeakKeyDictionary()
+
+        # limit for the number of cached background-layers (None = unlimited)
+        # and the second-tier store for evicted layers
+        self._max_bg_layers = None
+        self._bg_layer_store = None
+        self._bg_layer_usage = dict()
+        self._bg_layer_usage_counter = count()
+        self._protected_bg_layers = set()
+
+        # opt-in instrumentation of the draw-cycle (see `m.BM.profiler`)
+        self.profiler = Profiler()
+
+        # settings for the (transformed) bitmap-preview during pan/zoom
+        self._preview_enabled = False
+        self._preview_delay = 250
+        self._preview_timer = None
+        self._preview_cid = None
+        self._preview_pending = False
+        self._skip_preview = False
+
         # TODO these activate some crude fixes for jupyter notebook and webagg
         # backends... proper fixes would be nice
         self._mpl_backend_blit_fix = any(
@@ -1611,6 +1772,17 @@ class BlitManager:
         # unmanaged artists
         self._ignored_unmanaged_artists = WeakSet()
 
+        # incrementally updated registry of managed artists
+        # (counts how often an artist is managed on any layer)
+        self._managed_artists = Counter()
+        # cached (sorted) lists of artists, cleared if managed artists change
+        self._sorted_artists_cache = dict()
+        # version-counter that is increased whenever managed artists change
+        self._registry_version = 0
+        # callback-ids and zorders of managed artists (to track zorder changes)
+        self._registry_cids = WeakKeyDictionary()
+        self._registry_zorders = WeakKeyDictionary()
+
     def _get_renderer(self):
         # don't return the renderer if the figure is saved.
         # in this case the normal draw-routines are used (see m.savefig) so there is
@@ -1879,10 +2051,101 @@ class BlitManager:
         else:
             # set any background that contains the layer for refetch
             self._layers_to_refetch.add(layer)
-            for l in self._bg_layers:
+            for l in chain(self._bg_layers, self._bg_layer_store or ()):
                 if layer in l.split("|"):
                     self._layers_to_refetch.add(l)
 
+    def _invalidate_artist_registry(self):
+        # clear cached (sorted) artist lists
+        self._sorted_artists_cache.clear()
+        self._registry_version += 1
+
+    def _register_artist(self, art):
+        # add an artist to the registry of managed artists
+        self._managed_artists[art] += 1
+
+        if art not in self._registry_cids:
+            try:
+                self._registry_zorders[art] = getattr(art, "zorder", None)
+                self._registry_cids[art] = art.add_callback(self._on_artist_changed)
+            except Exception:
+                # artist does not support callbacks or weak-references
+                pass
+
+        self._invalidate_artist_registry()
+
+    def _unregister_artist(self, art):
+        # remove an artist from the registry of managed artists
+        n = self._managed_artists[art] - 1
+        if n > 0:
+            self._managed_artists[art] = n
+        else:
+            self._managed_artists.pop(art, None)
+            self._disconnect_registry_callback(art)
+
+        self._invalidate_artist_registry()
+
+    def _disconnect_registry_callback(self, art):
+        self._registry_zorders.pop(art, None)
+        cid = self._registry_cids.pop(art, None)
+        if cid is not None:
+            try:
+                art.remove_callback(cid)
+            except Exception:
+                pass
+
+    def _rebuild_artist_registry(self):
+        # re-build the registry from the managed artists
+        # (required if artists have been removed without using
+        # `remove_bg_artist` or `remove_artist`)
+        artists = Counter(chain(*self._bg_artists.values(), *self._artists.values()))
+
+        for art in set(self._managed_artists).difference(artists):
+            self._disconnect_registry_callback(art)
+
+        self._managed_artists = Counter()
+        for art, n in artists.items():
+            for i in range(n):
+                self._register_artist(art)
+
+        self._invalidate_artist_registry()
+
+    def _on_artist_changed(self, art):
+        # callback for property-changes of managed artists
+        # (re-sort the artists if the zorder changed)
+        zorder = getattr(art, "zorder", None)
+        if self._registry_zorders.get(art, None) != zorder:
+            self._registry_zorders[art] = zorder
+            self._sorted_artists_cache.clear()
+
+    @staticmethod
+    def _get_layer_tuple(layer):
+        # convert layer-names (or lists of layer-names) to a tuple of strings
+        if isinstance(layer, (list, tuple, set, np.ndarray)):
+            return tuple(str(l) for l in layer)
+        return (str(layer),)
+
+    def _get_sorted_artists(self, kind, layers):
+        # get a (cached) sorted list of managed artists on the given layers
+        key = (kind, layers)
+        artists = self._sorted_artists_cache.get(key, None)
+        if artists is None:
+            if kind == "bg":
+                artists = (self._bg_artists.get(l, []) for l in layers)
+                sortkey = self._bg_artists_sort
+            elif kind == "dynamic":
+                artists = (self._artists.get(l, []) for l in layers)
+                sortkey = self._bg_artists_sort
+            else:
+                artists = (self._artists.get(l, []) for l in layers)
+                sortkey = self._get_artist_zorder
+
+            # make the list unique but maintain order (dicts keep order for python>3.7)
+            artists = sorted(dict.fromkeys(chain(*artists)), key=sortkey)
+            self._sorted_artists_cache[key] = artists
+
+        return artists
+
     def _bg_artists_sort(self, art):
         sortp = []
 
@@ -1912,25 +2175,19 @@ class BlitManager:
             vertical stacking (layer-order / zorder).
 
         """
-        artists = list()
-        for l in np.atleast_1d(layer):
-            # get all relevant artists for combined background layers
-            l = str(l)  # w make sure we convert non-string layer names to string!
+        layers = self._get_layer_tuple(layer)
 
-            # get artists defined on the layer itself
-            # Note: it's possible to create explicit multi-layers and attach
-            # artists that are only visible if both layers are visible! (e.g. "l1|l2")
-            artists.extend(self._bg_artists.get(l, []))
+        # Note: it's possible to create explicit multi-layers and attach
+        # artists that are only visible if both layers are visible! (e.g. "l1|l2")
+        artists = self._get_sorted_artists("bg", layers)
 
-            if l == self._unmanaged_artists_layer:
-                artists.extend(self._get_unmanaged_artists())
+        if self._unmanaged_artists_layer in layers:
+            unmanaged = self._get_unmanaged_artists()
+            if len(unmanaged) > 0:
+                # sort artists by zorder (respecting inset-map priority)
+                return sorted(chain(artists, unmanaged), key=self._bg_artists_sort)
 
-        # make the list unique but maintain order (dicts keep order for python>3.7)
-        artists = dict.fromkeys(artists)
-        # sort artists by zorder (respecting inset-map priority)
-        artists = sorted(artists, key=self._bg_artists_sort)
-
-        return artists
+        return list(artists)
 
     def get_artists(self, layer):
         """
@@ -1949,22 +2206,9 @@ class BlitManager:
 
         """
 
-        artists = list()
-        for l in np.atleast_1d(layer):
-            # get all relevant artists for combined background layers
-            l = str(l)  # w make sure we convert non-string layer names to string!
-
-            # get artists defined on the layer itself
-            # Note: it's possible to create explicit multi-layers and attach
-            # artists that are only visible if both layers are visible! (e.g. "l1|l2")
-            artists.extend(self._artists.get(l, []))
-
-        # make the list unique but maintain order (dicts keep order for python>3.7)
-        artists = dict.fromkeys(artists)
-        # sort artists by zorder (respecting inset-map priority)
-        artists = sorted(artists, key=self._bg_artists_sort)
-
-        return artists
+        # Note: it's possible to create explicit multi-layers and attach
+        # artists that are only visible if both layers are visible! (e.g. "l1|l2")
+        return list(self._get_sorted_artists("dynamic", self._get_layer_tuple(layer)))
 
     def _get_layers_alphas(self, layer=None):
         if layer is None:
@@ -1996,12 +2240,22 @@ class BlitManager:
         layers, alphas = self._get_layers_alphas(layer)
 
         # make sure all layers are already fetched
+        # (and avoid evicting them before they are combined)
+        self._protected_bg_layers.update(layers)
+        try:
+            return self._do_combine_bgs(layers, alphas)
+        finally:
+            self._protected_bg_layers.difference_update(layers)
+
+    def _do_combine_bgs(self, layers, alphas):
         for l in layers:
             if l not in self._bg_layers:
                 # execute actions on layer-changes
                 # (to make sure all lazy WMS services are properly added)
                 self._do_on_layer_change(layer=l, new=False)
                 self.fetch_bg(l)
+            else:
+                self.profiler.cache("bg_layer", True)
 
         renderer = self._get_renderer()
         # clear the renderer to avoid drawing on existing backgrounds
@@ -2035,7 +2289,130 @@ class BlitManager:
             rgba[..., -1] = (rgba[..., -1] * a).astype(rgba.dtype)
         return rgba
 
+    def set_bg_layer_cache(self, max_layers=None, storage="compress", directory=None):
+        """
+        Limit the number of background-layers that are cached in memory.
+
+        If more than `max_layers` backgrounds are cached, the least recently used
+        backgrounds are evicted to a second-tier store (the currently visible
+        layers are never evicted). Evicted backgrounds are restored on demand
+        (if the map did not change in the meantime) which is usually much faster
+        than re-drawing the layer.
+
+        Parameters
+        ----------
+        max_layers : int or None, optional
+            The max. number of background-layers to keep in memory.
+            If None, the number of cached layers is unlimited.
+            The default is None.
+        storage : str or None, optional
+            The storage used for evicted backgrounds.
+
+            - "compress": losslessly compress the backgrounds in memory (zlib)
+            - "memmap": spill the backgrounds to memory-mapped scratch-files
+            - None: don't store evicted backgrounds (e.g. re-draw if required)
+
+            The default is "compress".
+        directory : str or None, optional
+            The directory used for scratch-files (only used if storage="memmap").
+            If None, the default temporary directory is used.
+            The default is None.
+
+        Examples
+        --------
+        >>> m = Maps()
+        >>> m.BM.set_bg_layer_cache(max_layers=5, storage="memmap")
+
+        """
+        if self._bg_layer_store is not None:
+            self._bg_layer_store.clear()
+
+        self._max_bg_layers = max_layers
+        if storage is None:
+            self._bg_layer_store = None
+        else:
+            self._bg_layer_store = _BackgroundStore(storage, directory=directory)
+
+        self._evict_bg_layers()
+
+    def _touch_bg_layer(self, layer):
+        # remember the last usage of a background-layer
+        self._bg_layer_usage[layer] = next(self._bg_layer_usage_counter)
+
+    def _evict_bg_layers(self):
+        # evict the least recently used background-layers
+        if self._max_bg_layers is None:
+            return
+
+        nevict = len(self._bg_layers) - self._max_bg_layers
+        if nevict <= 0:
+            return
+
+        show_layer = self._get_showlayer_name()
+        visible = {self.bg_layer, show_layer, *show_layer.split("|")}
+        visible.update(self._protected_bg_layers)
+
+        candidates = sorted(
+            (l for l in self._bg_layers if l not in visible),
+            key=lambda l: self._bg_layer_usage.get(l, -1),
+        )
+
+        for l in candidates[:nevict]:
+            bg = self._bg_layers.pop(l)
+            state = self._bg_layer_states.pop(l, None)
+            self._bg_layer_usage.pop(l, None)
+
+            if self._bg_layer_store is None or state is None:
+                continue
+
+            # only backgrounds of the whole figure can be restored
+            x0, y0, x1, y1 = bg.get_extents()
+            if (x1 - x0, y1 - y0) != tuple(map(int, self.figure.bbox.size)):
+                continue
+
+            self._bg_layer_store.put(l, np.asarray(bg), state)
+
+        # clear combined backgrounds to release the memory of evicted layers
+        type(self)._combine_bgs.cache_clear()
+
+        _log.log(5, f"EOmaps: evicted cached backgrounds: {candidates[:nevict]}")
+
+    def _restore_bg_layer(self, layer):
+        # restore a background-layer from the second-tier store
+        # (returns True if the layer was restored, False otherwise)
+        if self._bg_layer_store is None or layer not in self._bg_layer_store:
+            return False
+
+        rgba, state = self._bg_layer_store.get(layer)
+
+        # only restore the layer if it is still valid
+        self._bg_layer_states[layer] = state
+        if rgba.shape[:2] != tuple(map(int, self.figure.bbox.size))[
+            ::-1
+        ] or not self._check_bg_layer_valid(layer):
+            self._bg_layer_states.pop(layer, None)
+            self.profiler.cache("bg_store", False)
+            return False
+
+        renderer = self._get_renderer()
+        if renderer is None:
+            self._bg_layer_states.pop(layer, None)
+            return False
+
+        renderer.clear()
+        gc = renderer.new_gc()
+        gc.set_clip_rectangle(self.figure.bbox)
+        renderer.draw_image(gc, 0, 0, rgba[::-1])
+        self._bg_layers[layer] = renderer.copy_from_bbox(self.figure.bbox)
+        gc.restore()
+
+        self.profiler.cache("bg_store", True)
+        return True
+
     def _get_background(self, layer, bbox=None, cache=False):
+        if layer not in self._bg_layers:
+            self._restore_bg_layer(layer)
+
         if layer not in self._bg_layers:
             if "|" in layer:
                 bg = self._combine_bgs(layer)
@@ -2045,13 +2422,301 @@ class BlitManager:
         else:
             bg = self._bg_layers[layer]
 
-        if cache is True:
+        if cache is True and layer not in self._bg_layers:
             # explicitly cache the layer
             # (for peek-layer callbacks to avoid re-fetching the layers all the time)
             self._bg_layers[layer] = bg
+            self._bg_layer_states[layer] = tuple(
+                self._bg_layer_states.get(l, None)
+                for l in self._get_layers_alphas(layer)[0]
+            )
+            self._evict_bg_layers()
 
+        self._touch_bg_layer(layer)
         return bg
 
+    def _get_fetch_bg_artists(self, layer):
+        # get all relevant artists to plot for a given (single) layer
+        # self.get_bg_artists() already returns artists sorted by zorder!
+        if layer in ["__SPINES__", "__BG__", "__inset___SPINES__"]:
+            # avoid fetching artists from the "all" layer for private layers
+            return self.get_bg_artists(layer)
+        elif layer.startswith("__inset"):
+            return self.get_bg_artists(["__inset_all", layer])
+        else:
+            return self.get_bg_artists(["all", layer])
+
+    def _get_layer_state(self, layer, artists=None):
+        """
+        Get the state for which the background of a layer is rendered.
+
+        The state consists of the figure-size, the dpi, the extent and position
+        of all axes that contain artists of the layer and the versions of
+        all artists of the layer. If the state of a layer did not change, the
+        cached background can be re-used.
+
+        Parameters
+        ----------
+        layer : str
+            The layer-name (combined layers "A|B" are supported).
+        artists : list, optional
+            The artists of the layer. If None, they are evaluated.
+            The default is None.
+
+        Returns
+        -------
+        state : tuple
+            A hashable representation of the layer-state.
+
+        """
+        if "|" in layer:
+            layers, _ = self._get_layers_alphas(layer)
+            return tuple(self._get_layer_state(l) for l in layers)
+
+        if artists is None:
+            artists = self._get_fetch_bg_artists(layer)
+
+        axes, versions = dict(), list()
+        for a in artists:
+            ax = a if isinstance(a, plt.Axes) else getattr(a, "axes", None)
+            if ax is not None:
+                axes[id(ax)] = ax
+            versions.append((id(a), self._artist_versions.get(a, 0)))
+
+        axes_state = tuple(
+            (key, tuple(ax.viewLim.bounds), tuple(ax.bbox.bounds))
+            for key, ax in sorted(axes.items(), key=lambda x: x[0])
+        )
+
+        return (
+            tuple(self.figure.bbox.bounds),
+            self.figure.dpi,
+            axes_state,
+            tuple(versions),
+        )
+
+    def _check_bg_layer_valid(self, layer):
+        # check if the cached background of a layer can be re-used
+        state = self._bg_layer_states.get(layer, None)
+        if state is None:
+            return False
+
+        if "|" in layer:
+            layers, _ = self._get_layers_alphas(layer)
+            return all(self._check_bg_layer_valid(l) for l in layers) and (
+                state == tuple(self._bg_layer_states.get(l, None) for l in layers)
+            )
+
+        artists = self._get_fetch_bg_artists(layer)
+        if any(a.stale for a in artists if a not in self._hidden_artists):
+            return False
+
+        return state == self._get_layer_state(layer, artists=artists)
+
+    def _invalidate_bg_layers(self):
+        # remove all cached backgrounds whose state has changed since they have
+        # been fetched (backgrounds of unaffected layers are kept)
+        invalid = [l for l in self._bg_layers if not self._check_bg_layer_valid(l)]
+
+        for l in invalid:
+            self._bg_layers.pop(l, None)
+            self._bg_layer_states.pop(l, None)
+
+        # remove states of layers that are no longer cached
+        for l in set(self._bg_layer_states).difference(self._bg_layers):
+            self._bg_layer_states.pop(l, None)
+
+        if len(invalid) > 0:
+            type(self)._combine_bgs.cache_clear()  # clear combined_bg cache
+
+        _log.log(5, f"EOmaps: invalidated cached backgrounds: {invalid}")
+
+    def set_interactive_preview(self, enable=True, delay=250):
+        """
+        Show a transformed bitmap-preview of the map during pan/zoom.
+
+        If enabled, the last cached background is scaled and translated to the
+        new extent while panning/zooming the map (instead of re-drawing all
+        artists on each step). The background is re-drawn once the mouse-button
+        is released or if the extent did not change for `delay` milliseconds.
+
+        Note
+        ----
+        The preview is only available for interactive backends
+        (e.g. for non-interactive backends the map is always re-drawn).
+
+        Parameters
+        ----------
+        enable : bool, optional
+            Enable (True) or disable (False) the preview.
+            The default is True.
+        delay : int, optional
+            The delay (in milliseconds) after which the background is re-drawn
+            if the extent of the map did not change.
+            The default is 250.
+
+        Examples
+        --------
+        >>> m = Maps()
+        >>> m.add_feature.preset.coastline()
+        >>> m.BM.set_interactive_preview(True, delay=500)
+
+        """
+        self._preview_enabled = enable
+        self._preview_delay = delay
+
+        if self._preview_timer is not None:
+            self._preview_timer.stop()
+            self._preview_timer.interval = delay
+
+        if enable is True:
+            if self._preview_cid is None:
+                self._preview_cid = self.canvas.mpl_connect(
+                    "button_release_event", self._on_preview_release
+                )
+        else:
+            if self._preview_cid is not None:
+                self.canvas.mpl_disconnect(self._preview_cid)
+                self._preview_cid = None
+
+            if self._preview_pending:
+                self._finish_preview()
+
+    def _get_preview_timer(self):
+        if self._preview_timer is None:
+            timer = self.canvas.new_timer(interval=self._preview_delay)
+            if type(timer) is TimerBase:
+                # non-interactive backends don't provide functional timers
+                return None
+
+            timer.single_shot = True
+            timer.add_callback(self._finish_preview)
+            self._preview_timer = timer
+
+        return self._preview_timer
+
+    def _finish_preview(self):
+        # trigger a re-draw of the backgrounds that have been previewed
+        if self._preview_timer is not None:
+            self._preview_timer.stop()
+
+        self._preview_pending = False
+        self._skip_preview = True
+        self.canvas.draw_idle()
+
+    def _on_preview_release(self, event):
+        if self._preview_pending:
+            self._finish_preview()
+
+    @staticmethod
+    def _get_preview_transforms(old_states, new_states):
+        # identify the axes whose extent changed
+        # (returns None if the preview can not be created by transforming the
+        # background, e.g. if the figure size or the artists have changed)
+        transforms = dict()
+        for old, new in zip(old_states, new_states):
+            # figure-bbox, dpi and artist-versions
+            if old[0] != new[0] or old[1] != new[1] or old[3] != new[3]:
+                return None
+
+            if len(old[2]) != len(new[2]):
+                return None
+
+            for (o_id, o_view, o_bbox), (n_id, n_view, n_bbox) in zip(old[2], new[2]):
+                if o_id != n_id or o_bbox != n_bbox:
+                    return None
+                if o_view != n_view:
+                    transforms[o_id] = (o_view, n_view, n_bbox)
+
+        return transforms
+
+    @staticmethod
+    def _get_preview_index(pixels, p0, size, old_start, old_size, new_start, new_size):
+        # get the (nearest) pixel-index in the old view that corresponds to the
+        # center of the provided pixels in the new view
+        vals = new_start + (pixels + 0.5 - p0) / size * new_size
+        return np.floor(p0 + (vals - old_start) / old_size * size).astype(int)
+
+    def _get_preview_background(self, bg, transforms):
+        # create a background by transforming the axes-regions of a cached
+        # background to the current extent of the axes
+        renderer = self._get_renderer()
+        if renderer is None:
+            return None
+
+        x = bg.get_extents()
+        ncols, nrows = x[2] - x[0], x[3] - x[1]
+        rgba = np.frombuffer(bg, dtype=np.uint8).reshape((nrows, ncols, 4))[::-1]
+        out = rgba.copy()
+
+        facecolor = (np.array(to_rgba(self.figure.get_facecolor())) * 255).astype(
+            np.uint8
+        )
+
+        for o_view, n_view, (x0, y0, w, h) in transforms.values():
+            c0, c1 = max(int(np.ceil(x0)), 0), min(int(np.floor(x0 + w)), ncols)
+            r0, r1 = max(int(np.ceil(y0)), 0), min(int(np.floor(y0 + h)), nrows)
+            if c1 <= c0 or r1 <= r0:
+                continue
+
+            cols = self._get_preview_index(
+                np.arange(c0, c1), x0, w, o_view[0], o_view[2], n_view[0], n_view[2]
+            )
+            rows = self._get_preview_index(
+                np.arange(r0, r1), y0, h, o_view[1], o_view[3], n_view[1], n_view[3]
+            )
+
+            region = rgba[np.ix_(rows.clip(r0, r1 - 1), cols.clip(c0, c1 - 1))]
+            region[(rows < r0) | (rows >= r1)] = facecolor
+            region[:, (cols < c0) | (cols >= c1)] = facecolor
+
+            out[r0:r1, c0:c1] = region
+
+        renderer.clear()
+        gc = renderer.new_gc()
+        gc.set_clip_rectangle(self.figure.bbox)
+        renderer.draw_image(gc, int(x[0]), int(x[1]), out)
+        preview = renderer.copy_from_bbox(self.figure.bbox)
+        gc.restore()
+
+        return preview
+
+    def _show_preview(self):
+        # show a transformed bitmap-preview of the cached background
+        # (returns False if no preview could be created)
+        timer = self._get_preview_timer()
+        if timer is None:
+            return False
+
+        show_layer = self._get_showlayer_name()
+        layers, _ = self._get_layers_alphas(show_layer)
+
+        if not all(l in self._bg_layers and l in self._bg_layer_states for l in layers):
+            return False
+
+        transforms = self._get_preview_transforms(
+            [self._bg_layer_states[l] for l in layers],
+            [self._get_layer_state(l) for l in layers],
+        )
+        if not transforms:
+            return False
+
+        preview = self._get_preview_background(
+            self._get_background(show_layer), transforms
+        )
+        if preview is None:
+            return False
+
+        self.canvas.restore_region(preview)
+        self._draw_animated()
+        self.canvas.blit(self.figure.bbox)
+
+        # (re-)start the timer to trigger the re-draw of the background
+        self._preview_pending = True
+        timer.stop()
+        timer.start()
+        return True
+
     def _do_fetch_bg(self, layer, bbox=None):
         cv = self.canvas
         renderer = self._get_renderer()
@@ -2082,19 +2747,12 @@ class BlitManager:
 
             # execute actions before fetching new artists
             # (e.g. update data based on extent etc.)
-            for action in self._before_fetch_bg_actions:
-                action(layer=layer, bbox=bbox)
+            with self.profiler.stage("before_fetch_bg"):
+                for action in self._before_fetch_bg_actions:
+                    action(layer=layer, bbox=bbox)
 
             # get all relevant artists to plot and remember zorders
-            # self.get_bg_artists() already returns artists sorted by zorder!
-            if layer in ["__SPINES__", "__BG__", "__inset___SPINES__"]:
-                # avoid fetching artists from the "all" layer for private layers
-                allartists = self.get_bg_artists(layer)
-            else:
-                if layer.startswith("__inset"):
-                    allartists = self.get_bg_artists(["__inset_all", layer])
-                else:
-                    allartists = self.get_bg_artists(["all", layer])
+            allartists = self._get_fetch_bg_artists(layer)
 
             # check if all artists are not stale
             no_stale_artists = all(not art.stale for art in allartists)
@@ -2107,9 +2765,27 @@ class BlitManager:
                 if not self._m.parent._layout_editor._modifier_pressed:
                     for art in allartists:
                         if art not in self._hidden_artists:
-                            art.draw(renderer)
+                            if art.stale:
+                                self._bump_artist_version(art)
+                            with self.profiler.artist(art):
+                                art.draw(renderer)
                             art.stale = False
                     self._bg_layers[layer] = renderer.copy_from_bbox(bbox)
+                    self._bg_layer_states[layer] = self._get_layer_state(
+                        layer, artists=allartists
+                    )
+
+    def _bump_artist_version(self, art):
+        # increase the version of an artist that is re-drawn while stale
+        # (to identify other cached backgrounds that contain the artist)
+        try:
+            self._artist_versions[art] = self._artist_versions.get(art, 0) + 1
+        except TypeError:
+            # artist can not be weak-referenced
+            return
+
+        # check if other cached backgrounds need a re-fetch on the next draw
+        self._refetch_bg = True
 
     def fetch_bg(self, layer=None, bbox=None):
         """
@@ -2133,14 +2809,22 @@ class BlitManager:
         if layer is None:
             layer = self.bg_layer
 
-        if layer in self._bg_layers:
+        if layer in self._bg_layers or self._restore_bg_layer(layer):
             # don't re-fetch existing layers
             # (layers get cleared automatically if re-draw is necessary)
+            self._touch_bg_layer(layer)
+            self.profiler.cache("bg_layer", True)
             return
 
-        with self._disconnect_draw():
+        if "|" not in layer:
+            # (combined layers are recorded by the individual sub-layers)
+            self.profiler.cache("bg_layer", False)
+        with self._disconnect_draw(), self.profiler.stage("fetch_bg"):
             self._do_fetch_bg(layer, bbox)
 
+        self._touch_bg_layer(layer)
+        self._evict_bg_layers()
+
     @contextmanager
     def _disconnect_draw(self):
         try:
@@ -2182,42 +2866,68 @@ class BlitManager:
             if event.canvas != cv:
                 raise RuntimeError
         try:
-            # reset all background-layers and re-fetch the default one
-            if self._refetch_bg:
-                self._bg_layers.clear()
-                self._layers_to_refetch.clear()
-                self._refetch_bg = False
-                type(self)._combine_bgs.cache_clear()  # clear combined_bg cache
-
-            else:
-                # in case there is a stale (unmanaged) artists and the
-                # stale-artist layer is attempted to be drawn, re-draw the
-                # cached background for the unmanaged-artists layer
-                if self._unmanaged_artists_layer in self._bg_layer.split("|") and any(
-                    a.stale for a in self._get_unmanaged_artists()
+            with self.profiler.stage("on_draw"):
+                # show a transformed bitmap-preview during pan/zoom
+                if (
+                    self._preview_enabled
+                    and self._refetch_bg
+                    and not self._force_refetch_bg
                 ):
-                    self._refetch_layer(self._unmanaged_artists_layer)
-                    type(self)._combine_bgs.cache_clear()  # clear combined_bg cache
-
-                # remove all cached backgrounds that were tagged for refetch
-                while len(self._layers_to_refetch) > 0:
-                    self._bg_layers.pop(self._layers_to_refetch.pop(), None)
+                    if self._skip_preview:
+                        self._skip_preview = False
+                    elif self._show_preview():
+                        return
+
+                # reset all background-layers and re-fetch the default one
+                if self._force_refetch_bg:
+                    self._bg_layers.clear()
+                    self._bg_layer_states.clear()
+                    if self._bg_layer_store is not None:
+                        self._bg_layer_store.clear()
+                    self._layers_to_refetch.clear()
+                    self._refetch_bg = False
+                    self._force_refetch_bg = False
                     type(self)._combine_bgs.cache_clear()  # clear combined_bg cache
 
-            # workaround for nbagg backend to avoid glitches
-            # it's slow but at least it works...
-            # check progress of the following issuse
-            # https://github.com/matplotlib/matplotlib/issues/19116
-            if self._mpl_backend_blit_fix:
-                self.update()
-            else:
-                self.update(blit=False)
+                else:
+                    # only reset background-layers whose state has changed
+                    # (e.g. layers whose axes-extent changed)
+                    if self._refetch_bg:
+                        self._refetch_bg = False
+                        self._invalidate_bg_layers()
+
+                    # in case there is a stale (unmanaged) artists and the
+                    # stale-artist layer is attempted to be drawn, re-draw the
+                    # cached background for the unmanaged-artists layer
+                    if self._unmanaged_artists_layer in self._bg_layer.split(
+                        "|"
+                    ) and any(a.stale for a in self._get_unmanaged_artists()):
+                        self._refetch_layer(self._unmanaged_artists_layer)
+                        type(self)._combine_bgs.cache_clear()  # clear combined_bg cache
+
+                    # remove all cached backgrounds that were tagged for refetch
+                    while len(self._layers_to_refetch) > 0:
+                        l = self._layers_to_refetch.pop()
+                        self._bg_layers.pop(l, None)
+                        self._bg_layer_states.pop(l, None)
+                        if self._bg_layer_store is not None:
+                            self._bg_layer_store.pop(l)
+                        type(self)._combine_bgs.cache_clear()  # clear combined_bg cache
+
+                # workaround for nbagg backend to avoid glitches
+                # it's slow but at least it works...
+                # check progress of the following issuse
+                # https://github.com/matplotlib/matplotlib/issues/19116
+                if self._mpl_backend_blit_fix:
+                    self.update()
+                else:
+                    self.update(blit=False)
 
-            # re-draw indicator-shapes of active drawer
-            # (to show indicators during zoom-events)
-            active_drawer = getattr(self._m.parent, "_active_drawer", None)
-            if active_drawer is not None:
-                active_drawer.redraw(blit=False)
+                # re-draw indicator-shapes of active drawer
+                # (to show indicators during zoom-events)
+                active_drawer = getattr(self._m.parent, "_active_drawer", None)
+                if active_drawer is not None:
+                    active_drawer.redraw(blit=False)
 
         except Exception:
             # we need to catch exceptions since QT does not like them...
@@ -2262,6 +2972,7 @@ class BlitManager:
         else:
             art.set_animated(True)
             self._artists[layer].append(art)
+            self._register_artist(art)
 
             if isinstance(art, plt.Axes):
                 self._managed_axes.add(art)
@@ -2310,6 +3021,7 @@ class BlitManager:
 
         art.set_animated(True)
         self._bg_artists.setdefault(layer, []).append(art)
+        self._register_artist(art)
 
         if isinstance(art, plt.Axes):
             self._managed_axes.add(art)
@@ -2360,6 +3072,7 @@ class BlitManager:
                 if art in val:
                     art.set_animated(False)
                     val.remove(art)
+                    self._unregister_artist(art)
 
                     # remove axes from the managed_axes set as well!
                     if art in self._managed_axes:
@@ -2374,6 +3087,7 @@ class BlitManager:
             if art in self._bg_artists[layer]:
                 art.set_animated(False)
                 self._bg_artists[layer].remove(art)
+                self._unregister_artist(art)
 
                 # remove axes from the managed_axes set as well!
                 if art in self._managed_axes:
@@ -2414,6 +3128,7 @@ class BlitManager:
                 if art in layerartists:
                     art.set_animated(False)
                     layerartists.remove(art)
+                    self._unregister_artist(art)
 
                     # remove axes from the managed_axes set as well!
                     if art in self._managed_axes:
@@ -2423,6 +3138,7 @@ class BlitManager:
             if art in self._artists.get(layer, []):
                 art.set_animated(False)
                 self._artists[layer].remove(art)
+                self._unregister_artist(art)
 
                 # remove axes from the managed_axes set as well!
                 if art in self._managed_axes:
@@ -2482,8 +3198,7 @@ class BlitManager:
         # redraw artists from the selected layers and explicitly provided artists
         # (sorted by zorder for each layer)
         layer_artists = list(
-            sorted(self._artists.get(layer, []), key=self._get_artist_zorder)
-            for layer in layers
+            self._get_sorted_artists("zorder", (layer,)) for layer in layers
         )
 
         with ExitStack() as stack:
@@ -2500,35 +3215,35 @@ class BlitManager:
     def _get_unmanaged_artists(self):
         # return all artists not explicitly managed by the blit-manager
         # (e.g. any artist added via cartopy or matplotlib functions)
-        managed_artists = set(
-            chain(
-                *self._bg_artists.values(),
-                *self._artists.values(),
-                self._ignored_unmanaged_artists,
-            )
-        )
+        managed = self._managed_artists
+        ignored = self._ignored_unmanaged_artists
 
         axes = {m.ax for m in (self._m, *self._m._children) if m.ax is not None}
 
         allartists = set()
         for ax in axes:
-            # only include axes titles if they are actually set
-            # (otherwise empty artists appear in the widget)
-            titles = [
-                i
-                for i in (ax.title, ax._left_title, ax._right_title)
-                if len(i.get_text()) > 0
-            ]
+            # re-evaluate the children of the axes only if they changed
+            # (the list is replaced if the axes is cleared)
+            children = ax._children
+            if not isinstance(children, _TrackedChildren):
+                children = _TrackedChildren.track(ax)
+            key = (self._registry_version, children.version)
 
-            axartists = {
-                *ax._children,
-                *titles,
-                *([ax.legend_] if ax.legend_ is not None else []),
-            }
+            if children.unmanaged is None or children.unmanaged[0] != key:
+                children.unmanaged = (key, {a for a in children if a not in managed})
 
-            allartists.update(axartists)
+            allartists.update(a for a in children.unmanaged[1] if a not in ignored)
 
-        return allartists.difference(managed_artists)
+            # only include axes titles if they are actually set
+            # (otherwise empty artists appear in the widget)
+            for a in (ax.title, ax._left_title, ax._right_title, ax.legend_):
+                if a is None or a in managed or a in ignored:
+                    continue
+                if isinstance(a, plt.Text) and len(a.get_text()) == 0:
+                    continue
+                allartists.add(a)
+
+        return allartists
 
     def _clear_temp_artists(self, method, forward=True):
         # clear artists from connected methods
@@ -2635,67 +3350,69 @@ class BlitManager:
             # don't update during layout-editing
             return
 
-        cv = self.canvas
+        with self.profiler.stage("update"):
+            cv = self.canvas
 
-        if bg_layer is None:
-            bg_layer = self.bg_layer
+            if bg_layer is None:
+                bg_layer = self.bg_layer
 
-        for action in self._before_update_actions:
-            action()
+            for action in self._before_update_actions:
+                action()
 
-        if clear:
-            self._clear_temp_artists(clear)
+            if clear:
+                self._clear_temp_artists(clear)
 
-        # restore the background
-        # add additional layers (background, spines etc.)
-        show_layer = self._get_showlayer_name()
+            # restore the background
+            # add additional layers (background, spines etc.)
+            show_layer = self._get_showlayer_name()
 
-        if show_layer not in self._bg_layers:
-            # make sure the background is properly fetched
-            self.fetch_bg(show_layer)
+            if show_layer not in self._bg_layers:
+                # make sure the background is properly fetched
+                self.fetch_bg(show_layer)
 
-        cv.restore_region(self._get_background(show_layer))
+            cv.restore_region(self._get_background(show_layer))
 
-        # execute after restore actions (e.g. peek layer callbacks)
-        while len(self._after_restore_actions) > 0:
-            action = self._after_restore_actions.pop(0)
-            action()
+            # execute after restore actions (e.g. peek layer callbacks)
+            while len(self._after_restore_actions) > 0:
+                action = self._after_restore_actions.pop(0)
+                action()
 
-        # draw all of the animated artists
-        self._draw_animated(layers=layers, artists=artists)
-        if blit:
-            # workaround for nbagg backend to avoid glitches
-            # it's slow but at least it works...
-            # check progress of the following issuse
-            # https://github.com/matplotlib/matplotlib/issues/19116
-            if self._mpl_backend_force_full:
-                cv._force_full = True
+            # draw all of the animated artists
+            with self.profiler.stage("draw_animated"):
+                self._draw_animated(layers=layers, artists=artists)
+            if blit:
+                # workaround for nbagg backend to avoid glitches
+                # it's slow but at least it works...
+                # check progress of the following issuse
+                # https://github.com/matplotlib/matplotlib/issues/19116
+                if self._mpl_backend_force_full:
+                    cv._force_full = True
 
-            if bbox_bounds is not None:
+                if bbox_bounds is not None:
 
-                class bbox:
-                    bounds = bbox_bounds
+                    class bbox:
+                        bounds = bbox_bounds
 
-                cv.blit(bbox)
-            else:
-                # update the GUI state
-                cv.blit(self.figure.bbox)
+                    cv.blit(bbox)
+                else:
+                    # update the GUI state
+                    cv.blit(self.figure.bbox)
 
-        # execute all actions registered to be called after blitting
-        while len(self._after_update_actions) > 0:
-            action = self._after_update_actions.pop(0)
-            action()
+            # execute all actions registered to be called after blitting
+            while len(self._after_update_actions) > 0:
+                action = self._after_update_actions.pop(0)
+                action()
 
-        # let the GUI event loop process anything it has to do
-        # don't do this! it is causing infinite loops
-        # cv.flush_events()
+            # let the GUI event loop process anything it has to do
+            # don't do this! it is causing infinite loops
+            # cv.flush_events()
 
-        if (
-            blit
-            and not getattr(self._m, "_snapshotting", False)
-            and BlitManager._snapshot_on_update is True
-        ):
-            self._m.snapshot(clear=True)
+            if (
+                blit
+                and not getattr(self._m, "_snapshotting", False)
+                and BlitManager._snapshot_on_update is True
+            ):
+                self._m.snapshot(clear=True)
 
     def blit_artists(self, artists, bg="active", blit=True):
         """
@@ -2818,6 +3535,7 @@ class BlitManager:
                 _log.debug(f"EOmaps-cleanup: Problem while clearing bg artist:\n {a}")
 
         del self._bg_artists[layer]
+        self._rebuild_artist_registry()
 
     def _cleanup_artists(self, layer):
         if layer not in self._artists:
@@ -2837,12 +3555,17 @@ class BlitManager:
                 )
 
         del self._artists[layer]
+        self._rebuild_artist_registry()
 
     def _cleanup_bg_layers(self, layer):
         try:
             # remove cached background-layers
             if layer in self._bg_layers:
                 del self._bg_layers[layer]
+            self._bg_layer_states.pop(layer, None)
+            self._bg_layer_usage.pop(layer, None)
+            if self._bg_layer_store is not None:
+                self._bg_layer_store.pop(layer)
         except Exception:
             _log.debug(
                 "EOmaps-cleanup: Problem while clearing cached background layers"
@@ -503,7 +503,7 @@ class MapsGrid:
 
         # clear all cached background layers before saving to make sure they
         # are re-drawn with the correct dpi-settings
-        self.parent.BM._refetch_bg = True
+        self.parent.BM._force_refetch_bg = True
 
         self.parent.savefig(*args, **kwargs)
 
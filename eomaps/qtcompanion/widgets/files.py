@@ -31,6 +31,13 @@ def _none_or_val(val):
         return val
 
 
+def _none_or_float(val):
+    if val == "None":
+        return None
+    else:
+        return float(val)
+
+
 def _identify_radius(r):
     r = r.replace(" ", "")
     try:
@@ -170,6 +177,7 @@ class ShapeSelector(QtWidgets.QFrame):
         mask_radius=_none_or_val,
         radius=_identify_radius,
         n=_none_or_val,
+        size=_none_or_float,
     )
 
     _argtypes = dict(
@@ -181,6 +189,8 @@ class ShapeSelector(QtWidgets.QFrame):
         mask_radius=(float,),
         flat=(str_to_bool,),
         aggregator=(str,),
+        pixel_size=(float,),
+        size_crs=(int, str),
     )
 
     def __init__(self, *args, m=None, default_shape="shade_raster", **kwargs):
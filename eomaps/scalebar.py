@@ -14,6 +14,7 @@ from matplotlib.font_manager import FontProperties
 from matplotlib.colors import to_hex
 
 from .helpers import pairwise
+from ._crs_registry import crs_registry
 
 _picked_scalebars = set()
 
@@ -238,7 +239,7 @@ class ScaleBar:
         self._set_line_props(**(line_props if line_props else {}))
 
         # cache geod from plot_crs
-        self._geod = self._m.crs_plot.get_geod()
+        self._geod = crs_registry.get_geod(self._m.crs_plot)
         # cache renderer
         self._renderer = None
 
@@ -1,21 +1,137 @@
 """Plot shape classes (for data visualization)."""
 
 import logging
+import warnings
 from functools import partial, wraps
 from contextlib import contextmanager, ExitStack
 
-from matplotlib.collections import PolyCollection, QuadMesh, TriMesh
+from collections import OrderedDict
+from itertools import chain
+from threading import Thread
+from concurrent.futures import ThreadPoolExecutor
+from collections.abc import Sequence
+
+from matplotlib.collections import PolyCollection, QuadMesh, TriMesh, PathCollection
 from matplotlib.tri import Triangulation
+from matplotlib.contour import ContourSet
 from matplotlib.collections import Collection
+from matplotlib.path import Path
+from matplotlib.image import AxesImage
+from matplotlib.markers import MarkerStyle
+from matplotlib.colors import Normalize, LogNorm
+from matplotlib.ticker import MaxNLocator, LogLocator
+from matplotlib.transforms import IdentityTransform, AffineDeltaTransform
+from matplotlib.backend_bases import TimerBase
 
-from pyproj import CRS
 import numpy as np
 
 from .helpers import register_modules
+from ._crs_registry import crs_registry
+from ._lut import supports_lut, get_lut, apply_lut
 
 _log = logging.getLogger(__name__)
 
 
+class _PathSequence(Sequence):
+    """
+    A lazy sequence of polygon-paths defined by a contiguous (N, n, 2) array.
+
+    Paths are only created on access (e.g. while drawing) so that no per-polygon
+    Python objects need to be kept in memory.
+    """
+
+    def __init__(self, verts, closed=True):
+        verts = np.asarray(verts, dtype=float)
+
+        if closed:
+            # add the first vertex to close the polygons
+            verts = np.concatenate((verts, verts[:, :1]), axis=1)
+            codes = np.full(verts.shape[1], Path.LINETO, dtype=Path.code_type)
+            codes[0] = Path.MOVETO
+            codes[-1] = Path.CLOSEPOLY
+        else:
+            codes = None
+
+        self._verts = verts
+        self._codes = codes
+
+    def __len__(self):
+        return len(self._verts)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+
+        return Path._fast_from_codes_and_verts(self._verts[i], self._codes)
+
+
+class _PolyCollection(PolyCollection):
+    """
+    A PolyCollection that keeps vertices in a single contiguous array.
+
+    If the vertices are provided as a (N, n, 2) numpy-array, the polygons are
+    stored as a lazy sequence of paths (instead of a list of Path objects).
+    """
+
+    def set_verts(self, verts, closed=True):
+        if (
+            isinstance(verts, np.ndarray)
+            and not np.ma.isMaskedArray(verts)
+            and verts.ndim == 3
+        ):
+            self._paths = _PathSequence(verts, closed=closed)
+            self.stale = True
+        else:
+            super().set_verts(verts, closed=closed)
+
+    set_paths = set_verts
+
+
+class _LutImage(AxesImage):
+    """
+    An AxesImage that colors integer data with a lookup-table.
+
+    The data-values are kept on the artist (e.g. `.get_array()` returns the
+    integer data) and the colors are evaluated from the lookup-table of the
+    current colormap and normalization on each draw.
+
+    Parameters
+    ----------
+    get_lut : callable
+        A function `get_lut(cmap, norm, dtype)` that returns the (cached)
+        lookup-table of an integer domain (see `eomaps._lut.get_lut`).
+    kwargs :
+        Additional kwargs passed to `AxesImage`.
+
+    """
+
+    def __init__(self, ax, get_lut, **kwargs):
+        super().__init__(ax, **kwargs)
+        self._get_lut = get_lut
+
+    def _get_rgba(self):
+        # get the RGBA colors of the data (or None if no lookup-table can be used)
+        A = self._A
+        if A is None or A.ndim != 2 or not supports_lut(A):
+            return None
+
+        self.norm.autoscale_None(A)
+        return apply_lut(self._get_lut(self.cmap, self.norm, A.dtype), A)
+
+    def make_image(self, renderer, magnification=1.0, unsampled=False):
+        # docstring inherited
+        rgba = self._get_rgba()
+        if rgba is None:
+            return super().make_image(renderer, magnification, unsampled)
+
+        # draw the colors instead of the data-values
+        A, self._A = self._A, rgba
+        try:
+            return super().make_image(renderer, magnification, unsampled)
+        finally:
+            self._A = A
+
+
 class _CollectionAccessor:
     """
     Accessor class to handle contours drawn by plt.contour.
@@ -131,6 +247,14 @@ class Shapes(object):
 
         >>> m.set_shape.geod_circles(radius)
 
+        - Level-of-detail dependent shapes (points/image if zoomed out)
+
+        >>> m.set_shape.auto_lod(shape, image_threshold, points_threshold)
+
+        - Rasters (warped to the screen-pixels)
+
+        >>> m.set_shape.warped_raster(method)
+
         - Voronoi diagram
 
         >>> m.set_shape.voronoi_diagram(masked, mask_radius)
@@ -139,6 +263,14 @@ class Shapes(object):
 
         >>> m.set_shape.delaunay_triangulation(masked, mask_radius, mask_radius_crs, flat)
 
+        - Hexagonal binning
+
+        >>> m.set_shape.hexbin(size, size_crs, aggregator, pixel_size)
+
+        - Point-based aggregation (without datashader)
+
+        >>> m.set_shape.aggregate_points(aggregator, pixel_size)
+
         - Point-based shading
 
         >>> m.set_shape.shade_points(aggregator, shade_hook, agg_hook)
@@ -153,6 +285,34 @@ class Shapes(object):
         The number of datapoints to use for estimating the radius of a shape.
         (only relevant if the radius is not specified explicitly.)
         The default is 100000
+    _lod_vertex_budget : int or None
+        The max. number of polygon-vertices to use for "ellipses", "rectangles" and
+        "geod_circles" if the number of intermediate points is not specified
+        explicitly (e.g. if n=None).
+
+        The number of intermediate points is then evaluated on each re-draw of
+        the data based on the on-screen size of the shapes (e.g. shapes that are
+        smaller than a few pixels are drawn with 4 vertices).
+        If None, the number of intermediate points depends only on the data-size.
+        The default is 5000000
+    _lod_pixel_spacing : float
+        The desired spacing (in pixels) of the intermediate points on the
+        boundary of the shapes. (only relevant if `_lod_vertex_budget` is not None)
+        The default is 3
+    _lod_sample_size : int
+        The number of datapoints to use for estimating the on-screen size of the
+        shapes. (only relevant if `_lod_vertex_budget` is not None)
+        The default is 1000
+    _chunk_size : int or None
+        The number of datapoints that are processed at once when calculating the
+        vertices of "ellipses", "rectangles" and "geod_circles".
+        Chunks are processed in parallel (on a thread-pool) and the vertices are
+        assembled afterwards. If None, all datapoints are processed at once.
+        The default is 100000
+    _n_workers : int or None
+        The max. number of threads used to process the chunks.
+        If None, the default of `concurrent.futures.ThreadPoolExecutor` is used.
+        The default is None
 
     """
 
@@ -163,6 +323,8 @@ class Shapes(object):
         "raster",
         "voronoi_diagram",
         "delaunay_triangulation",
+        "hexbin",
+        "aggregate_points",
         "shade_points",
         "shade_raster",
     ]
@@ -171,6 +333,13 @@ class Shapes(object):
         self._m = m
         self._radius_estimation_range = 100000
 
+        self._lod_vertex_budget = 5000000
+        self._lod_pixel_spacing = 3
+        self._lod_sample_size = 1000
+
+        self._chunk_size = 100000
+        self._n_workers = None
+
     def _get(self, shape, **kwargs):
         # get the name of the class for a given shape
         # (CamelCase without underscores)
@@ -319,6 +488,50 @@ class Shapes(object):
 
         return radius
 
+    @staticmethod
+    def _get_contiguous_verts(verts, invalid=None):
+        """
+        Get a contiguous (N, n, 2) array of polygon vertices.
+
+        Invalid vertices are collapsed onto the previous valid vertex of the
+        polygon (instead of removing them) so that all polygons have the same
+        number of vertices.
+
+        Parameters
+        ----------
+        verts : array-like or masked-array
+            The vertices with shape (N, n, 2)
+        invalid : array-like, optional
+            A boolean array of shape (N, n) indicating invalid vertices.
+            If None, the mask of the vertices and non-finite values are used.
+            The default is None.
+
+        Returns
+        -------
+        verts : np.ndarray
+            The vertices with shape (N, n, 2)
+
+        """
+        if invalid is None:
+            invalid = np.ma.getmaskarray(verts).any(axis=2)
+            invalid = invalid | ~np.isfinite(np.ma.getdata(verts)).all(axis=2)
+
+        verts = np.ma.getdata(verts)
+
+        if not invalid.any():
+            return np.asarray(verts)
+
+        n = verts.shape[1]
+        # index of the last valid vertex for each vertex (or -1 if there is none)
+        idx = np.where(invalid, -1, np.arange(n))
+        np.maximum.accumulate(idx, axis=1, out=idx)
+
+        # use the first valid vertex for leading invalid vertices
+        first = np.argmax(~invalid, axis=1)
+        idx = np.where(idx < 0, first[:, None], idx)
+
+        return np.take_along_axis(verts, idx[..., None], axis=1)
+
     @staticmethod
     def _get_colors_and_array(kwargs, mask):
         # identify colors and the array
@@ -362,7 +575,127 @@ class Shapes(object):
             self._m = m
             self._n = None
 
-        def _get_auto_n(self):
+        # the min. number of intermediate points
+        _lod_min_n = 4
+        # the number of polygon-vertices per intermediate point
+        _lod_vertex_factor = 1
+
+        @staticmethod
+        def _get_sample_radius(radius):
+            # get a representative radius for a subset of the datapoints
+            # (the median of radius-arrays, evaluated separately for x and y)
+            if isinstance(radius, tuple):
+                return tuple(Shapes._ShapeBase._get_sample_radius(r) for r in radius)
+            elif np.size(radius) > 1:
+                return np.nanmedian(radius)
+            return radius
+
+        def _get_pixel_size(self, x, y, crs):
+            # estimate the on-screen size (in pixels) of the shapes from a subset
+            # of the datapoints
+            # NOTE: shapes must implement `_get_sample_verts(x, y, crs)` to return
+            # the vertices (N, n, 2) of the shapes (with a minimal number of
+            # intermediate points) in the plot-crs
+            x, y = np.asanyarray(x).ravel(), np.asanyarray(y).ravel()
+
+            step = max(1, x.size // self._m.set_shape._lod_sample_size)
+            verts = self._get_sample_verts(x[::step], y[::step], crs)
+            verts = np.asanyarray(verts, dtype=float)
+            if verts.size == 0:
+                return None
+
+            verts = self._m.ax.transData.transform(verts.reshape(-1, 2))
+            verts = verts.reshape(-1, self._lod_min_n * self._lod_vertex_factor, 2)
+
+            with np.errstate(invalid="ignore"), warnings.catch_warnings():
+                warnings.simplefilter("ignore", RuntimeWarning)
+                size = np.nanmax(verts, axis=1) - np.nanmin(verts, axis=1)
+                # use a high percentile to make sure larger shapes are properly
+                # represented as well
+                size = np.nanpercentile(size.max(axis=1), 90)
+
+            if not np.isfinite(size):
+                return None
+            return size
+
+        def _get_lod_n(self, x, y, crs, n):
+            # limit the number of intermediate points based on the on-screen size
+            # of the shapes and the max. number of vertices
+            budget = self._m.set_shape._lod_vertex_budget
+            if budget is None or not hasattr(self, "_get_sample_verts"):
+                return n
+
+            try:
+                size = self._get_pixel_size(x, y, crs)
+            except Exception:
+                _log.debug(
+                    "EOmaps: Unable to estimate on-screen size of shapes.",
+                    exc_info=True,
+                )
+                return n
+
+            if size is None:
+                return n
+
+            # the number of vertices required to draw the boundary of the shapes
+            # with the desired resolution (approx. perimeter of a circle)
+            nverts = np.pi * size / self._m.set_shape._lod_pixel_spacing
+            # the max. number of vertices per shape
+            nverts = min(nverts, budget / max(np.size(x), 1))
+
+            n_lod = int(np.ceil(nverts / self._lod_vertex_factor))
+
+            return max(min(n, n_lod), self._lod_min_n)
+
+        @staticmethod
+        def _get_radius_chunk(radius, s, size):
+            # get the radius for a chunk of the datapoints
+            if isinstance(radius, tuple):
+                return tuple(
+                    Shapes._ShapeBase._get_radius_chunk(r, s, size) for r in radius
+                )
+            elif np.size(radius) == size:
+                return np.asanyarray(radius)[s]
+            return radius
+
+        def _map_chunks(self, func, x, y, radius, axis=0, **kwargs):
+            # evaluate func(x, y, radius=radius, **kwargs) in chunks of the datapoints
+            # on a thread-pool and concatenate the results along the given axis
+            # (pyproj and numpy release the GIL for the expensive parts)
+            size = np.size(x)
+            chunk_size = self._m.set_shape._chunk_size
+
+            if chunk_size is None or size <= chunk_size:
+                return func(x, y, radius=radius, **kwargs)
+
+            def run(s):
+                r = self._get_radius_chunk(radius, s, size)
+                return func(x[s], y[s], radius=r, **kwargs)
+
+            chunks = [slice(i, i + chunk_size) for i in range(0, size, chunk_size)]
+
+            n_workers = self._m.set_shape._n_workers
+            if n_workers == 1:
+                results = [run(s) for s in chunks]
+            else:
+                with ThreadPoolExecutor(max_workers=n_workers) as pool:
+                    results = list(pool.map(run, chunks))
+
+            def concatenate(vals):
+                if any(np.ma.isMaskedArray(i) for i in vals):
+                    return np.ma.concatenate(vals, axis=axis)
+                return np.concatenate(vals, axis=axis)
+
+            return tuple(concatenate(vals) for vals in zip(*results))
+
+        def _get_n(self, x=None, y=None, crs=None):
+            # get the number of intermediate points to use for the given data
+            if self._n is not None:
+                return self._n
+
+            return self._get_auto_n(x, y, crs)
+
+        def _get_auto_n(self, x=None, y=None, crs=None):
             s = self._m._data_manager._get_current_datasize()
 
             if self.name == "rectangles":
@@ -386,6 +719,9 @@ class Shapes(object):
             else:
                 n = 12
 
+            if x is not None and y is not None:
+                n = self._get_lod_n(x, y, crs, n)
+
             return n
 
         @property
@@ -423,7 +759,9 @@ class Shapes(object):
                 the respective size!
             n : int or None
                 The number of intermediate points to calculate on the geodesic circle.
-                If None, 100 is used for < 10k pixels and 20 otherwise.
+                If None, the number of points is evaluated on each re-draw based on
+                the data-size and the on-screen size of the shapes.
+                (see `m.set_shape._lod_vertex_budget` for details)
                 The default is None.
 
             Returns
@@ -506,7 +844,7 @@ class Shapes(object):
                 else:
                     radius = np.broadcast_to(radius.ravel()[:, None], (size, n))
 
-            geod = self._m.crs_plot.get_geod()
+            geod = crs_registry.get_geod(self._m.crs_plot)
             lons, lats, back_azim = geod.fwd(
                 lons=np.broadcast_to(lon[:, None], (size, n)),
                 lats=np.broadcast_to(lat[:, None], (size, n)),
@@ -522,29 +860,28 @@ class Shapes(object):
         def _get_geod_circle_points(self, x, y, crs, radius, n=20):
             x, y = np.asarray(x), np.asarray(y)
 
+            lonlat_crs = crs_registry.get_plate_carree(self._m.crs_plot)
             # transform from in-crs to lon/lat
-            radius_t = self._m._get_transformer(
-                self._m.get_crs(crs),
-                self._m.CRS.PlateCarree(globe=self._m.crs_plot.globe),
-            )
+            radius_t = self._m._get_transformer(self._m.get_crs(crs), lonlat_crs)
             # transform from lon/lat to the plot_crs
-            plot_t = self._m._get_transformer(
-                self._m.CRS.PlateCarree(globe=self._m.crs_plot.globe),
-                CRS.from_user_input(self._m.crs_plot),
-            )
+            plot_t = self._m._get_transformer(lonlat_crs, self._m.crs_plot)
 
-            lon, lat = radius_t.transform(x, y)
-            # calculate some points on the geodesic circle
-            lons, lats = self._calc_geod_circle_points(lon, lat, radius, n=n)
+            def calc_points(x, y, radius):
+                lon, lat = radius_t.transform(x, y)
+                # calculate some points on the geodesic circle
+                lons, lats = self._calc_geod_circle_points(lon, lat, radius, n=n)
+                return plot_t.transform(lons, lats)
 
-            xs, ys = np.ma.masked_invalid(plot_t.transform(lons, lats), copy=False)
+            # points are returned with shape (n, N)
+            xs, ys = self._map_chunks(calc_points, x, y, radius, axis=1)
+            xs, ys = np.ma.masked_invalid((xs, ys), copy=False)
 
             if self._m._crs_plot in (
                 self._m.CRS.Orthographic(),
                 self._m.CRS.Geostationary(),
                 self._m.CRS.NearsidePerspective(),
             ):
-                mask = np.full(lons.shape, True)
+                mask = np.full(xs.shape, True)
             else:
                 # get the mask for invalid, very distorted or very large shapes
                 dx = xs.max(axis=0) - xs.min(axis=0)
@@ -557,13 +894,22 @@ class Shapes(object):
                     & (dy < np.max(radius) * 50)
                 )
 
-                mask = np.broadcast_to(mask[:, None].T, lons.shape)
+                mask = np.broadcast_to(mask[:, None].T, xs.shape)
 
             return xs, ys, mask
 
-        def get_coll(self, x, y, crs, **kwargs):
+        def _get_sample_verts(self, x, y, crs):
+            radius = self._get_sample_radius(self.radius)
+
+            xs, ys, _ = self._get_geod_circle_points(
+                x, y, crs, radius, n=self._lod_min_n
+            )
+            return np.stack((xs.filled(np.nan), ys.filled(np.nan))).T
 
-            xs, ys, mask = self._get_geod_circle_points(x, y, crs, self.radius, self.n)
+        def get_coll(self, x, y, crs, **kwargs):
+            xs, ys, mask = self._get_geod_circle_points(
+                x, y, crs, self.radius, self._get_n(x, y, crs)
+            )
 
             # only plot polygons if they contain 2 or more vertices
             vertmask = np.count_nonzero(mask, axis=0) > 2
@@ -571,18 +917,12 @@ class Shapes(object):
             # remember masked points
             self._m._data_mask = vertmask
 
-            verts = np.stack((xs, ys)).T
-            verts = np.ma.masked_array(
-                verts,
-                np.broadcast_to(~mask[:, None].T.swapaxes(1, 2), verts.shape),
-            )
-            verts = list(
-                i.compressed().reshape(-1, 2) for i, m in zip(verts, vertmask) if m
-            )
+            verts = np.stack((xs.data, ys.data)).T[vertmask]
+            verts = Shapes._get_contiguous_verts(verts, ~np.isfinite(verts).all(axis=2))
 
             color_and_array = Shapes._get_colors_and_array(kwargs, vertmask)
 
-            coll = PolyCollection(
+            coll = _PolyCollection(
                 verts,
                 # transOffset=self._m.ax.transData,
                 **color_and_array,
@@ -615,7 +955,9 @@ class Shapes(object):
                 The default is "in".
             n : int or None
                 The number of intermediate points to calculate on the circle.
-                If None, 100 is used for < 10k pixels and 20 otherwise.
+                If None, the number of points is evaluated on each re-draw based on
+                the data-size and the on-screen size of the shapes.
+                (see `m.set_shape._lod_vertex_budget` for details)
                 The default is None.
             """
             from . import MapsGrid  # do this here to avoid circular imports!
@@ -798,24 +1140,37 @@ class Shapes(object):
                 ) & np.isfinite(theta)
             return xs, ys, mask
 
+        def _get_sample_verts(self, x, y, crs):
+            radius = self._get_sample_radius(self.radius)
+
+            xs, ys, _ = self._get_ellipse_points(
+                x, y, crs, radius, self.radius_crs, n=self._lod_min_n
+            )
+            return np.stack((xs.filled(np.nan), ys.filled(np.nan)), axis=2)
+
         def get_coll(self, x, y, crs, **kwargs):
-            xs, ys, mask = self._get_ellipse_points(
-                x, y, crs, self.radius, self.radius_crs, n=self.n
+            xs, ys, mask = self._map_chunks(
+                self._get_ellipse_points,
+                x,
+                y,
+                self.radius,
+                crs=crs,
+                radius_crs=self.radius_crs,
+                n=self._get_n(x, y, crs),
             )
 
-            # compress the coordinates (masked arrays produce artefacts on the boundary
-            # in case intermediate points are masked)
-            verts = (
-                np.column_stack((x.compressed(), y.compressed()))
-                for i, (x, y) in enumerate(zip(xs, ys))
-                if mask[i]
+            # collapse masked coordinates (masked arrays produce artefacts on the
+            # boundary in case intermediate points are masked)
+            verts = Shapes._get_contiguous_verts(
+                np.stack((xs.data[mask], ys.data[mask]), axis=2),
+                np.ma.getmaskarray(xs)[mask] | np.ma.getmaskarray(ys)[mask],
             )
             # remember masked points
             self._m._data_mask = mask
 
             color_and_array = Shapes._get_colors_and_array(kwargs, mask)
 
-            coll = PolyCollection(
+            coll = _PolyCollection(
                 verts,
                 # transOffset=self._m.ax.transData,
                 **color_and_array,
@@ -827,6 +1182,10 @@ class Shapes(object):
     class _Rectangles(_ShapeBase):
         name = "rectangles"
 
+        # n is the number of intermediate points on each edge
+        _lod_min_n = 1
+        _lod_vertex_factor = 4
+
         def __init__(self, m):
             super().__init__(m=m)
 
@@ -858,7 +1217,9 @@ class Shapes(object):
                 The number of intermediate points to calculate on the rectangle edges
                 (e.g. to properly plot "curved" rectangles in projected crs)
                 Use n=1 to force rectangles!
-                If None, 40 is used for <10k datapoints and 10 is used otherwise.
+                If None, the number of points is evaluated on each re-draw based on
+                the data-size and the on-screen size of the shapes.
+                (see `m.set_shape._lod_vertex_budget` for details)
                 The default is None
             """
             from . import MapsGrid  # do this here to avoid circular imports!
@@ -914,17 +1275,12 @@ class Shapes(object):
             if radius_crs == crs:
                 in_crs = self._m.get_crs(crs)
                 # transform from crs to the plot_crs
-                t = self._m._get_transformer(
-                    CRS.from_user_input(in_crs), self._m.crs_plot
-                )
+                t = self._m._get_transformer(in_crs, self._m.crs_plot)
 
                 # make sure we do not transform out of bounds (if possible)
-                if in_crs.area_of_use is not None:
-                    transformer = self._m._get_transformer(in_crs.geodetic_crs, in_crs)
-
-                    xmin, ymin, xmax, ymax = transformer.transform_bounds(
-                        *in_crs.area_of_use.bounds
-                    )
+                bounds = crs_registry.get_clip_bounds(in_crs)
+                if bounds is not None:
+                    xmin, ymin, xmax, ymax = bounds
 
                     clipx = partial(np.clip, a_min=xmin, a_max=xmax)
                     clipy = partial(np.clip, a_min=ymin, a_max=ymax)
@@ -941,12 +1297,9 @@ class Shapes(object):
                 t = self._m._get_transformer(r_crs, self._m.crs_plot)
 
                 # make sure we do not transform out of bounds (if possible)
-                if r_crs.area_of_use is not None:
-                    transformer = self._m._get_transformer(r_crs.geodetic_crs, r_crs)
-
-                    xmin, ymin, xmax, ymax = transformer.transform_bounds(
-                        *r_crs.area_of_use.bounds
-                    )
+                bounds = crs_registry.get_clip_bounds(r_crs)
+                if bounds is not None:
+                    xmin, ymin, xmax, ymax = bounds
 
                     clipx = partial(np.clip, a_min=xmin, a_max=xmax)
                     clipy = partial(np.clip, a_min=ymin, a_max=ymax)
@@ -988,20 +1341,34 @@ class Shapes(object):
             verts = np.ma.stack((px.T, py.T), axis=0).T
             mask = np.count_nonzero(~verts.mask.any(axis=2), axis=1) >= 4
 
-            verts = [i[~i.mask.any(axis=1)] for i in verts[mask]]
+            verts = Shapes._get_contiguous_verts(verts[mask])
 
             return verts, mask
 
+        def _get_sample_verts(self, x, y, crs):
+            radius = self._get_sample_radius(self.radius)
+
+            verts, _ = self._get_rectangle_verts(
+                x, y, crs, radius, self.radius_crs, n=self._lod_min_n
+            )
+            return verts
+
         def _get_polygon_coll(self, x, y, crs, **kwargs):
-            verts, mask = self._get_rectangle_verts(
-                x, y, crs, self.radius, self.radius_crs, self.n
+            verts, mask = self._map_chunks(
+                self._get_rectangle_verts,
+                x,
+                y,
+                self.radius,
+                crs=crs,
+                radius_crs=self.radius_crs,
+                n=self._get_n(x, y, crs),
             )
 
             # remember masked points
             self._m._data_mask = mask
             color_and_array = Shapes._get_colors_and_array(kwargs, mask)
 
-            coll = PolyCollection(
+            coll = _PolyCollection(
                 verts=verts,
                 # transOffset=self._m.ax.transData,
                 **color_and_array,
@@ -1020,8 +1387,15 @@ class Shapes(object):
             n,
         ):
 
-            verts, mask = self._get_rectangle_verts(x, y, crs, radius, radius_crs, n)
-            verts = np.array(verts)
+            verts, mask = self._map_chunks(
+                self._get_rectangle_verts,
+                x,
+                y,
+                radius,
+                crs=crs,
+                radius_crs=radius_crs,
+                n=n,
+            )
 
             x = np.vstack(
                 [verts[:, 2][:, 0], verts[:, 3][:, 0], verts[:, 1][:, 0]]
@@ -1084,17 +1458,225 @@ class Shapes(object):
             else:
                 return self._get_polygon_coll(x, y, crs, **kwargs)
 
+    class _AutoLod(object):
+        name = "auto_lod"
+
+        _lod_shapes = ("ellipses", "rectangles", "geod_circles")
+
+        def __init__(self, m):
+            self._m = m
+            self._shape = None
+            self._image_threshold = 2
+            self._points_threshold = 2
+            # the representation used for the last re-draw of the data
+            self._representation = None
+
+        def __call__(
+            self, shape="ellipses", image_threshold=2, points_threshold=2, **kwargs
+        ):
+            """
+            Draw shapes with a level-of-detail that depends on their on-screen size.
+
+            If the shapes are smaller than a given threshold (in pixels), a cheap
+            representation of the data is drawn:
+
+            - gridded data (e.g. 2D data) is aggregated to a per-pixel image
+            - scattered data (e.g. 1D data) is drawn as square points
+
+            Once the shapes are larger than the threshold (e.g. if you zoom in),
+            the exact geometry of the selected shape is drawn.
+
+            The representation is evaluated on each re-draw of the data.
+
+            Note
+            ----
+            If the data is aggregated to an image, the mean of all values within
+            a pixel is shown.
+
+            Parameters
+            ----------
+            shape : str, optional
+                The shape to use if the shapes are larger than the threshold.
+                One of "ellipses", "rectangles" or "geod_circles".
+                The default is "ellipses".
+            image_threshold : float, optional
+                The on-screen size of the shapes (in pixels) below which gridded data
+                is represented as an image. The default is 2.
+            points_threshold : float, optional
+                The on-screen size of the shapes (in pixels) below which scattered
+                data is represented as points. The default is 2.
+            kwargs :
+                Additional keyword-arguments passed to the selected shape.
+                (e.g. `radius`, `radius_crs`, `n` ...)
+
+            Examples
+            --------
+            >>> m.set_shape.auto_lod("rectangles", radius=1, radius_crs=4326)
+
+            """
+            from . import MapsGrid  # do this here to avoid circular imports!
+
+            if shape not in self._lod_shapes:
+                raise TypeError(
+                    f"EOmaps: '{shape}' is not a valid shape for 'auto_lod'... "
+                    f"use one of {self._lod_shapes}"
+                )
+
+            if shape == "geod_circles":
+                kwargs.setdefault("n", None)
+            else:
+                kwargs = dict(
+                    radius=kwargs.pop("radius", "estimate"),
+                    radius_crs=kwargs.pop("radius_crs", "in"),
+                    n=kwargs.pop("n", None),
+                    **kwargs,
+                )
+
+            if shape == "rectangles":
+                # mesh must be set before n
+                kwargs = dict(mesh=kwargs.pop("mesh", False), **kwargs)
+
+            for m in self._m if isinstance(self._m, MapsGrid) else [self._m]:
+                lod_shape = self.__class__(m)
+                lod_shape._shape = m.set_shape._get(shape, **kwargs)
+                lod_shape._image_threshold = image_threshold
+                lod_shape._points_threshold = points_threshold
+                m._shape = lod_shape
+
+        @property
+        def _initargs(self):
+            return dict(
+                shape=self._shape.name,
+                image_threshold=self._image_threshold,
+                points_threshold=self._points_threshold,
+                **self._shape._initargs,
+            )
+
+        @property
+        def radius(self):
+            return self._shape.radius
+
+        @property
+        def radius_crs(self):
+            return self._shape.radius_crs
+
+        def __repr__(self):
+            return f"auto_lod({self._shape!r})"
+
+        def _get_plot_coords(self, x, y, crs):
+            x, y = np.asanyarray(x).ravel(), np.asanyarray(y).ravel()
+            if crs == "out":
+                return x, y
+
+            t = self._m._get_transformer(self._m.get_crs(crs), self._m.crs_plot)
+            return t.transform(x, y)
+
+        def _get_image(self, x, y, crs, size, array, cmap=None, norm=None, **kwargs):
+            ax = self._m.ax
+            x, y = self._get_plot_coords(x, y, crs)
+
+            # aggregate the data in bins with (approx.) the size of the shapes
+            # to avoid empty pixels
+            binsize = max(1, int(np.ceil(size)))
+            nx = max(1, int(np.ceil(ax.bbox.width / binsize)))
+            ny = max(1, int(np.ceil(ax.bbox.height / binsize)))
+            (x0, x1), (y0, y1) = ax.get_xlim(), ax.get_ylim()
+
+            img = Shapes._AggregatePoints._aggregate(
+                x, y, array, (x0, x1, y0, y1), (ny, nx), aggregator="mean"
+            )
+
+            # only forward kwargs that are relevant for images
+            kwargs = {
+                key: val for key, val in kwargs.items() if key in ("alpha", "zorder")
+            }
+
+            im = AxesImage(
+                ax,
+                cmap=cmap,
+                norm=norm,
+                interpolation="nearest",
+                origin="lower",
+                extent=(x0, x1, y0, y1),
+                **kwargs,
+            )
+            im.set_data(img)
+
+            return im
+
+        def _get_points(self, x, y, crs, size, **kwargs):
+            x, y = self._get_plot_coords(x, y, crs)
+
+            color_and_array = Shapes._get_colors_and_array(kwargs, None)
+
+            if not any(i in kwargs for i in ("lw", "linewidth", "linewidths")):
+                kwargs["linewidths"] = 0
+
+            # use square markers with (approx.) the size of the shapes
+            marker = MarkerStyle("s")
+            path = marker.get_path().transformed(marker.get_transform())
+            markersize = max(size, 1) * 72 / self._m.f.dpi
+
+            coll = PathCollection(
+                (path,),
+                sizes=[markersize**2],
+                offsets=np.column_stack((x, y)),
+                offset_transform=self._m.ax.transData,
+                **color_and_array,
+                **kwargs,
+            )
+            coll.set_transform(IdentityTransform())
+
+            return coll
+
+        def get_coll(self, x, y, crs, **kwargs):
+            gridded = len(getattr(self._m, "_zshape", ())) == 2
+
+            if gridded:
+                threshold = self._image_threshold
+            else:
+                threshold = self._points_threshold
+
+            try:
+                size = self._shape._get_pixel_size(x, y, crs)
+            except Exception:
+                _log.debug(
+                    "EOmaps: Unable to estimate on-screen size of shapes.",
+                    exc_info=True,
+                )
+                size = None
+
+            if size is None or threshold is None or size >= threshold:
+                self._representation = self._shape.name
+                return self._shape.get_coll(x, y, crs, **kwargs)
+
+            self._m._data_mask = None
+
+            if gridded and kwargs.get("array", None) is not None:
+                self._representation = "image"
+                return self._get_image(x, y, crs, size, **kwargs)
+            else:
+                self._representation = "points"
+                return self._get_points(x, y, crs, size, **kwargs)
+
     class _ScatterPoints(object):
         name = "scatter_points"
 
+        _decimate_methods = ("first", "last", "min", "max", "random")
+
         def __init__(self, m):
             self._m = m
+            self._size = None
+            self._marker = None
+            self._decimate = None
+            # the shape of the pixel-grid used for the last decimation
+            self._grid_shape = None
 
-        def __call__(self, size=None, marker=None):
+        def __call__(self, size=None, marker=None, decimate=None):
             """
             Draw each datapoint as a shape with a size defined in points**2.
 
-            All arguments are forwarded to `m.ax.scatter()`.
+            All arguments (except `decimate`) are forwarded to `m.ax.scatter()`.
 
             Parameters
             ----------
@@ -1110,18 +1692,37 @@ class Shapes(object):
                 - `".", "o", "s", "<", ">", "^", "$A^2$"`
 
                 See matplotlib.markers for more information about marker styles.
+            decimate : str or None, optional
+                If provided, only one representative datapoint per screen-pixel
+                is drawn (the selection is re-evaluated on each re-draw).
+                This way, the time required to draw the points depends on the
+                size of the map rather than on the number of datapoints.
+                (Picking still considers all datapoints.)
+
+                - "first" / "last": the first (or last) datapoint in the pixel
+                - "min" / "max": the datapoint with the min. (or max.) value
+                - "random": a random datapoint in the pixel
+
+                The default is None.
             """
             from . import MapsGrid  # do this here to avoid circular imports!
 
+            if decimate is not None and decimate not in self._decimate_methods:
+                raise TypeError(
+                    f"EOmaps: '{decimate}' is not a valid decimation method... "
+                    f"use one of {self._decimate_methods}"
+                )
+
             for m in self._m if isinstance(self._m, MapsGrid) else [self._m]:
                 shape = self.__class__(m)
                 shape._size = size
                 shape._marker = marker
+                shape._decimate = decimate
                 m._shape = shape
 
         @property
         def _initargs(self):
-            return dict(size=self._size, marker=self._marker)
+            return dict(size=self._size, marker=self._marker, decimate=self._decimate)
 
         @property
         def radius(self):
@@ -1132,13 +1733,113 @@ class Shapes(object):
         def radius_crs(self):
             return "in"
 
+        def _get_grid_shape(self):
+            bbox = self._m.ax.bbox
+            return max(1, int(np.ceil(bbox.height))), max(1, int(np.ceil(bbox.width)))
+
+        def _redraw_required(self):
+            # re-evaluate the decimation if the size of the axes changed
+            if self._decimate is None:
+                return False
+            return self._grid_shape != self._get_grid_shape()
+
+        @staticmethod
+        def _get_representatives(idx, n, method="first", z=None):
+            """
+            Get the positions of one representative value per bin.
+
+            Parameters
+            ----------
+            idx : array-like of int
+                The bin-indices of the values.
+            n : int
+                The number of bins.
+            method : str, optional
+                The method used to select the representative.
+                ("first", "last", "min", "max" or "random")
+                The default is "first".
+            z : array-like, optional
+                The values (only required for "min" and "max").
+
+            Returns
+            -------
+            pos : np.ndarray
+                The (sorted) positions of the representatives.
+
+            """
+            npos = idx.size
+            pos = np.arange(npos)
+
+            if method in ("min", "max", "random"):
+                # only consider the candidates with the max. key per bin
+                if method == "random":
+                    key = np.random.random(idx.size)
+                else:
+                    key = np.ma.filled(np.ma.masked_invalid(z, copy=False), np.nan)
+                    key = np.asanyarray(key, dtype=float).ravel()
+                    if method == "min":
+                        key = -key
+                    key = np.where(np.isnan(key), -np.inf, key)
+
+                best = np.full(n, -np.inf)
+                np.maximum.at(best, idx, key)
+                candidates = key == best[idx]
+                pos, idx = pos[candidates], idx[candidates]
+
+            if method == "last":
+                sel = np.full(n, -1)
+                np.maximum.at(sel, idx, pos)
+                sel = sel[sel >= 0]
+            else:
+                sel = np.full(n, npos)
+                np.minimum.at(sel, idx, pos)
+                sel = sel[sel < npos]
+
+            # keep the order of the datapoints
+            return np.sort(sel)
+
+        def _get_decimation_mask(self, x, y, crs, z=None):
+            # get a mask that selects one datapoint per screen-pixel
+            ax = self._m.ax
+            x, y = np.asanyarray(x).ravel(), np.asanyarray(y).ravel()
+            if crs != "out":
+                t = self._m._get_transformer(self._m.get_crs(crs), self._m.crs_plot)
+                x, y = t.transform(x, y)
+
+            self._grid_shape = ny, nx = self._get_grid_shape()
+            (x0, x1), (y0, y1) = ax.get_xlim(), ax.get_ylim()
+
+            with np.errstate(invalid="ignore", divide="ignore"):
+                ix = np.floor((x - x0) / (x1 - x0) * nx)
+                iy = np.floor((y - y0) / (y1 - y0) * ny)
+
+                visible = np.where((ix >= 0) & (ix < nx) & (iy >= 0) & (iy < ny))[0]
+
+            idx = (iy[visible] * nx + ix[visible]).astype(np.intp)
+            if z is not None:
+                z = np.ravel(z)[visible]
+
+            mask = np.full(x.size, False)
+            mask[
+                visible[self._get_representatives(idx, nx * ny, self._decimate, z)]
+            ] = True
+            return mask
+
         def get_coll(self, x, y, crs, **kwargs):
-            color_and_array = Shapes._get_colors_and_array(
-                kwargs, np.full((x.size,), True)
-            )
+            if self._decimate is None:
+                mask = np.full((x.size,), True)
+            else:
+                mask = self._get_decimation_mask(x, y, crs, kwargs.get("array", None))
+                x, y = np.ravel(x)[mask], np.ravel(y)[mask]
+
+            size = self._size
+            if isinstance(size, np.ndarray) and size.size == mask.size:
+                size = size.ravel()[mask]
+
+            color_and_array = Shapes._get_colors_and_array(kwargs, mask)
             color_and_array["c"] = color_and_array["array"]
             coll = self._m.ax.scatter(
-                x, y, s=self._size, marker=self._marker, **color_and_array, **kwargs
+                x, y, s=size, marker=self._marker, **color_and_array, **kwargs
             )
             return coll
 
@@ -1148,11 +1849,21 @@ class Shapes(object):
         def __init__(self, m):
             self._m = m
             self._mask_radius = None
+            self._threaded = False
+
+            # the cached tessellation of the full dataset (x0, y0, tessellation)
+            self._tessellation = None
+            # the thread used to compute the tessellation (x0, y0, thread)
+            self._tessellation_thread = None
+            self._tessellation_timer = None
 
-        def __call__(self, masked=True, mask_radius=None):
+        def __call__(self, masked=True, mask_radius=None, threaded=False):
             """
             Draw a Voronoi-Diagram of the data.
 
+            The tessellation of the full dataset is evaluated only once and the
+            cells of the visible datapoints are selected on each re-draw.
+
             Parameters
             ----------
             masked : bool
@@ -1162,6 +1873,11 @@ class Shapes(object):
                 The radius used for masking the voronoi-diagram
                 (in units of the plot-crs)
                 The default is 4 times the estimated data-radius.
+            threaded : bool, optional
+                If True, the tessellation of the full dataset is evaluated in a
+                separate thread. Until it is available, the tessellation of the
+                visible datapoints is used.
+                The default is False.
             """
             from . import MapsGrid  # do this here to avoid circular imports!
 
@@ -1170,12 +1886,17 @@ class Shapes(object):
 
                 shape.mask_radius = mask_radius
                 shape.masked = masked
+                shape._threaded = threaded
 
                 m._shape = shape
 
         @property
         def _initargs(self):
-            return dict(mask_radius=self.mask_radius, masked=self.masked)
+            return dict(
+                mask_radius=self.mask_radius,
+                masked=self.masked,
+                threaded=self._threaded,
+            )
 
         def __repr__(self):
             try:
@@ -1197,24 +1918,181 @@ class Shapes(object):
         def mask_radius(self, val):
             self._mask_radius = val
 
-        def _get_voronoi_verts_and_mask(self, x, y, crs, radius, masked=True):
+        @staticmethod
+        def _get_ranges(start, count):
+            # get the concatenated ranges [start, start + count) as a single array
+            offsets = np.repeat(start - np.cumsum(count) + count, count)
+            return offsets + np.arange(offsets.size)
+
+        @staticmethod
+        def _get_voronoi_tessellation(x0, y0):
+            # get a compact representation of the voronoi tessellation
+            #   vertices: (V, 2) array of the vertices of all cells
+            #   regions: flat array of the vertex-indices of all cells
+            #   start, count: (N,) position of the cells in "regions"
+            #                 (count is 0 for infinite cells and invalid points)
+            #   maxdist: (N,) max. distance of the cell-vertices to the datapoint
             try:
                 from scipy.spatial import Voronoi
-                from itertools import zip_longest
             except ImportError:
                 raise ImportError("'scipy' is required for 'voronoi'!")
 
-            # transform from crs to the plot_crs
-            t_in_plot = self._m._get_transformer(self._m.get_crs(crs), self._m.crs_plot)
-
-            x0, y0 = t_in_plot.transform(x, y)
-
+            x0, y0 = np.ravel(x0), np.ravel(y0)
             datamask = np.isfinite(x0) & np.isfinite(y0)
-            [radiusx, radiusy] = radius
+            points = np.column_stack((x0[datamask], y0[datamask]))
+
+            vor = Voronoi(points)
+
+            lens = np.fromiter(map(len, vor.regions), dtype=np.intp)
+            regions = np.fromiter(chain.from_iterable(vor.regions), dtype=np.intp)
+            region_start = np.cumsum(lens) - lens
+
+            # identify regions with vertices at infinity
+            region_ids = np.repeat(np.arange(lens.size), lens)
+            infinite = np.bincount(region_ids[regions == -1], minlength=lens.size) > 0
+
+            pr = vor.point_region
+            start = np.zeros(x0.size, dtype=np.intp)
+            count = np.zeros(x0.size, dtype=np.intp)
+            start[datamask] = region_start[pr]
+            count[datamask] = np.where(infinite[pr], 0, lens[pr])
+
+            # get the max. distance of the cell-vertices to the datapoint
+            maxdist = np.full(x0.size, np.inf)
+
+            valid = count > 0
+            if valid.any():
+                vcount = count[valid]
+                idx = Shapes._VoronoiDiagram._get_ranges(start[valid], vcount)
+                dist = np.hypot(
+                    *(
+                        vor.vertices[regions[idx]]
+                        - np.repeat(points[valid[datamask]], vcount, axis=0)
+                    ).T
+                )
+                maxdist[valid] = np.maximum.reduceat(dist, np.cumsum(vcount) - vcount)
 
-            maxdist = 2 * np.mean(np.sqrt(radiusx**2 + radiusy**2))
+            return dict(
+                vertices=vor.vertices,
+                regions=regions,
+                start=start,
+                count=count,
+                maxdist=maxdist,
+            )
 
-            xy = np.column_stack((x0[datamask], y0[datamask]))
+        def _compute_tessellation(self, x0, y0):
+            try:
+                self._tessellation = (x0, y0, self._get_voronoi_tessellation(x0, y0))
+            except Exception:
+                _log.error(
+                    "EOmaps: Unable to compute the voronoi tessellation.",
+                    exc_info=_log.getEffectiveLevel() <= logging.DEBUG,
+                )
+
+        def _check_tessellation_thread(self):
+            # trigger a re-draw of the data once the tessellation is available
+            _, _, thread = self._tessellation_thread
+            if thread.is_alive():
+                return
+
+            self._tessellation_timer.stop()
+            self._tessellation_timer = None
+
+            if self._tessellation is not None:
+                self._m._data_manager.last_extent = None
+                self._m.redraw(self._m.layer)
+
+        def _start_tessellation_thread(self, x0, y0):
+            thread = Thread(
+                target=self._compute_tessellation, args=(x0, y0), daemon=True
+            )
+            self._tessellation_thread = (x0, y0, thread)
+            thread.start()
+
+            # poll for the result (only possible for interactive backends)
+            timer = self._m.f.canvas.new_timer(interval=200)
+            if type(timer) is not TimerBase:
+                timer.add_callback(self._check_tessellation_thread)
+                self._tessellation_timer = timer
+                timer.start()
+
+        def _get_tessellation(self):
+            # get the (cached) tessellation of the full dataset
+            # (or None if it is still being computed)
+            x0, y0 = self._m._data_manager.x0, self._m._data_manager.y0
+
+            if self._tessellation is not None:
+                tx0, ty0, tessellation = self._tessellation
+                if tx0 is x0 and ty0 is y0:
+                    self._m.BM.profiler.cache("voronoi", True)
+                    return tessellation
+
+            self._m.BM.profiler.cache("voronoi", False)
+
+            if self._threaded:
+                if self._tessellation_thread is not None:
+                    tx0, ty0, thread = self._tessellation_thread
+                    if tx0 is x0 and ty0 is y0:
+                        if thread.is_alive():
+                            return None
+                        # the thread finished (but no tessellation is available)
+                        return self._tessellation and self._tessellation[2]
+
+                self._start_tessellation_thread(x0, y0)
+                return None
+
+            self._compute_tessellation(x0, y0)
+            if self._tessellation is None:
+                return None
+            return self._tessellation[2]
+
+        def _get_cached_verts_and_mask(self, x, y, radius, masked=True):
+            # get the cells of the currently visible datapoints from the
+            # tessellation of the full dataset
+            ind = self._m._data_manager._get_current_indices()
+            if ind is None or ind.size != np.size(x):
+                return None
+
+            tessellation = self._get_tessellation()
+            if tessellation is None:
+                return None
+
+            start, count = tessellation["start"][ind], tessellation["count"][ind]
+
+            mask = count > 0
+            if masked:
+                [radiusx, radiusy] = radius
+                maxdist = 2 * np.mean(np.sqrt(radiusx**2 + radiusy**2))
+                mask &= tessellation["maxdist"][ind] < maxdist
+
+            start, count = start[mask], count[mask]
+
+            # get a contiguous (N, n, 2) vertex-array
+            # (collapse missing vertices onto the last vertex of the cells)
+            nmax = count.max() if count.size > 0 else 1
+            idx = start[:, None] + np.minimum(np.arange(nmax), count[:, None] - 1)
+            verts = tessellation["vertices"][tessellation["regions"][idx]]
+
+            return verts, mask
+
+        def _get_voronoi_verts_and_mask(self, x, y, crs, radius, masked=True):
+            try:
+                from scipy.spatial import Voronoi
+                from itertools import zip_longest
+            except ImportError:
+                raise ImportError("'scipy' is required for 'voronoi'!")
+
+            # transform from crs to the plot_crs
+            t_in_plot = self._m._get_transformer(self._m.get_crs(crs), self._m.crs_plot)
+
+            x0, y0 = t_in_plot.transform(x, y)
+
+            datamask = np.isfinite(x0) & np.isfinite(y0)
+            [radiusx, radiusy] = radius
+
+            maxdist = 2 * np.mean(np.sqrt(radiusx**2 + radiusy**2))
+
+            xy = np.column_stack((x0[datamask], y0[datamask]))
 
             vor = Voronoi(xy)
             rect_regions = np.array(list(zip_longest(*vor.regions, fillvalue=-2))).T
@@ -1244,22 +2122,33 @@ class Shapes(object):
             return verts, mask, datamask
 
         def get_coll(self, x, y, crs, **kwargs):
+            x, y = np.asanyarray(x), np.asanyarray(y)
 
-            verts, mask, datamask = self._get_voronoi_verts_and_mask(
-                x, y, crs, self.mask_radius, masked=self.masked
-            )
+            cached = None
+            if crs == "out":
+                cached = self._get_cached_verts_and_mask(
+                    x, y, self.mask_radius, masked=self.masked
+                )
+
+            if cached is not None:
+                verts, mask = cached
+                datamask = np.isfinite(x) & np.isfinite(y)
+                coll_class = _PolyCollection
+            else:
+                verts, vmask, datamask = self._get_voronoi_verts_and_mask(
+                    x, y, crs, self.mask_radius, masked=self.masked
+                )
+                mask = np.full(datamask.shape, False)
+                mask[np.where(datamask)[0][vmask]] = True
+                coll_class = PolyCollection
 
-            # find the masked points that are not masked by the datamask
-            mask2 = ~datamask.copy()
-            mask2[np.where(datamask)[0][mask]] = True
             # remember the mask
-            self._m._data_mask = mask2
+            # (e.g. points that are drawn or masked by the datamask)
+            self._m._data_mask = mask | ~datamask
 
-            color_and_array = Shapes._get_colors_and_array(
-                kwargs, np.logical_and(datamask, mask)
-            )
+            color_and_array = Shapes._get_colors_and_array(kwargs, mask)
 
-            coll = PolyCollection(
+            coll = coll_class(
                 verts=verts,
                 **color_and_array,
                 # transOffset=self._m.ax.transData,
@@ -1284,12 +2173,23 @@ class Shapes(object):
             self._m = m
             self._mask_radius = None
 
+            # the cached triangulation of the full dataset (x0, y0, triangulation)
+            self._triangulation = None
+            # the cached interpolator for the full dataset (z_data, interpolator)
+            self._interpolator = None
+
         def __call__(
             self, masked=True, mask_radius=None, mask_radius_crs="in", flat=False
         ):
             """
             Draw a Delaunay-Triangulation of the data.
 
+            The triangulation of the full dataset is evaluated only once and the
+            triangles of the visible datapoints are selected on each re-draw.
+
+            The cached triangulation is also used to identify picked datapoints
+            and to interpolate values (see `m.shape.interpolate(x, y)`).
+
             Parameters
             ----------
             masked : bool
@@ -1407,11 +2307,256 @@ class Shapes(object):
 
             return tri, datamask
 
-        def get_coll(self, x, y, crs, **kwargs):
+        @staticmethod
+        def _get_full_triangulation(x0, y0, xorig=None, yorig=None):
+            # get the triangulation of all (finite) datapoints
+            #   triangulation: the (unmasked) Triangulation of the finite points
+            #   index: (V,) indices of the vertices with respect to the full dataset
+            #   bbox: (4, T) bounding-boxes (x0, x1, y0, y1) of the triangles
+            #   maxlen: the max. side-length of the triangles (for "in" and "out")
+            try:
+                from scipy.spatial import Delaunay
+            except ImportError:
+                raise ImportError("'scipy' is required for 'delaunay_triangulation'!")
+
+            x0, y0 = np.ravel(x0), np.ravel(y0)
+            datamask = np.isfinite(x0) & np.isfinite(y0)
+            index = np.where(datamask)[0]
+            x, y = x0[index], y0[index]
 
-            tri, datamask = self._get_delaunay_triangulation(
-                x, y, crs, self.mask_radius, self.mask_radius_crs, self.masked
+            d = Delaunay(np.column_stack((x, y)), qhull_options="QJ")
+            tri = Triangulation(x, y, d.simplices)
+
+            tx, ty = x[tri.triangles], y[tri.triangles]
+            bbox = np.array(
+                (tx.min(axis=1), tx.max(axis=1), ty.min(axis=1), ty.max(axis=1))
             )
+
+            def get_maxlen(mx, my):
+                # get the max. side-length of the triangles
+                mx, my = mx[tri.triangles], my[tri.triangles]
+                return np.max(
+                    [
+                        np.hypot(mx[:, i] - mx[:, j], my[:, i] - my[:, j])
+                        for i, j in ((0, 1), (0, 2), (1, 2))
+                    ],
+                    axis=0,
+                )
+
+            maxlen = dict(out=get_maxlen(x, y))
+            if xorig is not None and np.size(xorig) == x0.size:
+                maxlen["in"] = get_maxlen(
+                    np.ravel(xorig)[index], np.ravel(yorig)[index]
+                )
+
+            return dict(triangulation=tri, index=index, bbox=bbox, maxlen=maxlen)
+
+        def _get_triangulation(self, compute=True):
+            # get the (cached) triangulation of the full dataset
+            dm = self._m._data_manager
+            x0, y0 = dm.x0, dm.y0
+            if x0 is None or y0 is None:
+                return None
+
+            if self._triangulation is not None:
+                tx0, ty0, triangulation = self._triangulation
+                if tx0 is x0 and ty0 is y0:
+                    self._m.BM.profiler.cache("delaunay", True)
+                    return triangulation
+
+            if not compute:
+                return None
+
+            self._m.BM.profiler.cache("delaunay", False)
+
+            try:
+                triangulation = self._get_full_triangulation(x0, y0, dm.xorig, dm.yorig)
+            except ImportError:
+                raise
+            except Exception:
+                _log.error(
+                    "EOmaps: Unable to compute the delaunay triangulation.",
+                    exc_info=_log.getEffectiveLevel() <= logging.DEBUG,
+                )
+                return None
+
+            self._triangulation = (x0, y0, triangulation)
+            self._interpolator = None
+            return triangulation
+
+        def _get_triangle_mask(self, triangulation, radius, radius_crs="out"):
+            # get a mask of the triangles that exceed the mask-radius
+            if radius is None:
+                return np.full(triangulation["bbox"].shape[1], False)
+
+            maxlen = triangulation["maxlen"].get(radius_crs, None)
+            if maxlen is None:
+                return None
+
+            radiusx, radiusy = radius
+            maxdist = 4 * np.mean(np.sqrt(radiusx**2 + radiusy**2))
+            return maxlen > maxdist
+
+        def _get_cached_triangulation(self, x, y, radius, radius_crs="out"):
+            # get the triangles of the currently visible datapoints from the
+            # triangulation of the full dataset
+            ind = self._m._data_manager._get_current_indices()
+            if ind is None or ind.size != np.size(x):
+                return None
+
+            triangulation = self._get_triangulation()
+            if triangulation is None:
+                return None
+
+            trimask = self._get_triangle_mask(triangulation, radius, radius_crs)
+            if trimask is None:
+                return None
+
+            x, y = np.ravel(x), np.ravel(y)
+            datamask = np.isfinite(x) & np.isfinite(y)
+
+            # position of the (full-dataset) vertices in the current subset
+            pos = np.full(np.size(self._m._data_manager.x0), -1, dtype=np.intp)
+            pos[ind[datamask]] = np.arange(np.count_nonzero(datamask))
+            tris = pos[triangulation["index"][triangulation["triangulation"].triangles]]
+
+            # select triangles whose bounding-box intersects the current extent
+            (x0, x1), (y0, y1) = self._m.ax.get_xlim(), self._m.ax.get_ylim()
+            bx0, bx1, by0, by1 = triangulation["bbox"]
+            use = (
+                (bx1 >= min(x0, x1))
+                & (bx0 <= max(x0, x1))
+                & (by1 >= min(y0, y1))
+                & (by0 <= max(y0, y1))
+            )
+            # (only triangles whose vertices are all selected can be drawn)
+            use &= np.all(tris >= 0, axis=1)
+
+            # drop masked triangles
+            if self.masked:
+                use &= ~trimask
+
+            tri = Triangulation(x[datamask], y[datamask], tris[use])
+            return tri, datamask
+
+        def _pick_index(self, pos, d=None):
+            """
+            Identify the closest datapoint of the triangle at the given position.
+
+            Parameters
+            ----------
+            pos : tuple
+                The (x, y) coordinates of the position (in the plot-crs).
+            d : float, optional
+                The max. distance of the datapoint to the position.
+                The default is None.
+
+            Returns
+            -------
+            ind : int or None
+                The index of the datapoint (with respect to the flattened array)
+                or None if the position is not inside a (visible) triangle.
+
+            """
+            triangulation = self._get_triangulation(compute=False)
+            if triangulation is None:
+                return None
+
+            tri = triangulation["triangulation"]
+            try:
+                i = int(tri.get_trifinder()(*pos))
+            except Exception:
+                return None
+
+            if i < 0:
+                return None
+
+            if self.masked:
+                trimask = self._get_triangle_mask(
+                    triangulation, self.mask_radius, self.mask_radius_crs
+                )
+                if trimask is None or trimask[i]:
+                    return None
+
+            vertices = tri.triangles[i]
+            dist = np.hypot(tri.x[vertices] - pos[0], tri.y[vertices] - pos[1])
+            closest = dist.argmin()
+
+            if d is not None and not dist[closest] < d:
+                return None
+
+            return triangulation["index"][vertices[closest]]
+
+        def interpolate(self, x, y):
+            """
+            Get linearly interpolated data-values at the given positions.
+
+            The values are interpolated within the triangles of the (cached)
+            delaunay-triangulation of the full dataset.
+
+            Parameters
+            ----------
+            x, y : float or array-like
+                The coordinates of the positions (in the plot-crs).
+
+            Returns
+            -------
+            val : float or np.ndarray
+                The interpolated values (NaN for positions outside of the
+                visible triangles).
+
+            Examples
+            --------
+            >>> m.set_shape.delaunay_triangulation()
+            >>> m.plot_map()
+            >>> m.cb.click.attach(lambda pos, **kwargs: print(m.shape.interpolate(*pos)))
+
+            """
+            from matplotlib.tri import LinearTriInterpolator
+
+            triangulation = self._get_triangulation()
+            if triangulation is None:
+                return np.full(np.shape(x), np.nan)
+
+            tri = triangulation["triangulation"]
+            z_data = self._m._data_manager.z_data
+
+            if self._interpolator is None or self._interpolator[0] is not z_data:
+                z = np.ravel(np.asanyarray(z_data, dtype=float))[triangulation["index"]]
+                self._interpolator = (
+                    z_data,
+                    LinearTriInterpolator(tri, z, trifinder=tri.get_trifinder()),
+                )
+
+            x, y = np.asanyarray(x, dtype=float), np.asanyarray(y, dtype=float)
+
+            val = np.ma.filled(self._interpolator[1](x, y), np.nan)
+
+            if self.masked:
+                trimask = self._get_triangle_mask(
+                    triangulation, self.mask_radius, self.mask_radius_crs
+                )
+                if trimask is not None:
+                    i = np.asanyarray(tri.get_trifinder()(x, y))
+                    val = np.where((i >= 0) & trimask[i], np.nan, val)
+
+            return val[()] if np.ndim(val) == 0 else val
+
+        def get_coll(self, x, y, crs, **kwargs):
+            x, y = np.asanyarray(x), np.asanyarray(y)
+
+            cached = None
+            if crs == "out":
+                cached = self._get_cached_triangulation(
+                    x, y, self.mask_radius, self.mask_radius_crs
+                )
+
+            if cached is not None:
+                tri, datamask = cached
+            else:
+                tri, datamask = self._get_delaunay_triangulation(
+                    x, y, crs, self.mask_radius, self.mask_radius_crs, self.masked
+                )
             maskedTris = tri.get_masked_triangles()
 
             # find the masked points that are not masked by the datamask
@@ -1476,6 +2621,616 @@ class Shapes(object):
         def radius_crs(self):
             return "in"
 
+    class _AggregatePoints(object):
+        name = "aggregate_points"
+
+        _aggregators = ("count", "sum", "mean", "min", "max")
+
+        def __init__(self, m):
+            self._m = m
+            self._aggregator = "mean"
+            self._pixel_size = 1
+            # the shape of the grid used for the last aggregation
+            self._grid_shape = None
+
+        def __call__(self, aggregator="mean", pixel_size=1):
+            """
+            Aggregate the data on a per-pixel grid (>> usable for very large datasets!).
+
+            The datapoints are aggregated to an image with the resolution of the
+            screen-pixels in the current map-extent. The aggregation is re-evaluated
+            on each re-draw of the data (e.g. if you zoom or pan the map).
+
+            This is a pure-numpy alternative to "shade_points" (e.g. it does not
+            require `datashader`, `pandas` or `xarray`).
+
+            Note
+            ----
+            For "count" and "sum" aggregations, the aggregated values do not
+            represent data-values and a linear normalization with respect to the
+            aggregated values is used (e.g. classifications are ignored) and
+            colorbars represent the aggregated values.
+
+            Parameters
+            ----------
+            aggregator : str, optional
+                The reduction to compute per-pixel.
+                One of "count", "sum", "mean", "min" or "max".
+                The default is "mean".
+            pixel_size : int, optional
+                The size of the bins (in pixels) used to aggregate the data.
+                The default is 1.
+
+            Examples
+            --------
+            >>> m.set_shape.aggregate_points(aggregator="max", pixel_size=2)
+
+            """
+            from . import MapsGrid  # do this here to avoid circular imports!
+
+            if aggregator not in self._aggregators:
+                raise TypeError(
+                    f"EOmaps: '{aggregator}' is not a valid aggregator for "
+                    f"'aggregate_points'... use one of {self._aggregators}"
+                )
+
+            for m in self._m if isinstance(self._m, MapsGrid) else [self._m]:
+                shape = self.__class__(m)
+                shape._aggregator = aggregator
+                shape._pixel_size = max(1, int(pixel_size))
+                m._shape = shape
+
+        @property
+        def _initargs(self):
+            return dict(aggregator=self._aggregator, pixel_size=self._pixel_size)
+
+        def __repr__(self):
+            return (
+                f"aggregate_points(aggregator={self._aggregator!r}, "
+                f"pixel_size={self._pixel_size})"
+            )
+
+        @property
+        def _renorm(self):
+            # indicator if the aggregated values do not represent data-values
+            return self._aggregator in ("count", "sum")
+
+        @property
+        def radius(self):
+            radius = Shapes._get_radius(self._m, "estimate", "in")
+            return radius
+
+        @property
+        def radius_crs(self):
+            return "in"
+
+        def _get_grid_shape(self):
+            # get a grid with the resolution of the screen-pixels
+            bbox = self._m.ax.bbox
+            nx = max(1, int(np.ceil(bbox.width / self._pixel_size)))
+            ny = max(1, int(np.ceil(bbox.height / self._pixel_size)))
+            return ny, nx
+
+        def _redraw_required(self):
+            # re-aggregate the data if the size of the axes changed
+            return self._grid_shape != self._get_grid_shape()
+
+        @staticmethod
+        def _aggregate(x, y, z, extent, shape, aggregator="mean"):
+            """
+            Aggregate datapoints on a regular grid.
+
+            Parameters
+            ----------
+            x, y : array-like
+                The coordinates of the datapoints.
+            z : array-like or None
+                The data-values (only None for "count" aggregations).
+            extent : tuple
+                The extent (x0, x1, y0, y1) of the grid.
+            shape : tuple
+                The shape (ny, nx) of the grid.
+            aggregator : str, optional
+                The reduction to compute ("count", "sum", "mean", "min" or "max").
+                The default is "mean".
+
+            Returns
+            -------
+            agg : np.ma.masked_array
+                The aggregated values (empty bins are masked).
+
+            """
+            (x0, x1, y0, y1), (ny, nx) = extent, shape
+            x, y = np.ravel(x), np.ravel(y)
+
+            with np.errstate(invalid="ignore", divide="ignore"):
+                ix = np.floor((x - x0) / (x1 - x0) * nx)
+                iy = np.floor((y - y0) / (y1 - y0) * ny)
+
+                valid = (ix >= 0) & (ix < nx) & (iy >= 0) & (iy < ny)
+
+            if z is not None:
+                z = np.ma.masked_invalid(np.ma.asanyarray(z, dtype=float)).ravel()
+                valid &= ~np.ma.getmaskarray(z)
+                z = np.ma.getdata(z)[valid]
+
+            idx = (iy[valid] * nx + ix[valid]).astype(np.intp)
+
+            agg = Shapes._AggregatePoints._reduce(idx, z, nx * ny, aggregator)
+            return agg.reshape(ny, nx)
+
+        @staticmethod
+        def _reduce(idx, z, n, aggregator="mean"):
+            """
+            Reduce values with respect to bin-indices.
+
+            Parameters
+            ----------
+            idx : array-like of int
+                The bin-indices of the values.
+            z : array-like or None
+                The (finite) values (only None for "count" aggregations).
+            n : int
+                The number of bins.
+            aggregator : str, optional
+                The reduction to compute ("count", "sum", "mean", "min" or "max").
+                The default is "mean".
+
+            Returns
+            -------
+            agg : np.ma.masked_array
+                The reduced values (empty bins are masked).
+
+            """
+            counts = np.bincount(idx, minlength=n)
+
+            if aggregator == "count":
+                agg = counts.astype(float)
+            elif aggregator in ("sum", "mean"):
+                agg = np.bincount(idx, weights=z, minlength=n)
+                if aggregator == "mean":
+                    with np.errstate(invalid="ignore", divide="ignore"):
+                        agg = agg / counts
+            elif aggregator == "min":
+                agg = np.full(n, np.inf)
+                np.minimum.at(agg, idx, z)
+            elif aggregator == "max":
+                agg = np.full(n, -np.inf)
+                np.maximum.at(agg, idx, z)
+            else:
+                raise TypeError(f"EOmaps: Unknown aggregator: {aggregator}")
+
+            return np.ma.masked_array(agg, counts == 0)
+
+        def get_coll(self, x, y, crs, array=None, cmap=None, norm=None, **kwargs):
+            ax = self._m.ax
+
+            x, y = np.asanyarray(x).ravel(), np.asanyarray(y).ravel()
+            if crs != "out":
+                t = self._m._get_transformer(self._m.get_crs(crs), self._m.crs_plot)
+                x, y = t.transform(x, y)
+
+            self._grid_shape = self._get_grid_shape()
+            (x0, x1), (y0, y1) = ax.get_xlim(), ax.get_ylim()
+
+            if array is None and self._aggregator != "count":
+                raise TypeError(
+                    "EOmaps: 'aggregate_points' requires data-values for the "
+                    f"aggregator '{self._aggregator}'... use 'count' instead."
+                )
+
+            img = self._aggregate(
+                x,
+                y,
+                None if self._aggregator == "count" else array,
+                (x0, x1, y0, y1),
+                self._grid_shape,
+                self._aggregator,
+            )
+
+            if self._renorm:
+                # use a linear normalization of the aggregated values
+                norm = Normalize()
+
+            self._m._data_mask = None
+
+            # only forward kwargs that are relevant for images
+            kwargs = {
+                key: val for key, val in kwargs.items() if key in ("alpha", "zorder")
+            }
+
+            im = AxesImage(
+                ax,
+                cmap=cmap,
+                norm=norm,
+                interpolation="nearest",
+                origin="lower",
+                extent=(x0, x1, y0, y1),
+                **kwargs,
+            )
+            im.set_data(img)
+
+            if self._renorm:
+                im.autoscale()
+
+            return im
+
+    class _Hexbin(object):
+        name = "hexbin"
+
+        _aggregators = ("count", "sum", "mean", "min", "max")
+        # the max. number of resolution levels for which hexagon-indices are cached
+        _cache_size = 10
+
+        def __init__(self, m):
+            self._m = m
+            self._size = None
+            self._size_crs = "out"
+            self._pixel_size = 10
+            self._aggregator = "mean"
+
+            # the cached hexagon-indices of the full dataset
+            # (x0, y0, OrderedDict(size: dict(centers, inverse, ...)))
+            self._hex_cache = None
+            # the cached coordinates of the full dataset in the size_crs
+            # (x0, y0, size_crs, x, y)
+            self._coords = None
+
+        def __call__(self, size=None, size_crs="out", aggregator="mean", pixel_size=10):
+            """
+            Aggregate the data in hexagonal bins.
+
+            The hexagon-index of the datapoints is evaluated only once per dataset
+            (and resolution level) and the values are aggregated via `np.bincount`.
+
+            Parameters
+            ----------
+            size : float or None, optional
+                The size (e.g. the circumradius) of the hexagons in units of the
+                `size_crs`.
+                If None, the size depends on the zoom-level of the map and is
+                evaluated on each re-draw such that the hexagons have a size of
+                (approx.) `pixel_size` pixels. (The size is snapped to powers of 2
+                so that hexagon-indices can be re-used for each resolution level.)
+                The default is None.
+            size_crs : str, int or pyproj.CRS, optional
+                The crs in which the hexagons are defined.
+                (e.g. "out" for the plot-crs, "in" for the input-crs, 4326 ...)
+                The default is "out".
+            aggregator : str, optional
+                The reduction to compute per hexagon.
+                One of "count", "sum", "mean", "min" or "max".
+                The default is "mean".
+            pixel_size : float, optional
+                The on-screen size of the hexagons (in pixels).
+                Only relevant if `size=None`. The default is 10.
+
+            Examples
+            --------
+            >>> m.set_shape.hexbin(size=1, size_crs=4326, aggregator="count")
+
+            """
+            from . import MapsGrid  # do this here to avoid circular imports!
+
+            if aggregator not in self._aggregators:
+                raise TypeError(
+                    f"EOmaps: '{aggregator}' is not a valid aggregator for "
+                    f"'hexbin'... use one of {self._aggregators}"
+                )
+
+            for m in self._m if isinstance(self._m, MapsGrid) else [self._m]:
+                shape = self.__class__(m)
+                shape._size = size
+                shape._size_crs = size_crs
+                shape._aggregator = aggregator
+                shape._pixel_size = pixel_size
+                m._shape = shape
+
+        @property
+        def _initargs(self):
+            return dict(
+                size=self._size,
+                size_crs=self._size_crs,
+                aggregator=self._aggregator,
+                pixel_size=self._pixel_size,
+            )
+
+        def __repr__(self):
+            return (
+                f"hexbin(size={self._size}, size_crs={self._size_crs!r}, "
+                f"aggregator={self._aggregator!r})"
+            )
+
+        @property
+        def _renorm(self):
+            # indicator if the aggregated values do not represent data-values
+            return self._aggregator in ("count", "sum")
+
+        @property
+        def radius(self):
+            radius = Shapes._get_radius(self._m, "estimate", "in")
+            return radius
+
+        @property
+        def radius_crs(self):
+            return "in"
+
+        @property
+        def _plot_crs_q(self):
+            # indicator if the hexagons are defined in the plot-crs
+            if self._size_crs == "out":
+                return True
+            return self._m.get_crs(self._size_crs) == self._m.crs_plot
+
+        @staticmethod
+        def _get_template(size):
+            # the vertices of a (pointy-top) hexagon centered at (0, 0)
+            angles = np.deg2rad(np.arange(30, 390, 60))
+            return np.column_stack((np.cos(angles), np.sin(angles))) * size
+
+        @staticmethod
+        def _get_hex_index(x, y, size):
+            """
+            Identify the hexagons that contain the given points.
+
+            Parameters
+            ----------
+            x, y : array-like
+                The coordinates of the points.
+            size : float
+                The size (e.g. the circumradius) of the (pointy-top) hexagons.
+
+            Returns
+            -------
+            cx, cy : np.ndarray
+                The centers of all hexagons that contain points.
+            inverse : np.ndarray
+                The index of the hexagon that contains the points
+                (-1 for non-finite points).
+
+            """
+            x, y = np.ravel(x), np.ravel(y)
+            valid = np.isfinite(x) & np.isfinite(y)
+            xv, yv = x[valid], y[valid]
+
+            # the hexagon-centers are the union of 2 rectangular lattices
+            # (with a spacing of w x h, shifted by w/2 and h/2)
+            w, h = np.sqrt(3) * size, 3 * size
+
+            i1, j1 = np.round(xv / w), np.round(yv / h)
+            i2, j2 = np.floor(xv / w), np.floor(yv / h)
+
+            d1 = (xv - i1 * w) ** 2 + (yv - j1 * h) ** 2
+            d2 = (xv - (i2 + 0.5) * w) ** 2 + (yv - (j2 + 0.5) * h) ** 2
+            use2 = d2 < d1
+
+            # the position of the centers in units of (w/2, h/2)
+            col = np.where(use2, 2 * i2 + 1, 2 * i1).astype(np.int64)
+            row = np.where(use2, 2 * j2 + 1, 2 * j1).astype(np.int64)
+
+            inverse = np.full(x.size, -1, dtype=np.intp)
+            if col.size == 0:
+                return np.array([]), np.array([]), inverse
+
+            cmin, rmin = col.min(), row.min()
+            nrows = row.max() - rmin + 1
+
+            keys, inverse[valid] = np.unique(
+                (col - cmin) * nrows + (row - rmin), return_inverse=True
+            )
+
+            cx = (keys // nrows + cmin) * w / 2
+            cy = (keys % nrows + rmin) * h / 2
+
+            return cx, cy, inverse
+
+        def _get_coords(self):
+            # get the (cached) coordinates of the full dataset in the size_crs
+            dm = self._m._data_manager
+            x0, y0 = dm.x0, dm.y0
+
+            if self._coords is not None:
+                cx0, cy0, crs, x, y = self._coords
+                if cx0 is x0 and cy0 is y0 and crs == self._size_crs:
+                    return x, y
+
+            if self._plot_crs_q:
+                x, y = np.ravel(x0), np.ravel(y0)
+            elif self._size_crs == "in":
+                x, y = np.ravel(dm.xorig), np.ravel(dm.yorig)
+            else:
+                t = self._m._get_transformer(
+                    self._m.crs_plot, self._m.get_crs(self._size_crs)
+                )
+                x, y = t.transform(np.ravel(x0), np.ravel(y0))
+
+            self._coords = (x0, y0, self._size_crs, x, y)
+            return x, y
+
+        def _get_level_size(self):
+            # get the size of the hexagons for the current zoom-level
+            ax = self._m.ax
+            (x0, x1), (y0, y1) = ax.get_xlim(), ax.get_ylim()
+            size = self._pixel_size * abs(x1 - x0) / ax.bbox.width
+
+            if not self._plot_crs_q:
+                # convert the size to the size_crs (at the center of the map)
+                t = self._m._get_transformer(
+                    self._m.crs_plot, self._m.get_crs(self._size_crs)
+                )
+                cx, cy = (x0 + x1) / 2, (y0 + y1) / 2
+                (px0, px1), (py0, py1) = t.transform((cx, cx + size), (cy, cy))
+                size = np.hypot(px1 - px0, py1 - py0)
+
+            if not np.isfinite(size) or size <= 0:
+                return None
+
+            # snap the size to powers of 2 to be able to re-use cached indices
+            return float(2.0 ** np.round(np.log2(size)))
+
+        def _get_plot_size(self, size):
+            # get the (approx.) size of the hexagons in the plot-crs
+            if self._plot_crs_q:
+                return size
+
+            ax = self._m.ax
+            (x0, x1), (y0, y1) = ax.get_xlim(), ax.get_ylim()
+            t = self._m._get_transformer(
+                self._m.crs_plot, self._m.get_crs(self._size_crs)
+            )
+            cx, cy = t.transform((x0 + x1) / 2, (y0 + y1) / 2)
+
+            t = self._m._get_transformer(
+                self._m.get_crs(self._size_crs), self._m.crs_plot
+            )
+            (px0, px1), (py0, py1) = t.transform(
+                (cx - size, cx + size), (cy - size, cy + size)
+            )
+            d = np.hypot(px1 - px0, py1 - py0)
+            if not np.isfinite(d):
+                # fallback to 10% of the current extent
+                d = max(abs(x1 - x0), abs(y1 - y0)) / 10
+            return d
+
+        def _get_level(self, size):
+            # get the (cached) hexagon-indices for a given size
+            dm = self._m._data_manager
+            x0, y0 = dm.x0, dm.y0
+
+            if self._hex_cache is None or not (
+                self._hex_cache[0] is x0 and self._hex_cache[1] is y0
+            ):
+                self._hex_cache = (x0, y0, OrderedDict())
+
+            cache = self._hex_cache[2]
+            level = cache.get(size, None)
+            if level is not None:
+                self._m.BM.profiler.cache("hexbin", True)
+                cache.move_to_end(size)
+                return level
+
+            self._m.BM.profiler.cache("hexbin", False)
+
+            x, y = self._get_coords()
+            cx, cy, inverse = self._get_hex_index(x, y, size)
+
+            level = dict(centers=(cx, cy), inverse=inverse, values=dict())
+
+            if self._plot_crs_q:
+                level["plot_centers"] = (cx, cy)
+            else:
+                t = self._m._get_transformer(
+                    self._m.get_crs(self._size_crs), self._m.crs_plot
+                )
+                level["plot_centers"] = t.transform(cx, cy)
+
+            cache[size] = level
+            while len(cache) > self._cache_size:
+                cache.popitem(last=False)
+
+            return level
+
+        def _get_values(self, level, z_data):
+            # get the (cached) aggregated values of the hexagons
+            cached = level["values"].get(self._aggregator, None)
+            if cached is not None and cached[0] is z_data:
+                return cached[1]
+
+            inverse = level["inverse"]
+            valid = inverse >= 0
+            z = None
+            if self._aggregator != "count":
+                z = np.ma.masked_invalid(np.ma.asanyarray(z_data, dtype=float)).ravel()
+                valid &= ~np.ma.getmaskarray(z)
+                z = np.ma.getdata(z)[valid]
+
+            values = Shapes._AggregatePoints._reduce(
+                inverse[valid], z, level["centers"][0].size, self._aggregator
+            )
+            level["values"][self._aggregator] = (z_data, values)
+            return values
+
+        def get_coll(self, x, y, crs, array=None, cmap=None, norm=None, **kwargs):
+            ax = self._m.ax
+            size = self._size if self._size is not None else self._get_level_size()
+            if size is None:
+                raise ValueError(
+                    "EOmaps: Unable to determine the size of the hexagons."
+                )
+
+            level = self._get_level(size)
+
+            # only explicit colors are used if no data-values are provided
+            values = None
+            if array is not None:
+                values = self._get_values(level, self._m._data_manager.z_data)
+
+            # select the hexagons that are visible in the current extent
+            # (use the size of the hexagons as margin)
+            px, py = level["plot_centers"]
+            (x0, x1), (y0, y1) = ax.get_xlim(), ax.get_ylim()
+            d = self._get_plot_size(size)
+
+            mask = (
+                (px >= min(x0, x1) - d)
+                & (px <= max(x0, x1) + d)
+                & (py >= min(y0, y1) - d)
+                & (py <= max(y0, y1) + d)
+            )
+
+            if values is not None:
+                mask &= ~np.ma.getmaskarray(values)
+                array = np.ma.getdata(values)[mask]
+
+            if self._renorm and array is not None:
+                # use a linear normalization of the aggregated values
+                norm = Normalize()
+
+            self._m._data_mask = None
+
+            template = self._get_template(size)
+
+            if self._plot_crs_q:
+                # use a single template-hexagon that is drawn at all offsets
+                coll = PolyCollection(
+                    [template],
+                    offsets=np.column_stack((px[mask], py[mask])),
+                    offset_transform=AffineDeltaTransform(ax.transData),
+                    array=array,
+                    cmap=cmap,
+                    norm=norm,
+                    **kwargs,
+                )
+            else:
+                # transform the hexagons from the size_crs to the plot-crs
+                cx, cy = (c[mask] for c in level["centers"])
+                vx = cx[:, None] + template[:, 0]
+                vy = cy[:, None] + template[:, 1]
+
+                t = self._m._get_transformer(
+                    self._m.get_crs(self._size_crs), self._m.crs_plot
+                )
+                vx, vy = t.transform(vx, vy)
+                verts = np.stack((vx, vy), axis=-1)
+
+                # drop hexagons that could not be transformed
+                finite = np.isfinite(verts).all(axis=(1, 2))
+                if array is not None:
+                    array = array[finite]
+
+                coll = _PolyCollection(
+                    verts=verts[finite],
+                    array=array,
+                    cmap=cmap,
+                    norm=norm,
+                    **kwargs,
+                )
+
+            if self._renorm and array is not None:
+                coll.autoscale()
+
+            return coll
+
     class _ShadePoints(object):
         name = "shade_points"
 
@@ -1658,6 +3413,10 @@ class Shapes(object):
             self._radius = None
             self.radius_crs = "in"
 
+            # the cached lookup-table used to color integer-encoded images
+            # (cmap, norm, vmin, vmax, dtype, fill_value, lut)
+            self._lut = None
+
         def __call__(
             self, maxsize=5e6, interp_order=0, aggregator="mean", valid_fraction=0
         ):
@@ -1689,6 +3448,16 @@ class Shapes(object):
             - use `m.set_shape.rectangles()` if you need "curved" edges!
             - use `m.set_shape.shade_raster()` to use datashader for aggregation
 
+            If the data is provided in the plot-crs and the coordinates represent a
+            regular grid, no reprojection is required and the data is drawn as an
+            image (AxesImage) instead of a QuadMesh (which is a lot faster).
+
+            Integer images (int8, uint8, int16, uint16) are colored with a lookup-table
+            of the colors of all possible values (evaluated on draw and only updated
+            if the colormap or the normalization changes). The fill-value of
+            integer-encoded datasets (e.g. `m.data_specs.encoding["_FillValue"]`)
+            gets the "bad" color.
+
             Parameters
             ----------
             maxsize: int, None
@@ -1710,6 +3479,7 @@ class Shapes(object):
                   reliable aggregated estimate of the actual data)
                 - "min", "max", "mean", "median", "std", "sum": calculate the
                   corresponding metrics of the data inside the aggregation blocks.
+                - "mode": select the most frequent value of the aggregation blocks.
                 - "fast_mean", "fast_sum": use a fast and memory-efficient method to
                   evaluate the corresponding metrics.
                   NOTE: this uses `numpy.einsum` for aggregation which does not check
@@ -1792,12 +3562,9 @@ class Shapes(object):
             t = self._m._get_transformer(in_crs, self._m.crs_plot)
 
             # make sure we do not transform out of bounds (if possible)
-            if in_crs.area_of_use is not None:
-                transformer = self._m._get_transformer(in_crs.geodetic_crs, in_crs)
-
-                xmin, ymin, xmax, ymax = transformer.transform_bounds(
-                    *in_crs.area_of_use.bounds
-                )
+            bounds = crs_registry.get_clip_bounds(in_crs)
+            if bounds is not None:
+                xmin, ymin, xmax, ymax = bounds
 
                 clipx = partial(np.clip, a_min=xmin, a_max=xmax)
                 clipy = partial(np.clip, a_min=ymin, a_max=ymax)
@@ -1854,27 +3621,376 @@ class Shapes(object):
 
             return coll
 
+        # kwargs that are supported if the raster is drawn as an image
+        _image_kwargs = ("array", "cmap", "norm", "alpha", "zorder", "antialiased")
+
+        def _is_identity_transform(self, x, y, crs):
+            # check if the transformation from the given crs to the plot-crs does
+            # not change the coordinates (evaluated on a subset of the coordinates
+            # since crs-equality does not cover equivalent crs definitions)
+            t = self._m._get_transformer(self._m.get_crs(crs), self._m.crs_plot)
+
+            iy = np.unique(np.linspace(0, x.shape[0] - 1, 5).astype(int))
+            ix = np.unique(np.linspace(0, x.shape[1] - 1, 5).astype(int))
+            xs, ys = x[np.ix_(iy, ix)], y[np.ix_(iy, ix)]
+
+            with np.errstate(invalid="ignore"):
+                xt, yt = t.transform(xs, ys)
+
+            # use a tolerance relative to the mean grid-spacing
+            atolx = np.abs(np.nanmean(np.diff(x[0, :]))) * 1e-3
+            atoly = np.abs(np.nanmean(np.diff(y[:, 0]))) * 1e-3
+
+            return np.allclose(xt, xs, rtol=0, atol=atolx) and np.allclose(
+                yt, ys, rtol=0, atol=atoly
+            )
+
+        @staticmethod
+        def _get_regular_grid(x, y):
+            # get the grid-parameters (x0, dx, nx, y0, dy, ny) of the cell-centers
+            # (or None if the coordinates do not represent a regular grid)
+            if x.ndim != 2 or y.ndim != 2 or x.shape[0] < 2 or x.shape[1] < 2:
+                return None
+
+            x, y = np.ma.getdata(x), np.ma.getdata(y)
+
+            # x must only vary along columns and y only along rows
+            xr, yr = x[0, :], y[:, 0]
+
+            dx, dy = np.diff(xr), np.diff(yr)
+            if not (np.isfinite(dx).all() and np.isfinite(dy).all()):
+                return None
+            if dx[0] == 0 or dy[0] == 0:
+                return None
+
+            # allow small numerical deviations from a regular grid
+            atolx, atoly = abs(dx[0]) * 1e-3, abs(dy[0]) * 1e-3
+            if not (
+                np.allclose(dx, dx[0], rtol=0, atol=atolx)
+                and np.allclose(dy, dy[0], rtol=0, atol=atoly)
+                and np.allclose(x, xr[np.newaxis, :], rtol=0, atol=atolx)
+                and np.allclose(y, yr[:, np.newaxis], rtol=0, atol=atoly)
+            ):
+                return None
+
+            return (xr[0], dx[0], len(xr), yr[0], dy[0], len(yr))
+
+        def _get_image_extent(self, x, y, crs):
+            # get the extent of the image (or None if the data cannot be drawn as an
+            # image because it must be reprojected or if the grid is not regular)
+            grid = self._get_regular_grid(x, y)
+            if grid is None:
+                return None
+
+            x, y = np.ma.getdata(x), np.ma.getdata(y)
+            if crs != "out" and not self._is_identity_transform(x, y, crs):
+                return None
+
+            x0, dx, nx, y0, dy, ny = grid
+            return (
+                x0 - dx / 2,
+                x0 + (nx - 0.5) * dx,
+                y0 - dy / 2,
+                y0 + (ny - 0.5) * dy,
+            )
+
+        def _get_image(self, extent, array, cmap=None, norm=None, **kwargs):
+            kwargs.pop("antialiased", None)
+
+            # the data is not aggregated, so we don't need to resample the image
+            # (and we want the pixels to look the same as for QuadMeshes)
+            kwargs.update(
+                cmap=cmap,
+                norm=norm,
+                interpolation="nearest",
+                origin="lower",
+                extent=extent,
+            )
+
+            if supports_lut(array):
+                # color integer-encoded data with a lookup-table
+                # (avoids normalizing and colormapping the values on each draw)
+                im = _LutImage(self._m.ax, get_lut=self._get_lut, **kwargs)
+                im.set_data(array)
+            else:
+                im = AxesImage(self._m.ax, **kwargs)
+                im.set_data(np.ma.masked_invalid(array, copy=False))
+
+            # no need for .contains in EOmaps since pixels are identified internally
+            im.contains = lambda *args, **kwargs: (False, {})
+
+            return im
+
+        def _get_fill_value(self):
+            # get the fill-value of integer-encoded datasets
+            # (class-indices of classified datasets do not use the encoding)
+            encoding = self._m.data_specs.encoding
+            if not encoding or self._m._data_manager._z_class is not None:
+                return None
+            return encoding.get("_FillValue", None)
+
+        def _get_lut(self, cmap, norm, dtype):
+            # get the (cached) lookup-table of the colors of all values
+            # of an integer domain
+            fill_value = self._get_fill_value()
+
+            if self._lut is not None:
+                c, n, *key, lut = self._lut
+                if (
+                    c is cmap
+                    and n is norm
+                    and key == [norm.vmin, norm.vmax, dtype, fill_value]
+                ):
+                    self._m.BM.profiler.cache("lut", True)
+                    return lut
+
+            self._m.BM.profiler.cache("lut", False)
+
+            lut = get_lut(cmap, norm, dtype, fill_value=fill_value)
+            self._lut = (cmap, norm, norm.vmin, norm.vmax, dtype, fill_value, lut)
+            return lut
+
         def get_coll(self, x, y, crs, **kwargs):
 
             x, y = np.asanyarray(x), np.asanyarray(y)
+
+            # use an image if possible (e.g. if the data is a regular grid in the
+            # plot-crs and no explicit colors or collection-properties are used)
+            if kwargs.get("array", None) is not None and all(
+                key in self._image_kwargs for key in kwargs
+            ):
+                extent = self._get_image_extent(x, y, crs)
+                if extent is not None:
+                    self._m._data_mask = None
+                    return self._get_image(extent, **kwargs)
+
             # don't use antialiasing by default since it introduces unwanted
             # transparency for reprojected QuadMeshes!
             kwargs.setdefault("antialiased", False)
 
             return self._get_polygon_coll(x, y, crs, **kwargs)
 
+    class _WarpedRaster(_Raster):
+        name = "warped_raster"
+
+        # cache for the inverse index-maps (shared by all Maps-objects so that
+        # datasets on the same grid only need to gather the values)
+        _index_cache = OrderedDict()
+        _index_cache_size = 10
+
+        def __init__(self, m):
+            super().__init__(m=m)
+            self._method = "nearest"
+            # the shape of the pixel-grid used for the last index-map
+            self._grid_shape = None
+
+        def __call__(self, method="nearest"):
+            """
+            Draw the data as a raster that is warped to the screen-pixels.
+
+            The screen-pixels of the current map-extent are mapped back to the
+            data-crs and the values are looked up in the source-array.
+            This avoids reprojecting the vertices of all raster-cells and is very
+            fast for large reprojected rasters.
+
+            The index-map of the screen-pixels is cached with respect to the
+            extent, the size of the axes, the crs and the data-grid (e.g. updating
+            the values of another dataset on the same grid is a simple lookup).
+
+            Note
+            ----
+            The data must be provided on a regular grid in the data-crs.
+            (e.g. 1D coordinates + 2D data or regularly spaced 2D coordinates)
+
+            If the grid is not regular (or if explicit colors or properties that
+            are only supported by collections are used), the data is drawn as
+            an ordinary `raster`.
+
+            Parameters
+            ----------
+            method : str, optional
+                The method used to lookup the values.
+
+                - "nearest": use the value of the closest raster-cell
+                - "bilinear": use bilinear interpolation of the closest raster-cells
+
+                The default is "nearest".
+
+            """
+            from . import MapsGrid  # do this here to avoid circular imports!
+
+            if method not in ("nearest", "bilinear"):
+                raise TypeError(
+                    f"EOmaps: '{method}' is not a valid warp-method... "
+                    "use one of ('nearest', 'bilinear')"
+                )
+
+            for m in self._m if isinstance(self._m, MapsGrid) else [self._m]:
+                shape = self.__class__(m)
+                shape._method = method
+                m._shape = shape
+
+        @property
+        def _initargs(self):
+            return dict(method=self._method)
+
+        def __repr__(self):
+            return f"warped_raster(method={self._method})"
+
+        def _get_grid_shape(self):
+            # get a grid with the resolution of the screen-pixels
+            bbox = self._m.ax.bbox
+            return max(1, int(np.ceil(bbox.height))), max(1, int(np.ceil(bbox.width)))
+
+        def _redraw_required(self):
+            # re-evaluate the index-map if the size of the axes changed
+            # (not required if the data is drawn as an ordinary raster)
+            if self._grid_shape is None:
+                return False
+            return self._grid_shape != self._get_grid_shape()
+
+        def _get_index_map(self, grid, crs):
+            # get the (cached) mapping of the screen-pixels to the data-grid
+            ax = self._m.ax
+            self._grid_shape = ny, nx = self._get_grid_shape()
+            extent = (*ax.get_xlim(), *ax.get_ylim())
+
+            in_crs = self._m.get_crs(crs)
+            key = (
+                in_crs.to_wkt(),
+                self._m.get_crs("out").to_wkt(),
+                extent,
+                (nx, ny),
+                grid,
+                self._method,
+            )
+
+            cache = Shapes._WarpedRaster._index_cache
+            index_map = cache.get(key, None)
+            self._m.BM.profiler.cache("warp_index", index_map is not None)
+            if index_map is not None:
+                cache.move_to_end(key)
+                return index_map, extent
+
+            x0, x1, y0, y1 = extent
+            gx0, gdx, gnx, gy0, gdy, gny = grid
+
+            # the pixel-centers in the plot-crs
+            px = x0 + (np.arange(nx) + 0.5) * (x1 - x0) / nx
+            py = y0 + (np.arange(ny) + 0.5) * (y1 - y0) / ny
+            px, py = np.meshgrid(px, py)
+
+            t = self._m._get_transformer(self._m.get_crs("out"), in_crs)
+            with np.errstate(invalid="ignore"):
+                xd, yd = t.transform(px, py)
+
+            if in_crs.is_geographic:
+                # wrap longitudes to the range of the data
+                xmin = min(gx0, gx0 + (gnx - 1) * gdx) - abs(gdx) / 2
+                with np.errstate(invalid="ignore"):
+                    xd = (xd - xmin) % 360 + xmin
+
+            # the fractional index of the pixels on the data-grid
+            with np.errstate(invalid="ignore"):
+                fi = (xd - gx0) / gdx
+                fj = (yd - gy0) / gdy
+
+                valid = (fi > -0.5) & (fi < gnx - 0.5) & (fj > -0.5) & (fj < gny - 0.5)
+
+            if self._method == "bilinear":
+                i0 = np.clip(np.floor(fi[valid]), 0, gnx - 2).astype(np.intp)
+                j0 = np.clip(np.floor(fj[valid]), 0, gny - 2).astype(np.intp)
+
+                index_map = dict(
+                    valid=valid,
+                    idx=j0 * gnx + i0,
+                    wx=np.clip(fi[valid] - i0, 0, 1),
+                    wy=np.clip(fj[valid] - j0, 0, 1),
+                    nx=gnx,
+                )
+            else:
+                i = np.rint(fi[valid]).astype(np.intp)
+                j = np.rint(fj[valid]).astype(np.intp)
+                index_map = dict(valid=valid, idx=j * gnx + i)
+
+            cache[key] = index_map
+            while len(cache) > Shapes._WarpedRaster._index_cache_size:
+                cache.popitem(last=False)
+
+            return index_map, extent
+
+        def _get_warped_image(self, grid, crs, array, **kwargs):
+            index_map, extent = self._get_index_map(grid, crs)
+
+            array = np.ma.masked_invalid(array, copy=False)
+            data, mask = np.ma.getdata(array).ravel(), np.ma.getmaskarray(array).ravel()
+
+            valid, idx = index_map["valid"], index_map["idx"]
+
+            if self._method == "bilinear":
+                wx, wy, nx = index_map["wx"], index_map["wy"], index_map["nx"]
+
+                idx = (idx, idx + 1, idx + nx, idx + nx + 1)
+                v00, v01, v10, v11 = (data.take(i).astype(float) for i in idx)
+
+                vals = (v00 * (1 - wx) + v01 * wx) * (1 - wy) + (
+                    v10 * (1 - wx) + v11 * wx
+                ) * wy
+                vals_mask = np.logical_or.reduce([mask.take(i) for i in idx])
+            else:
+                vals = data.take(idx)
+                vals_mask = mask.take(idx)
+
+            img = np.ma.masked_all(valid.shape, dtype=vals.dtype)
+            img[valid] = np.ma.masked_array(vals, vals_mask)
+
+            return self._get_image(extent, img, **kwargs)
+
+        def get_coll(self, x, y, crs, **kwargs):
+            x, y = np.asanyarray(x), np.asanyarray(y)
+
+            if kwargs.get("array", None) is not None and all(
+                key in self._image_kwargs for key in kwargs
+            ):
+                grid = self._get_regular_grid(x, y)
+                if grid is not None:
+                    self._m._data_mask = None
+                    return self._get_warped_image(grid, crs, **kwargs)
+
+            _log.debug(
+                "EOmaps: Unable to warp the raster... (the data is not on a "
+                "regular grid or explicit colors are used). Drawing the data as "
+                "an ordinary raster instead."
+            )
+            return super().get_coll(x, y, crs, **kwargs)
+
     class _Contour(object):
         name = "contour"
 
+        # the max. number of cached contours
+        _cache_size = 10
+
         def __init__(self, m):
             self._m = m
             self._radius = None
             self.radius_crs = "in"
 
-        def __call__(self, filled=True):
+            self._filled = True
+            self._init_maxsize = "auto"
+            self._aggregator = "mean"
+            self._valid_fraction = 0
+
+            # the cached min/max of the full dataset (z_data, zmin, zmax)
+            self._zrange = None
+
+        def __call__(self, filled=True, maxsize="auto", aggregator="mean"):
             """
             Draw a contour-plot of the data.
 
+            The contours are evaluated for the visible data and re-evaluated
+            if the extent of the map changes. Contours that have already been
+            evaluated for an extent are cached and re-used.
+
             Note
             ----
             This is a wrapper for matpltolibs contour-plot capabilities.
@@ -1882,18 +3998,153 @@ class Shapes(object):
             - contours for 2D datasets are evaluated with `plt.contour`
             - contours for 1D datasets are evaluated with `plt.tricontour`
 
+            Parameters
+            ----------
+            filled : bool, optional
+                Indicator if filled contours (True) or contour-lines (False)
+                should be drawn. The default is True.
+            maxsize : int, "auto" or None, optional
+                ONLY relevant for 2D datasets.
+
+                If provided, the visible data is aggregated prior to evaluating
+                the contours such that it contains approximately `maxsize`
+                datapoints. If "auto", the number of pixels of the axes is used.
+                If None, no aggregation is performed.
+                The default is "auto".
+            aggregator : str, optional
+                The method used for aggregation.
+                (see `m.set_shape.raster` for details)
+                The default is "mean".
+
             """
             from . import MapsGrid  # do this here to avoid circular imports!
 
             for m in self._m if isinstance(self._m, MapsGrid) else [self._m]:
                 shape = self.__class__(m)
                 shape._filled = filled
+                shape._init_maxsize = maxsize
+                shape._aggregator = aggregator
 
                 m._shape = shape
 
         @property
         def _initargs(self):
-            return dict(filled=self._filled)
+            return dict(
+                filled=self._filled,
+                maxsize=self._init_maxsize,
+                aggregator=self._aggregator,
+            )
+
+        @property
+        def _maxsize(self):
+            # the max. number of datapoints used to evaluate contours of 2D data
+            if self._init_maxsize == "auto":
+                bbox = self._m.ax.bbox
+                return max(int(bbox.width * bbox.height), 1)
+            return self._init_maxsize
+
+        def _get_zrange(self, z):
+            # get the (cached) min/max of the full dataset
+            z_data = self._m._data_manager.z_data
+            if z_data is None:
+                return np.nanmin(z), np.nanmax(z)
+
+            if self._zrange is None or self._zrange[0] is not z_data:
+                vals = np.ma.masked_invalid(z_data, copy=False)
+                self._zrange = (z_data, vals.min(), vals.max())
+
+            return self._zrange[1:]
+
+        def _get_default_levels(self, z, n=7, extend="neither", log=False):
+            # get default contour-levels that span the range of the full dataset
+            # (same as matplotlib's default levels, but independent of the extent)
+            zmin, zmax = self._get_zrange(z)
+            if log and zmin <= 0:
+                z_data = self._m._data_manager.z_data
+                z_data = z if z_data is None else z_data
+                zmin = np.ma.masked_less_equal(z_data, 0, copy=False).min()
+
+            if log:
+                locator = LogLocator()
+            else:
+                locator = MaxNLocator(n + 1, min_n_ticks=1)
+            levels = locator.tick_values(zmin, zmax)
+
+            # trim excess levels (see matplotlib.contour.ContourSet._autolev)
+            under = np.nonzero(levels < zmin)[0]
+            i0 = under[-1] if len(under) else 0
+            over = np.nonzero(levels > zmax)[0]
+            i1 = over[0] + 1 if len(over) else len(levels)
+            if extend in ("min", "both"):
+                i0 += 1
+            if extend in ("max", "both"):
+                i1 -= 1
+            if i1 - i0 < 3:
+                i0, i1 = 0, len(levels)
+
+            return levels[i0:i1]
+
+        def _get_cache_key(self, levels=None, **kwargs):
+            dm = self._m._data_manager
+            if levels is None or dm.last_extent is None:
+                return None
+
+            return (
+                tuple(dm.last_extent),
+                self._filled,
+                tuple(np.atleast_1d(levels)),
+                self._maxsize,
+                self._aggregator,
+            )
+
+        @staticmethod
+        def _get_segments(cont):
+            # get the segments (and path-codes) of all contour-levels
+            if isinstance(cont, Collection):
+                # matplotlib >= 3.8 (ContourSet is a Collection)
+                paths = cont.get_paths()
+                allsegs = [[p.vertices] for p in paths]
+                allkinds = [[p.codes] for p in paths]
+                return allsegs, allkinds
+            else:
+                return cont.allsegs, cont.allkinds
+
+        @property
+        def _contour_cache(self):
+            # the cached contours (key: dict(levels, allsegs, allkinds))
+            # (contours are cached with the data and cleared if the data changes)
+            return self._m._data_manager._contour_cache
+
+        def _get_cached_contour(self, key, **kwargs):
+            # re-create a contour-set from cached segments
+            cached = self._contour_cache.get(key, None) if key is not None else None
+            if cached is None:
+                self._m.BM.profiler.cache("contour", False)
+                return None
+
+            self._m.BM.profiler.cache("contour", True)
+            self._contour_cache.move_to_end(key)
+
+            kwargs.pop("levels", None)
+            return ContourSet(
+                self._m.ax,
+                cached["levels"],
+                cached["allsegs"],
+                cached["allkinds"],
+                filled=self._filled,
+                **kwargs,
+            )
+
+        def _cache_contour(self, key, cont):
+            if key is None:
+                return
+
+            allsegs, allkinds = self._get_segments(cont)
+            self._contour_cache[key] = dict(
+                levels=cont.levels, allsegs=allsegs, allkinds=allkinds
+            )
+            while len(self._contour_cache) > self._cache_size:
+                self._contour_cache.popitem(last=False)
 
         @property
         def radius(self):
@@ -1918,14 +4169,27 @@ class Shapes(object):
 
             # if manual levels were specified, use them, otherwise check for
             # classification values
-            if "levels" not in kwargs:
-                bins = getattr(self._m.classify_specs, "_bins", None)
-                if bins is not None:
-                    # in order to ensure that values above or below vmin/vmax are
-                    # colored with the appropriate "under" and "over" colors,
-                    # we need to extend the classification bins with the min/max values
-                    # of the data (otherwise only intermediate levels would be drawn!)
-                    kwargs["levels"] = np.unique([z.min(), *bins, z.max()])
+            bins = getattr(self._m.classify_specs, "_bins", None)
+            levels = kwargs.get("levels", None)
+            if levels is None and bins is not None:
+                # in order to ensure that values above or below vmin/vmax are
+                # colored with the appropriate "under" and "over" colors,
+                # we need to extend the classification bins with the min/max values
+                # of the data (otherwise only intermediate levels would be drawn!)
+                # (use the full dataset to get consistent levels for all extents)
+                zmin, zmax = self._get_zrange(z)
+                kwargs["levels"] = np.unique([zmin, *bins, zmax])
+            elif (levels is None or isinstance(levels, (int, np.integer))) and (
+                "locator" not in kwargs
+            ):
+                # derive the default levels once from the full dataset
+                # (otherwise the levels would change with the visible extent)
+                kwargs["levels"] = self._get_default_levels(
+                    z,
+                    n=7 if levels is None else levels,
+                    extend=kwargs.get("extend", "neither"),
+                    log=isinstance(kwargs.get("norm", None), LogNorm),
+                )
 
             # transform from crs to the plot_crs
             in_crs = self._m.get_crs(crs)
@@ -1964,6 +4228,13 @@ class Shapes(object):
             if "colors" in kwargs:
                 color_and_array.pop("cmap", None)
                 color_and_array.pop("norm", None)
+
+            # re-use contours that have already been evaluated for the extent
+            key = self._get_cache_key(**color_and_array)
+            cont = self._get_cached_contour(key, **color_and_array)
+            if cont is not None:
+                return _CollectionAccessor(cont, self._filled)
+
             if self._filled:
                 if use_tri:
                     cont = self._m.ax.tricontourf(
@@ -1983,6 +4254,8 @@ class Shapes(object):
                         "x", "y", "z", data=data, **color_and_array
                     )
 
+            self._cache_contour(key, cont)
+
             return _CollectionAccessor(cont, self._filled)
 
         def get_coll(self, x, y, crs, **kwargs):
@@ -2024,11 +4297,21 @@ class Shapes(object):
         shp = self._Rectangles(m=self._m)
         return shp.__call__(*args, **kwargs)
 
+    @wraps(_AutoLod.__call__)
+    def auto_lod(self, *args, **kwargs):
+        shp = self._AutoLod(m=self._m)
+        return shp.__call__(*args, **kwargs)
+
     @wraps(_Raster.__call__)
     def raster(self, *args, **kwargs):
         shp = self._Raster(m=self._m)
         return shp.__call__(*args, **kwargs)
 
+    @wraps(_WarpedRaster.__call__)
+    def warped_raster(self, *args, **kwargs):
+        shp = self._WarpedRaster(m=self._m)
+        return shp.__call__(*args, **kwargs)
+
     @wraps(_VoronoiDiagram.__call__)
     def voronoi_diagram(self, *args, **kwargs):
         shp = self._VoronoiDiagram(m=self._m)
@@ -2043,6 +4326,16 @@ class Shapes(object):
         shp = self._DelaunayTriangulation(m=self._m)
         return shp.__call__(*args, **kwargs)
 
+    @wraps(_AggregatePoints.__call__)
+    def aggregate_points(self, *args, **kwargs):
+        shp = self._AggregatePoints(m=self._m)
+        return shp.__call__(*args, **kwargs)
+
+    @wraps(_Hexbin.__call__)
+    def hexbin(self, *args, **kwargs):
+        shp = self._Hexbin(m=self._m)
+        return shp.__call__(*args, **kwargs)
+
     @wraps(_ShadePoints.__call__)
     def shade_points(self, *args, **kwargs):
         shp = self._ShadePoints(m=self._m)
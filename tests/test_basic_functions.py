@@ -5,6 +5,7 @@ import matplotlib as mpl
 import matplotlib.pyplot as plt
 from matplotlib.gridspec import GridSpec
 from matplotlib.backend_bases import MouseEvent, KeyEvent
+from matplotlib.collections import PolyCollection
 
 import pandas as pd
 import numpy as np
@@ -255,6 +256,192 @@ class TestBasicPlotting(unittest.TestCase):
 
         plt.close(m.f)
 
+    def test_sampled_classification(self):
+        x, y = np.meshgrid(np.linspace(-50, 50, 600), np.linspace(-40, 40, 500))
+        data = np.random.default_rng(0).gamma(2, 2, x.shape)
+
+        bins = dict()
+        for method in (None, "random", "stratified", "histogram"):
+            m = Maps(4326)
+            m.set_data(data, x, y, crs=4326)
+            m.set_shape.raster()
+            m.set_classify.Quantiles(k=5, sample_size=10000, sample_method=method)
+            m.plot_map()
+
+            info = m.classify_specs.sample_info
+            self.assertEqual(info["total"], data.size)
+            self.assertEqual(info["exact"], method is None)
+            if method is not None:
+                self.assertTrue(info["size"] <= 10000)
+
+            bins[method] = m.classify_specs._bins
+            plt.close("all")
+
+        for method in ("random", "stratified", "histogram"):
+            np.testing.assert_allclose(bins[method], bins[None], rtol=0.05)
+
+        # by default, the classification is exact
+        m = Maps(4326)
+        m.set_data(data, x, y, crs=4326)
+        m.set_shape.raster()
+        m.set_classify_specs(scheme="Quantiles", k=5)
+        m.plot_map()
+        self.assertTrue(m.classify_specs.sample_info["exact"])
+        np.testing.assert_allclose(m.classify_specs._bins, bins[None])
+        plt.close("all")
+
+        # invalid sample methods raise an error
+        m = Maps(4326)
+        m.set_data(data, x, y, crs=4326)
+        m.set_classify.Quantiles(k=5, sample_size=10000, sample_method="asdf")
+        with self.assertRaises(ValueError):
+            m.plot_map()
+        plt.close("all")
+
+        # EqualInterval bins are always exact (only min/max are required)
+        m = Maps(4326)
+        m.set_data(data, x, y, crs=4326)
+        m.set_shape.raster()
+        m.set_classify.EqualInterval(k=5, sample_size=10000)
+        m.plot_map()
+        self.assertTrue(m.classify_specs.sample_info["exact"])
+        np.testing.assert_allclose(
+            m.classify_specs._bins,
+            np.linspace(data.min(), data.max(), 6),
+        )
+        plt.close("all")
+
+    def test_classification_cache(self):
+        from eomaps._classification import clear_cache, get_fingerprint
+
+        data = np.random.default_rng(0).normal(size=(200, 300))
+        clear_cache()
+
+        m = Maps(4326)
+        m.BM.profiler.start()
+        m.set_data(data, np.arange(200) - 100, np.arange(300) - 150, crs=4326)
+        m.set_shape.raster()
+        m.set_classify.Quantiles(k=5)
+        m.plot_map()
+
+        # re-plotting the same data with the same classification uses the cache
+        m2 = m.new_layer(inherit_data=True, inherit_classification=False)
+        m2.set_shape.raster()
+        m2.set_classify.Quantiles(k=5)
+        m2.plot_map()
+
+        # a different classification is evaluated
+        m3 = m.new_layer(inherit_data=True)
+        m3.set_shape.raster()
+        m3.set_classify.Quantiles(k=4)
+        m3.plot_map()
+
+        self.assertEqual(m.BM.profiler._cache["classification"], [1, 2])
+        np.testing.assert_equal(m2.classify_specs._bins, m.classify_specs._bins)
+        self.assertEqual(len(m3.classify_specs._bins), 5)
+        # norms are not shared
+        self.assertFalse(m2.classify_specs._norm is m.classify_specs._norm)
+
+        # changed data results in a different fingerprint
+        data2 = data.copy()
+        data2[-1, -1] += 1
+        self.assertNotEqual(get_fingerprint(data), get_fingerprint(data2))
+        self.assertEqual(get_fingerprint(data), get_fingerprint(data.copy()))
+
+        # ... also if only values that are not sampled for the checksum change
+        # (and the min/max of the data remains the same)
+        data3 = data.copy()
+        sampled = np.zeros(data.size, dtype=bool)
+        sampled[np.linspace(0, data.size - 1, 4096).astype(int)] = True
+        data3.ravel()[~sampled] = 0.5
+        self.assertNotEqual(get_fingerprint(data), get_fingerprint(data3))
+
+        m4 = m.new_layer()
+        m4.set_data(data3, np.arange(200) - 100, np.arange(300) - 150, crs=4326)
+        m4.set_shape.raster()
+        m4.set_classify.Quantiles(k=5)
+        m4.plot_map()
+        self.assertEqual(m.BM.profiler._cache["classification"], [1, 3])
+        self.assertFalse(
+            np.array_equal(m4.classify_specs._bins, m.classify_specs._bins)
+        )
+
+        plt.close("all")
+
+    def test_class_indices(self):
+        data = np.random.default_rng(0).normal(size=(200, 300))
+        data[10, 20] = np.nan
+
+        for shape in ("raster", "rectangles"):
+            with self.subTest(shape=shape):
+                colors = []
+                for class_indices in (False, True):
+                    m = Maps(4326)
+                    m.set_data(
+                        data, np.arange(200) - 100, np.arange(300) - 150, crs=4326
+                    )
+                    getattr(m.set_shape, shape)()
+                    m.set_classify.Quantiles(k=5)
+                    m.classify_specs._class_indices = class_indices
+                    m.plot_map(vmin=-1)
+                    m.f.canvas.draw()
+
+                    if class_indices:
+                        z, vals = m._data_manager._z_class, m._data_manager.z_data
+                        self.assertEqual(z.dtype, np.uint8)
+                        np.testing.assert_equal(z.mask, np.isnan(vals))
+                        np.testing.assert_equal(
+                            z[~z.mask],
+                            np.digitize(vals, m._bins)[~z.mask],
+                        )
+                        self.assertEqual(m.coll.get_array().dtype, np.uint8)
+                        # picked values are the data-values
+                        self.assertEqual(
+                            m._data_manager._get_val_from_index(5), vals.flat[5]
+                        )
+                        # colorbars use the data-values
+                        cb = m.add_colorbar()
+                        self.assertEqual(cb._vmin, -1)
+                    else:
+                        self.assertIsNone(m._data_manager._z_class)
+
+                    colors.append(m.coll.to_rgba(m.coll.get_array()))
+                    plt.close("all")
+
+                np.testing.assert_allclose(*colors)
+
+    def test_class_indices_aggregation(self):
+        data = np.random.default_rng(0).normal(size=(400, 600))
+
+        for aggregator in ("first", "max", "mean", "std", "spline", "mode"):
+            with self.subTest(aggregator=aggregator):
+                colors = []
+                for class_indices in (False, True):
+                    m = Maps(4326)
+                    m.set_data(
+                        data, np.arange(400) - 200, np.arange(600) - 300, crs=4326
+                    )
+                    m.set_shape.raster(maxsize=10000, aggregator=aggregator)
+                    m.set_classify.Quantiles(k=5)
+                    m.classify_specs._class_indices = class_indices
+                    m.plot_map()
+                    m.f.canvas.draw()
+
+                    if class_indices:
+                        # class-indices are only used if the aggregation preserves
+                        # the classes of the data
+                        self.assertEqual(
+                            m._data_manager._z_class is not None,
+                            aggregator in ("first", "max", "mode"),
+                        )
+
+                    colors.append(m.coll.to_rgba(m.coll.get_array()))
+                    plt.close("all")
+
+                # (the mode of class-indices is the most frequent class)
+                if aggregator != "mode":
+                    np.testing.assert_allclose(*colors)
+
     def test_add_callbacks(self):
         m = Maps(3857, layer="layername")
         m.data = self.data.sample(10)
@@ -655,6 +842,118 @@ class TestBasicPlotting(unittest.TestCase):
 
         plt.close("all")
 
+    def test_colorbar_histogram(self):
+        data = np.random.default_rng(0).normal(size=(200, 300))
+        data[0, :3] = (np.nan, np.inf, 5)
+
+        m = Maps(4326)
+        m.set_data(data, np.arange(200) - 100, np.arange(300) - 150, crs=4326)
+        m.set_shape.raster()
+        m.set_classify.Quantiles(k=5)
+        m.classify_specs._class_indices = True
+        m.plot_map(vmin=-1, vmax=1.5)
+        m.BM.profiler.start()
+
+        z = data[np.isfinite(data)]
+        for hist_bins, out_of_range_vals in (
+            (10, "clip"),
+            ("bins", "clip"),
+            (10, "mask"),
+        ):
+            with self.subTest(hist_bins=hist_bins, out_of_range_vals=out_of_range_vals):
+                cb = m.add_colorbar(
+                    hist_bins=hist_bins, out_of_range_vals=out_of_range_vals
+                )
+                bins = m._bins if hist_bins == "bins" else hist_bins
+                if out_of_range_vals == "clip":
+                    expected = np.histogram(z.clip(-1, 1.5), bins, range=(-1, 1.5))[0]
+                else:
+                    expected = np.histogram(z, bins, range=(-1, 1.5))[0]
+
+                np.testing.assert_equal(cb._hist[0], expected)
+                np.testing.assert_equal(cb._hist[2], (z.min(), z.max()))
+                self.assertEqual(cb._extend, "both")
+                cb.remove()
+
+        # histograms are cached with the data and re-used on re-draws
+        cb = m.add_colorbar(hist_bins=10)
+        cb._redraw_colorbar()
+        self.assertEqual(m.BM.profiler._cache["colorbar_hist"], [2, 3])
+
+        # histograms of sampled data
+        cb2 = m.add_colorbar(hist_bins=10, hist_sample_size=1000)
+        self.assertEqual(cb2._hist[0].sum(), 1000)
+
+        # changing the data invalidates the cache
+        m.set_data(data * 2, np.arange(200) - 100, np.arange(300) - 150, crs=4326)
+        m.plot_map(vmin=-1, vmax=1.5)
+        self.assertEqual(len(m._data_manager._hist_cache), 0)
+
+        plt.close("all")
+
+    def test_colorbar_histogram_collection(self):
+        data = np.random.default_rng(0).normal(size=(100, 100))
+
+        m = Maps(4326)
+        m.set_data(data, np.arange(100) - 50, np.arange(100) - 50, crs=4326)
+        m.set_shape.raster()
+        m.set_classify.EqualInterval(k=7)
+        m.plot_map(vmin=-2, vmax=2)
+
+        for orientation in ("horizontal", "vertical"):
+            with self.subTest(orientation=orientation):
+                cb = m.add_colorbar(
+                    hist_bins=10,
+                    orientation=orientation,
+                    hist_kwargs=dict(density=True),
+                )
+                # the histogram is drawn as a single collection
+                self.assertIsInstance(cb._hist_coll, PolyCollection)
+                self.assertEqual(len(cb.ax_cb_plot.patches), 0)
+
+                # bars are split at class-boundaries
+                counts, edges, _ = cb._hist
+                self.assertGreater(len(cb._hist_coll.get_paths()), len(counts))
+
+                # the area of the (split) bars matches the density
+                verts = np.array([p.vertices[:4] for p in cb._hist_coll.get_paths()])
+                if orientation == "vertical":
+                    verts = verts[..., ::-1]
+                widths = np.ptp(verts[..., 0], axis=1)
+                heights = np.ptp(verts[..., 1], axis=1)
+                self.assertAlmostEqual((widths * heights).sum(), 1)
+                cb.remove()
+
+        # "log" is mapped to a logarithmic histogram-axis (also on re-draws)
+        # and unsupported plt.hist kwargs are ignored with a warning
+        with self.assertLogs("eomaps", level="WARNING") as logs:
+            cb = m.add_colorbar(hist_kwargs=dict(log=True, histtype="step", alpha=0.5))
+        self.assertIn("['histtype']", logs.output[0])
+        self.assertEqual(cb._hist_kwargs, dict(alpha=0.5))
+        cb._redraw_colorbar()
+        self.assertEqual(cb.ax_cb_plot.get_yscale(), "log")
+
+        # the limits of log-histograms contain all bars
+        for orientation in ("horizontal", "vertical"):
+            for density in (False, True):
+                with self.subTest(orientation=orientation, density=density):
+                    cb = m.add_colorbar(
+                        hist_bins=50,
+                        orientation=orientation,
+                        log=True,
+                        hist_kwargs=dict(density=density),
+                    )
+                    heights, _ = cb._get_hist_heights(density=density)
+                    if orientation == "horizontal":
+                        lims = cb.ax_cb_plot.get_ylim()
+                    else:
+                        lims = cb.ax_cb_plot.get_xlim()
+                    self.assertLessEqual(min(lims), heights[heights > 0].min())
+                    self.assertGreaterEqual(max(lims), heights.max())
+                    cb.remove()
+
+        plt.close("all")
+
     def test_MapsGrid(self):
         mg = MapsGrid(2, 2, crs=4326)
         mg.set_data(
@@ -1369,3 +1668,200 @@ class TestBasicPlotting(unittest.TestCase):
         )
         m.BM.blit_artists([line])
         plt.close("all")
+
+    def test_bg_layer_invalidation(self):
+        m = Maps(ax=121)
+        m.set_data(self.data, x="x", y="y", crs=3857)
+        m.plot_map()
+
+        m2 = m.new_map(ax=122, layer="other")
+        m2.set_data(self.data, x="x", y="y", crs=3857)
+        m2.plot_map()
+
+        m.f.canvas.draw()
+        m.BM.fetch_bg("other")
+
+        bg_base = m.BM._bg_layers["base"]
+        self.assertIn("other", m.BM._bg_layers)
+
+        # zooming the map on the "other" layer must not re-fetch the "base" layer
+        m2.set_extent((-10, 10, -10, 10))
+        m.f.canvas.draw()
+
+        self.assertIs(m.BM._bg_layers["base"], bg_base)
+        self.assertNotIn("other", m.BM._bg_layers)
+
+        # a layer that is shown again must be re-fetched with the new extent
+        m.show_layer("other")
+        m.f.canvas.draw()
+        self.assertIn("other", m.BM._bg_layers)
+
+        # a re-draw without arguments clears all cached layers
+        m.redraw()
+        m.f.canvas.draw()
+        self.assertNotIn("base", m.BM._bg_layers)
+
+        plt.close("all")
+
+    def test_interactive_preview(self):
+        m = Maps()
+        m.set_data(self.data, x="x", y="y", crs=3857)
+        m.plot_map()
+        m.BM.set_interactive_preview(True, delay=100)
+        m.f.canvas.draw()
+
+        # non-interactive backends always re-draw the background
+        bg = m.BM._bg_layers["base"]
+        m.set_extent((-40, 40, -20, 20))
+        m.f.canvas.draw()
+        self.assertIsNot(m.BM._bg_layers["base"], bg)
+        self.assertFalse(m.BM._preview_pending)
+
+        m.BM.set_interactive_preview(False)
+        plt.close("all")
+
+    def test_profiler(self):
+        m = Maps()
+        m.set_data(self.data, x="x", y="y", crs=3857)
+        m.plot_map()
+
+        records = []
+        m.BM.profiler.add_callback(lambda *args: records.append(args))
+
+        m.f.canvas.draw()
+        self.assertEqual(len(records), 0)
+
+        m.BM.profiler.start()
+        m.set_extent((-40, 40, -20, 20))
+        m.f.canvas.draw()
+        m.BM.profiler.stop()
+
+        self.assertTrue(len(records) > 0)
+        self.assertIn(("stage", "on_draw"), {i[:2] for i in records})
+        self.assertIsInstance(m.BM.profiler.report(), str)
+
+        df = m.BM.profiler.report(as_dataframe=True)
+        self.assertTrue(
+            {"on_draw", "fetch_bg", "data_select"}.issubset(df["name"].values)
+        )
+
+        m.BM.profiler.clear()
+        self.assertEqual(len(m.BM.profiler.report(as_dataframe=True)), 0)
+        plt.close("all")
+
+    def test_bg_layer_cache(self):
+        for storage in ("compress", "memmap"):
+            m = Maps()
+            m.set_data(self.data, x="x", y="y", crs=3857)
+            m.plot_map()
+            for layer in ("A", "B", "C"):
+                m2 = m.new_layer(layer)
+                m2.set_data(self.data, x="x", y="y", crs=3857)
+                m2.plot_map(ec="r")
+
+            m.BM.set_bg_layer_cache(max_layers=4, storage=storage)
+            m.f.canvas.draw()
+            m.fetch_layers()
+
+            self.assertTrue(len(m.BM._bg_layers) <= 4)
+            self.assertTrue(len(m.BM._bg_layer_store) > 0)
+
+            # evicted layers are restored without re-drawing
+            layer = next(iter(m.BM._bg_layer_store))
+            m.BM.profiler.start()
+            m.show_layer(layer)
+            m.f.canvas.draw()
+            self.assertEqual(m.BM.profiler._cache["bg_store"], [1, 0])
+            self.assertNotIn(layer, m.BM._bg_layer_store)
+
+            # evicted layers are re-drawn if the extent changed
+            layer = next(iter(m.BM._bg_layer_store))
+            m.set_extent((-40, 40, -20, 20))
+            m.f.canvas.draw()
+            m.show_layer(layer)
+            m.f.canvas.draw()
+            self.assertEqual(m.BM.profiler._cache["bg_store"][0], 1)
+            self.assertIn(layer, m.BM._bg_layers)
+
+            m.BM.set_bg_layer_cache(None)
+            plt.close("all")
+
+        # invalid storages raise an error
+        m = Maps()
+        with self.assertRaises(ValueError):
+            m.BM.set_bg_layer_cache(max_layers=4, storage="asdf")
+        plt.close("all")
+
+    def test_artist_registry(self):
+        m = Maps()
+        l1 = plt.Line2D([0, 1], [0, 1], zorder=2)
+        l2 = plt.Line2D([0, 1], [1, 0], zorder=1)
+        m.ax.add_artist(l1)
+        m.ax.add_artist(l2)
+
+        # artists that are not managed by the blit-manager
+        self.assertTrue({l1, l2}.issubset(m.BM._get_unmanaged_artists()))
+
+        m.BM.add_bg_artist(l1, layer="lines")
+        m.BM.add_bg_artist(l2, layer="lines")
+        self.assertFalse({l1, l2} & m.BM._get_unmanaged_artists())
+        self.assertEqual(m.BM.get_bg_artists("lines"), [l2, l1])
+
+        # zorder changes are respected
+        l2.set_zorder(3)
+        self.assertEqual(m.BM.get_bg_artists("lines"), [l1, l2])
+
+        m.BM.remove_bg_artist(l1)
+        self.assertEqual(m.BM.get_bg_artists("lines"), [l2])
+        self.assertIn(l1, m.BM._get_unmanaged_artists())
+
+        m.BM._cleanup_bg_artists("lines")
+        self.assertNotIn(l2, m.BM._managed_artists)
+
+        # changes in the middle of the children of the axes are detected
+        l3 = plt.Line2D([0, 1], [0, 0])
+        m.ax.add_artist(l3)
+        self.assertIn(l3, m.BM._get_unmanaged_artists())
+        l1.remove()
+        self.assertNotIn(l1, m.BM._get_unmanaged_artists())
+        self.assertIn(l3, m.BM._get_unmanaged_artists())
+
+        # unchanged children are not re-evaluated
+        cached = m.ax._children.unmanaged
+        m.BM._get_unmanaged_artists()
+        self.assertIs(m.ax._children.unmanaged, cached)
+        plt.close("all")
+
+    def test_crs_registry(self):
+        from eomaps._crs_registry import crs_registry
+
+        m = Maps(Maps.CRS.Mollweide())
+
+        # transformers and crs-metadata are cached once per process
+        t = m._get_transformer(4326, m.crs_plot)
+        self.assertTrue(m._get_transformer(4326, m.crs_plot) is t)
+        self.assertTrue(m._transf_lonlat_to_plot is m._transf_lonlat_to_plot)
+        self.assertTrue(
+            crs_registry.get_geodetic_crs(m.crs_plot)
+            is crs_registry.get_geodetic_crs(m.crs_plot)
+        )
+
+        bounds = crs_registry.get_clip_bounds(3857)
+        self.assertTrue(crs_registry.get_clip_bounds(3857) is bounds)
+        self.assertAlmostEqual(bounds[2], 20037508.34, 1)
+        self.assertIsNone(crs_registry.get_clip_bounds(m.crs_plot))
+
+        # the caches only keep the most recently used values
+        for epsg in range(32601, 32601 + 2 * crs_registry._cache_size):
+            crs_registry.get_transformer(4326, epsg)
+        self.assertEqual(len(crs_registry._transformers), crs_registry._cache_size)
+        self.assertIn((4326, epsg), crs_registry._transformers)
+        self.assertNotIn((4326, 32601), crs_registry._transformers)
+
+        # the data-crs is not cached per Maps-object
+        m.set_data([1, 2], [1, 2], [1, 2], crs=4326)
+        self.assertEqual(m.get_crs("in"), m.get_crs(4326))
+        m.set_data([1, 2], [1, 2], [1, 2], crs=3857)
+        self.assertEqual(m.get_crs("in"), m.get_crs(3857))
+
+        plt.close("all")
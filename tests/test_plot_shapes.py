@@ -5,6 +5,9 @@ import numpy as np
 
 from eomaps import Maps
 import matplotlib.pyplot as plt
+from matplotlib.collections import QuadMesh, PolyCollection
+from matplotlib.image import AxesImage
+from matplotlib.backend_bases import ResizeEvent
 
 # TODO add proper (extensive) tests for each shape!
 
@@ -82,3 +85,695 @@ class TestPlotShapes(unittest.TestCase):
 
             m.show_layer("base", "contours")
             plt.close("all")
+
+    def test_contour_extent_cache(self):
+        x, y = np.meshgrid(np.linspace(-40, 40, 2000), np.linspace(-30, 30, 1600))
+        data = np.sin(np.deg2rad(x) * 5) * np.cos(np.deg2rad(y) * 5)
+
+        m = Maps(4326)
+        m.set_data(data, x, y, crs=4326)
+        m.set_shape.contour(filled=True)
+        m.plot_map()
+        m.f.canvas.draw()
+
+        # the data is aggregated to (approx.) the number of pixels of the axes
+        bbox = m.ax.bbox
+        self.assertTrue(
+            m._data_manager._current_data["z_data"].size <= 2 * bbox.width * bbox.height
+        )
+        levels = m.coll.levels
+
+        # contours are re-evaluated on extent changes
+        coll = m.coll
+        m.BM.profiler.start()
+        m.set_extent((-10, 10, -10, 10), Maps.CRS.PlateCarree())
+        m.f.canvas.draw()
+        self.assertTrue(m.coll is not coll)
+        np.testing.assert_allclose(m.coll.levels, levels)
+        paths = [p.vertices for p in m.coll.contour_set.get_paths()]
+
+        # ... and cached contours are re-used
+        m.set_extent((-20, 20, -20, 20), Maps.CRS.PlateCarree())
+        m.f.canvas.draw()
+        m.set_extent((-10, 10, -10, 10), Maps.CRS.PlateCarree())
+        m.f.canvas.draw()
+        m.BM.profiler.stop()
+
+        self.assertEqual(m.BM.profiler._cache["contour"], [1, 2])
+        for p0, p1 in zip(paths, m.coll.contour_set.get_paths()):
+            np.testing.assert_allclose(p0, p1.vertices)
+
+        # cached contours are cleared if the data changes
+        self.assertEqual(len(m._data_manager._contour_cache), 3)
+        m.set_data(data * 2, x, y, crs=4326)
+        m.plot_map()
+        m.f.canvas.draw()
+        self.assertEqual(len(m._data_manager._contour_cache), 1)
+        np.testing.assert_allclose(m.coll.levels, np.multiply(levels, 2))
+
+        # unclassified contour-levels are derived from the full dataset
+        m2 = Maps(4326)
+        m2.set_data(x + y, x, y, crs=4326)
+        m2.set_shape.contour(filled=False)
+        m2.plot_map(levels=4)
+        m2.f.canvas.draw()
+        levels = m2.coll.levels
+
+        m2.BM.profiler.start()
+        for extent in [(-10, 10, -10, 10), (-20, 20, -20, 20), (-10, 10, -10, 10)]:
+            m2.set_extent(extent, Maps.CRS.PlateCarree())
+            m2.f.canvas.draw()
+            np.testing.assert_allclose(m2.coll.levels, levels)
+        m2.BM.profiler.stop()
+        self.assertEqual(m2.BM.profiler._cache["contour"], [1, 2])
+
+        plt.close("all")
+
+    def test_contiguous_polygon_verts(self):
+        from eomaps.shapes import Shapes
+
+        verts = np.arange(24, dtype=float).reshape(3, 4, 2)
+        invalid = np.array(
+            [
+                [False, False, False, False],
+                [True, False, True, False],
+                [False, True, True, True],
+            ]
+        )
+
+        collapsed = Shapes._get_contiguous_verts(verts, invalid)
+        self.assertEqual(collapsed.shape, verts.shape)
+        # leading invalid vertices use the first valid vertex
+        # subsequent invalid vertices use the previous valid vertex
+        np.testing.assert_equal(collapsed[0], verts[0])
+        np.testing.assert_equal(collapsed[1], verts[1][[1, 1, 1, 3]])
+        np.testing.assert_equal(collapsed[2], verts[2][[0, 0, 0, 0]])
+
+        for shape in ("ellipses", "rectangles", "geod_circles"):
+            m = Maps(Maps.CRS.Mollweide())
+            m.set_data(**self.data_1d)
+            if shape == "geod_circles":
+                m.set_shape.geod_circles(radius=50000, n=10)
+            else:
+                getattr(m.set_shape, shape)(n=10)
+            m.plot_map(ec="k")
+            m.f.canvas.draw()
+
+            paths = m.coll.get_paths()
+            self.assertEqual(len(paths), np.count_nonzero(m._data_mask))
+            self.assertTrue(len({len(p.vertices) for p in paths}) == 1)
+            plt.close("all")
+
+    def test_chunked_polygon_verts(self):
+        radius = np.random.uniform(0.5, 2, 2500)
+
+        for shape, kwargs in (
+            ("ellipses", dict(radius=radius)),
+            ("rectangles", dict()),
+            ("rectangles", dict(mesh=True)),
+            ("geod_circles", dict(radius=radius * 1e5)),
+        ):
+            verts = []
+            for chunk_size, n_workers in ((None, None), (300, None), (300, 1)):
+                m = Maps(Maps.CRS.Mollweide())
+                m.set_shape._chunk_size = chunk_size
+                m.set_shape._n_workers = n_workers
+                m.set_data(**self.data_1d)
+                getattr(m.set_shape, shape)(**kwargs)
+                m.plot_map()
+
+                if kwargs.get("mesh", False):
+                    tri = m.coll._triangulation
+                    verts.append(np.column_stack((tri.x, tri.y)))
+                else:
+                    verts.append(
+                        np.concatenate([p.vertices for p in m.coll.get_paths()])
+                    )
+                plt.close("all")
+
+            # chunked vertices must be identical to the vertices of a single chunk
+            for v in verts[1:]:
+                np.testing.assert_array_equal(v, verts[0])
+
+    def test_level_of_detail(self):
+        x, y = np.meshgrid(np.linspace(-170, 170, 250), np.linspace(-80, 80, 250))
+        data = dict(data=np.random.rand(*x.shape), x=x, y=y, crs=4326)
+
+        for shape, nmin in (("ellipses", 4), ("rectangles", 4), ("geod_circles", 4)):
+            m = Maps(Maps.CRS.Mollweide())
+            m.set_data(**data)
+            if shape == "geod_circles":
+                m.set_shape.geod_circles(radius=50000)
+            else:
+                getattr(m.set_shape, shape)()
+            m.plot_map()
+            m.f.canvas.draw()
+
+            # shapes smaller than a few pixels are drawn with a minimal number
+            # of vertices (+ 1 closing vertex)
+            nverts = len(m.coll.get_paths()[0].vertices)
+            self.assertEqual(nverts, nmin + 1)
+
+            # vertices are refined on zoom
+            m.set_extent((10, 12, 40, 42), Maps.CRS.PlateCarree())
+            m.f.canvas.draw()
+            self.assertGreater(len(m.coll.get_paths()[0].vertices), nverts)
+
+            # explicitly set n is always respected
+            m2 = m.new_layer()
+            m2.set_data(**data)
+            if shape == "geod_circles":
+                m2.set_shape.geod_circles(radius=50000, n=13)
+            else:
+                getattr(m2.set_shape, shape)(n=13)
+            m2.plot_map()
+            m2.show_layer(m2.layer)
+            nverts = len(m2.coll.get_paths()[0].vertices)
+            self.assertEqual(nverts, 13 * (4 if shape == "rectangles" else 1) + 1)
+
+            # the vertex-budget can be disabled
+            m3 = m.new_layer()
+            m3.set_shape._lod_vertex_budget = None
+            m3.set_data(**data)
+            m3.set_extent((-180, 180, -90, 90), Maps.CRS.PlateCarree())
+            if shape == "geod_circles":
+                m3.set_shape.geod_circles(radius=50000)
+            else:
+                getattr(m3.set_shape, shape)()
+            m3.plot_map()
+            m3.show_layer(m3.layer)
+            self.assertGreater(len(m3.coll.get_paths()[0].vertices), nmin + 1)
+
+            plt.close("all")
+
+        # per-point radius-arrays are represented by their median (for x and y)
+        get_sample_radius = m.set_shape._ShapeBase._get_sample_radius
+        self.assertEqual(get_sample_radius((1, 2)), (1, 2))
+        self.assertEqual(
+            get_sample_radius((np.array([1, 2, 5]), np.array([2, 4, 9]))), (2, 4)
+        )
+        self.assertEqual(get_sample_radius(np.array([1, 2, 5])), 2)
+        self.assertEqual(get_sample_radius(np.array([3])), 3)
+
+    def test_auto_lod(self):
+        x, y = np.meshgrid(np.linspace(-170, 170, 400), np.linspace(-80, 80, 200))
+        z = np.sin(np.radians(x)) * np.cos(np.radians(y))
+
+        for gridded, cheap in ((True, "image"), (False, "points")):
+            for shape in ("ellipses", "rectangles", "geod_circles"):
+                m = Maps(Maps.CRS.Mollweide())
+                if gridded:
+                    m.set_data(z, x, y, crs=4326)
+                else:
+                    m.set_data(z.ravel(), x.ravel(), y.ravel(), crs=4326)
+
+                kwargs = dict(image_threshold=5, points_threshold=5)
+                if shape == "geod_circles":
+                    m.set_shape.auto_lod(shape, radius=50000, **kwargs)
+                else:
+                    m.set_shape.auto_lod(shape, **kwargs)
+
+                m.plot_map()
+                m.f.canvas.draw()
+                self.assertEqual(m.shape._representation, cheap)
+                self.assertTrue(m.coll.axes is m.ax)
+
+                # switch to the exact shape if zoomed in
+                m.set_extent((10, 15, 40, 45), Maps.CRS.PlateCarree())
+                m.f.canvas.draw()
+                self.assertEqual(m.shape._representation, shape)
+                self.assertEqual(
+                    len(m.coll.get_paths()), np.count_nonzero(m._data_mask)
+                )
+
+                # check that shapes are properly inherited
+                m2 = m.new_layer(inherit_data=True)
+                self.assertEqual(m2.shape.name, "auto_lod")
+                self.assertEqual(m2.shape._initargs, m.shape._initargs)
+
+                plt.close("all")
+
+        # explicitly set thresholds
+        m = Maps(Maps.CRS.Mollweide())
+        m.set_data(z, x, y, crs=4326)
+        m.set_shape.auto_lod("rectangles", image_threshold=0)
+        m.plot_map()
+        m.f.canvas.draw()
+        self.assertEqual(m.shape._representation, "rectangles")
+        plt.close("all")
+
+        with self.assertRaises(TypeError):
+            m.set_shape.auto_lod("raster")
+
+    def test_raster_image(self):
+        x, y = np.meshgrid(np.linspace(-170, 170, 200), np.linspace(-80, 80, 100))
+        z = np.ma.masked_greater(x + y, 200)
+
+        # regular grid in the plot-crs: use an image
+        m = Maps(4326)
+        m.set_data(z, x, y, crs=4326)
+        m.set_shape.raster()
+        m.set_classify.EqualInterval(k=5)
+        m.plot_map()
+        m.f.canvas.draw()
+        self.assertTrue(isinstance(m.coll, AxesImage))
+        self.assertTrue(m.coll.axes is m.ax)
+        np.testing.assert_allclose(
+            m.coll.get_extent(), (-170.854271, 170.854271, -80.808081, 80.808081)
+        )
+        # classification and masked values are preserved
+        self.assertTrue(m.coll.norm is m._norm)
+        self.assertEqual(np.ma.count_masked(m.coll.get_array()), np.ma.count_masked(z))
+
+        # reprojected raster: use a QuadMesh
+        m2 = m.new_map(ax=212, crs=Maps.CRS.Mollweide())
+        m2.set_data(z, x, y, crs=4326)
+        m2.set_shape.raster()
+        m2.plot_map()
+        m2.f.canvas.draw()
+        self.assertTrue(isinstance(m2.coll, QuadMesh))
+
+        # indices of the visible (sliced) datapoints
+        m2.set_extent((-40, 20, -30, 10), Maps.CRS.PlateCarree())
+        m2.f.canvas.draw()
+        ind = m2._data_manager._get_current_indices()
+        np.testing.assert_array_equal(
+            x.ravel()[ind], m2._data_manager._current_data["xorig"].ravel()
+        )
+        np.testing.assert_array_equal(
+            y.ravel()[ind], m2._data_manager._current_data["yorig"].ravel()
+        )
+
+        # irregular grid: use a QuadMesh
+        m3 = m.new_map(ax=211)
+        m3.set_data(z, x**3, y, crs=4326)
+        m3.set_shape.raster()
+        m3.plot_map()
+        m3.f.canvas.draw()
+        self.assertTrue(isinstance(m3.coll, QuadMesh))
+
+        # collection properties: use a QuadMesh
+        m4 = m.new_layer()
+        m4.set_data(z, x, y, crs=4326)
+        m4.set_shape.raster()
+        m4.plot_map(ec="k")
+        m4.show_layer(m4.layer)
+        self.assertTrue(isinstance(m4.coll, QuadMesh))
+
+        plt.close("all")
+
+    def test_raster_lut(self):
+        x, y = np.meshgrid(np.linspace(-170, 170, 200), np.linspace(-80, 80, 100))
+        z = (x + y).astype("int16")
+        z[:10, :10] = -999
+
+        for dtype in ("int16", "uint8"):
+            with self.subTest(dtype=dtype):
+                zi = np.ma.masked_less(z, 0).astype(dtype) if dtype == "uint8" else z
+
+                m = Maps(4326)
+                m.BM.profiler.start()
+                m.set_data(
+                    zi, x, y, crs=4326, encoding=dict(scale_factor=0.1, _FillValue=-999)
+                )
+                m.set_shape.raster(maxsize=None)
+                m.plot_map(vmin=-100, vmax=200, cmap="viridis")
+                m.f.canvas.draw()
+
+                # integer data is colored with a lookup-table
+                self.assertTrue(isinstance(m.coll, AxesImage))
+                # (the data-values are kept on the image)
+                np.testing.assert_equal(m.coll.get_array(), zi)
+                rgba = m.coll._get_rgba()
+                self.assertEqual(rgba.shape, (*z.shape, 4))
+                self.assertEqual(rgba.dtype, np.uint8)
+
+                expected = m._cbcmap(m._norm(zi), bytes=True)
+                bad = np.ma.getmaskarray(zi) | np.ma.filled(zi == -999, False)
+                np.testing.assert_equal(rgba[~bad], expected[~bad])
+                # masked values and fill-values get the "bad" color
+                np.testing.assert_equal(
+                    rgba[bad], np.tile(m._cbcmap(np.nan, bytes=True), (bad.sum(), 1))
+                )
+
+                # the lookup-table is re-used on re-draws
+                m._data_manager.on_fetch_bg(check_redraw=False)
+                m.f.canvas.draw()
+                hits, misses = m.BM.profiler._cache["lut"]
+                self.assertTrue(hits > 0)
+                self.assertEqual(misses, 1)
+
+                # colors follow changes of the normalization and the colormap
+                m.coll.set_clim(0, 50)
+                m.coll.set_cmap("magma")
+                m.f.canvas.draw()
+                rgba = m.coll._get_rgba()
+                expected = plt.get_cmap("magma")(m.coll.norm(zi), bytes=True)
+                np.testing.assert_equal(rgba[~bad], expected[~bad])
+                self.assertEqual(m.BM.profiler._cache["lut"][1], 2)
+
+                plt.close("all")
+
+    def test_warped_raster(self):
+        from eomaps.shapes import Shapes
+
+        Shapes._WarpedRaster._index_cache.clear()
+
+        x, y = np.linspace(0, 355, 72), np.linspace(-87.5, 87.5, 36)
+        z = np.ma.masked_greater(np.add.outer(x, y), 300)
+
+        for method in ("nearest", "bilinear"):
+            m = Maps(Maps.CRS.Mollweide(), layer=method)
+            m.set_data(z, x, y, crs=4326)
+            m.set_shape.warped_raster(method=method)
+            m.set_classify.EqualInterval(k=5)
+            m.plot_map()
+            m.f.canvas.draw()
+
+            self.assertTrue(isinstance(m.coll, AxesImage))
+            self.assertTrue(m.coll.norm is m._norm)
+            img = m.coll.get_array()
+            # pixels outside the data and masked values are masked
+            self.assertTrue(np.ma.count_masked(img) > 0)
+            self.assertTrue(img.count() > 0)
+            # longitudes > 180 are properly wrapped
+            self.assertTrue(img[:, : img.shape[1] // 3].count() > 0)
+
+            # datasets on the same grid re-use the index-map
+            m.BM.profiler.start()
+            m2 = m.new_layer()
+            m2.set_data(z * 2, x, y, crs=4326)
+            m2.set_shape.warped_raster(method=method)
+            m2.plot_map()
+            m.BM.profiler.stop()
+            self.assertEqual(m.BM.profiler._cache["warp_index"], [1, 0])
+
+            # the index-map is re-evaluated if the extent changes
+            m.set_extent((-20, 20, -20, 20), Maps.CRS.PlateCarree())
+            m.f.canvas.draw()
+            self.assertTrue(isinstance(m.coll, AxesImage))
+            self.assertTrue(m.coll.get_array().count() > 0)
+
+            plt.close("all")
+
+        self.assertEqual(len(Shapes._WarpedRaster._index_cache), 4)
+
+        # the image is re-evaluated if the size of the axes changes
+        m = Maps(Maps.CRS.Mollweide())
+        m.set_data(z, x, y, crs=4326)
+        m.set_shape.warped_raster()
+        m.plot_map()
+        m.f.canvas.draw()
+        shape = m.coll.get_array().shape
+        m.f.set_size_inches(*(m.f.get_size_inches() / 2))
+        ResizeEvent("resize_event", m.f.canvas)._process()
+        m.f.canvas.draw()
+        self.assertNotEqual(m.coll.get_array().shape, shape)
+        self.assertEqual(m.coll.get_array().shape, m.shape._get_grid_shape())
+        plt.close("all")
+
+        # irregular grids are drawn as ordinary raster
+        m = Maps(Maps.CRS.Mollweide())
+        m.set_data(z, x**1.1, y, crs=4326)
+        m.set_shape.warped_raster()
+        m.plot_map()
+        self.assertTrue(isinstance(m.coll, QuadMesh))
+        plt.close("all")
+
+    def test_voronoi_tessellation_cache(self):
+        from eomaps.shapes import _PolyCollection
+
+        np.random.seed(1)
+        x, y = np.random.uniform(-40, 40, 2000), np.random.uniform(-30, 30, 2000)
+        data = dict(data=x + y, x=x, y=y, crs=4326)
+
+        m = Maps(4326)
+        m.set_data(**data)
+        m.set_shape.voronoi_diagram()
+        m.plot_map()
+        m.f.canvas.draw()
+
+        self.assertTrue(isinstance(m.coll, _PolyCollection))
+        tessellation = m.shape._tessellation[2]
+        self.assertEqual(len(tessellation["start"]), x.size)
+
+        # check that the cells are the same as for the tessellation of the subset
+        verts, vmask, datamask = m.shape._get_voronoi_verts_and_mask(
+            x, y, "out", m.shape.mask_radius
+        )
+        self.assertEqual(len(m.coll.get_paths()), len(verts))
+        for p, v in zip(m.coll.get_paths()[:50], verts):
+            np.testing.assert_allclose(
+                np.unique(p.vertices[:-1], axis=0), np.unique(v, axis=0)
+            )
+
+        # the tessellation is re-used (and cells are stable) on extent changes
+        m.BM.profiler.start()
+        m.set_extent((-10, 10, -10, 10))
+        m.f.canvas.draw()
+        m.BM.profiler.stop()
+        self.assertEqual(m.BM.profiler._cache["voronoi"], [1, 0])
+        self.assertTrue(m.shape._tessellation[2] is tessellation)
+
+        ind = m._data_manager._get_current_indices()
+        np.testing.assert_array_equal(x[ind], m._data_manager._current_data["xorig"])
+        paths = m.coll.get_paths()
+        drawn = ind[m._data_mask & np.isfinite(x[ind])]
+        self.assertEqual(len(paths), len(drawn))
+
+        plt.close("all")
+
+        # compute the tessellation in a separate thread
+        m = Maps(4326)
+        m.set_data(**data)
+        m.set_shape.voronoi_diagram(threaded=True)
+        m.plot_map()
+        self.assertFalse(isinstance(m.coll, _PolyCollection))
+
+        m.shape._tessellation_thread[2].join()
+        m.set_extent((-10, 10, -10, 10))
+        m.f.canvas.draw()
+        self.assertTrue(isinstance(m.coll, _PolyCollection))
+        plt.close("all")
+
+    def test_aggregate_points(self):
+        from eomaps.shapes import Shapes
+
+        # check the aggregation
+        x = np.array([0.1, 0.2, 1.2, 1.5, 5])
+        y = np.array([0.1, 0.3, 0.2, 1.5, 5])
+        z = np.array([1.0, 3.0, 4.0, 5.0, 1.0])
+
+        agg = Shapes._AggregatePoints._aggregate
+        for aggregator, expected in (
+            ("count", [2, 1, 0, 1]),
+            ("sum", [4, 4, 0, 5]),
+            ("mean", [2, 4, 0, 5]),
+            ("min", [1, 4, 0, 5]),
+            ("max", [3, 4, 0, 5]),
+        ):
+            a = agg(x, y, z, (0, 2, 0, 2), (2, 2), aggregator)
+            np.testing.assert_allclose(a.filled(0).ravel(), expected)
+            np.testing.assert_equal(a.mask.ravel(), [0, 0, 1, 0])
+
+        np.random.seed(1)
+        x, y = np.random.uniform(-40, 40, 50000), np.random.uniform(-30, 30, 50000)
+
+        for aggregator in ("count", "mean"):
+            m = Maps(4326)
+            m.set_data(x + y, x, y, crs=4326)
+            m.set_shape.aggregate_points(aggregator)
+            m.set_classify.EqualInterval(k=5)
+            m.plot_map()
+            cb = m.add_colorbar()
+            m.f.canvas.draw()
+
+            self.assertTrue(isinstance(m.coll, AxesImage))
+            bbox = m.ax.bbox
+            self.assertEqual(
+                m.coll.get_array().shape,
+                (int(np.ceil(bbox.height)), int(np.ceil(bbox.width))),
+            )
+
+            if aggregator == "count":
+                # counts are normalized with respect to the aggregated values
+                self.assertEqual(m.coll.norm.vmax, m.coll.get_array().max())
+            else:
+                self.assertTrue(m.coll.norm is m.classify_specs._norm)
+
+            # data is re-aggregated on extent changes
+            m.set_extent((-10, 10, -10, 10), Maps.CRS.PlateCarree())
+            m.f.canvas.draw()
+            (x0, x1, y0, y1) = m.coll.get_extent()
+            np.testing.assert_allclose((x0, x1), m.ax.get_xlim())
+            np.testing.assert_allclose((y0, y1), m.ax.get_ylim())
+
+            if aggregator == "count":
+                # the colorbar represents the aggregated values
+                agg = np.ma.compressed(m.coll.get_array())
+                self.assertEqual((cb._vmin, cb._vmax), (agg.min(), agg.max()))
+                self.assertEqual((cb._norm.vmin, cb._norm.vmax), (agg.min(), agg.max()))
+                self.assertEqual(cb._hist[0].sum(), agg.size)
+                self.assertEqual(cb.ax_cb.get_xlim(), (agg.min(), agg.max()))
+
+            plt.close("all")
+
+    def test_hexbin(self):
+        from eomaps.shapes import Shapes
+
+        # points are assigned to the hexagon with the closest center
+        np.random.seed(1)
+        x, y = np.random.uniform(-10, 10, 1000), np.random.uniform(-10, 10, 1000)
+        cx, cy, inverse = Shapes._Hexbin._get_hex_index(x, y, 1)
+        d = np.hypot(x[:, None] - cx, y[:, None] - cy)
+        np.testing.assert_equal(inverse, d.argmin(axis=1))
+        self.assertTrue(np.all(d.min(axis=1) <= 1))
+
+        x, y = np.random.uniform(-40, 40, 50000), np.random.uniform(-30, 30, 50000)
+
+        for kwargs in (
+            dict(aggregator="count"),
+            dict(size=2, size_crs=4326),
+            dict(size=2, size_crs=3857, aggregator="max"),
+        ):
+            m = Maps(4326)
+            m.set_data(x + y, x, y, crs=4326)
+            m.set_shape.hexbin(**kwargs)
+            m.plot_map()
+            m.f.canvas.draw()
+
+            self.assertTrue(isinstance(m.coll, PolyCollection))
+
+            if m.shape._aggregator == "count":
+                self.assertEqual(m.coll.get_array().sum(), x.size)
+
+                # the colorbar represents the aggregated values
+                cb = m.add_colorbar()
+                m.f.canvas.draw()
+                agg = np.ma.compressed(m.coll.get_array())
+                self.assertEqual((cb._vmin, cb._vmax), (agg.min(), agg.max()))
+                self.assertEqual(cb._hist[0].sum(), agg.size)
+
+            # hexagon-indices are cached per resolution level
+            m.BM.profiler.start()
+            m.set_extent((-10, 10, -10, 10), Maps.CRS.PlateCarree())
+            m.f.canvas.draw()
+            m.set_extent((-40, 40, -30, 30), Maps.CRS.PlateCarree())
+            m.f.canvas.draw()
+            m.BM.profiler.stop()
+
+            hits, misses = m.BM.profiler._cache["hexbin"]
+            if kwargs.get("size", None) is None:
+                self.assertEqual(misses, 1)
+            else:
+                self.assertEqual(misses, 0)
+
+            plt.close("all")
+
+    def test_scatter_points_decimation(self):
+        from eomaps.shapes import Shapes
+
+        idx = np.array([0, 1, 0, 2, 1, 0])
+        z = np.array([1.0, 5.0, 3.0, 2.0, 4.0, np.nan])
+
+        rep = Shapes._ScatterPoints._get_representatives
+        np.testing.assert_equal(rep(idx, 4, "first"), [0, 1, 3])
+        np.testing.assert_equal(rep(idx, 4, "last"), [3, 4, 5])
+        np.testing.assert_equal(rep(idx, 4, "max", z), [1, 2, 3])
+        np.testing.assert_equal(rep(idx, 4, "min", z), [0, 3, 4])
+        self.assertEqual(np.unique(idx[rep(idx, 4, "random")]).size, 3)
+
+        np.random.seed(1)
+        x, y = np.random.uniform(-40, 40, 200000), np.random.uniform(-30, 30, 200000)
+
+        m = Maps(4326)
+        m.set_data(x + y, x, y, crs=4326)
+        m.set_shape.scatter_points(size=1, decimate="max")
+        m.cb.pick.attach.annotate()
+        m.plot_map()
+        m.f.canvas.draw()
+
+        # at most one point per pixel is drawn
+        bbox = m.ax.bbox
+        npts = len(m.coll.get_offsets())
+        self.assertTrue(npts <= np.ceil(bbox.width) * np.ceil(bbox.height))
+        self.assertTrue(npts < x.size)
+
+        # picking still considers all datapoints
+        i = m.tree.query((1.0, 2.0))
+        self.assertEqual(i, np.argmin(np.hypot(x - 1, y - 2)))
+
+        # the decimation is re-evaluated on extent changes
+        m.set_extent((-10, 10, -10, 10), Maps.CRS.PlateCarree())
+        m.f.canvas.draw()
+        self.assertTrue(len(m.coll.get_offsets()) > npts / 10)
+
+        plt.close("all")
+
+    def test_delaunay_triangulation_cache(self):
+        np.random.seed(1)
+        x, y = np.random.uniform(-40, 40, 2000), np.random.uniform(-30, 30, 2000)
+        data = dict(data=x + y, x=x, y=y, crs=4326)
+
+        m = Maps(4326)
+        m.set_data(**data)
+        m.set_shape.delaunay_triangulation(flat=True)
+        m.cb.pick.attach.annotate()
+        m.plot_map()
+        m.f.canvas.draw()
+
+        triangulation = m.shape._triangulation[2]
+
+        # check that the triangles are the same as for the legacy triangulation
+        tri, datamask = m.shape._get_delaunay_triangulation(
+            x, y, "out", m.shape.mask_radius, m.shape.mask_radius_crs
+        )
+        self.assertEqual(len(m.coll.get_paths()), len(tri.get_masked_triangles()))
+
+        # the triangulation is re-used on extent changes
+        m.BM.profiler.start()
+        m.set_extent((-10, 10, -10, 10), Maps.CRS.PlateCarree())
+        m.f.canvas.draw()
+        m.BM.profiler.stop()
+        self.assertEqual(m.BM.profiler._cache["delaunay"], [1, 0])
+        self.assertTrue(m.shape._triangulation[2] is triangulation)
+        self.assertTrue(len(m.coll.get_paths()) < len(tri.get_masked_triangles()))
+
+        # picking uses the triangulation
+        i = m.tree.query((1.0, 2.0))
+        self.assertEqual(i, np.argmin(np.hypot(x - 1, y - 2)[triangulation["index"]]))
+
+        # linear interpolation of values at the cursor
+        self.assertAlmostEqual(m.shape.interpolate(1.0, 2.0), 3.0)
+        self.assertTrue(np.isnan(m.shape.interpolate(100.0, 2.0)))
+
+        plt.close("all")
+
+    def test_shade_raster_cache(self):
+        # shuffled 1D data with missing grid-cells
+        df = self.data_pandas["data"]
+
+        m = Maps(4326)
+        m.set_data(df.value, df.lon, df.lat, crs=4326)
+        m.set_shape.shade_raster()
+        m.BM.profiler.start()
+        m.plot_map()
+        m.f.canvas.draw()
+
+        ix, iy, xg, yg = m._shade_grid_cache[2]
+        self.assertEqual(xg.shape, (df.lat.nunique(), df.lon.nunique()))
+        self.assertTrue(np.allclose(xg[iy, ix], df.lon))
+        self.assertTrue(np.allclose(yg[iy, ix], df.lat))
+
+        # aggregates are re-used if the extent is restored
+        extent = m.get_extent()
+        m.set_extent((-10, 10, -10, 10))
+        m.f.canvas.draw()
+        m.set_extent(extent)
+        m.f.canvas.draw()
+        m.BM.profiler.stop()
+
+        self.assertEqual(m.BM.profiler._cache["shade_grid"], [0, 1])
+        self.assertEqual(m.BM.profiler._cache["shade"][0], 1)
+
+        plt.close("all")